@@ -30,10 +30,14 @@ from config.settings import (
     WRITE_LEGACY_CSV,
     WRITE_LATEST_CSV,
     WRITE_HISTORY_CSV,
+    WRITE_HISTORY_PARQUET,
+    HISTORY_PARQUET_COMPRESSION,
     get_latest_output_path,
     get_history_output_path,
 )
 from exceptions import ETLExtractionError, ETLValidationError
+from history_store import parquet_available, write_parquet
+from http_client import get_http_client
 from validador import validar_dataframe
 
 
@@ -60,6 +64,7 @@ class BaseETL(ABC):
             "non_critical_failures": 0,
             "critical_failures": 0,
         }
+        self._http_clients = []
 
     def configurar_logging(self):
         """Configura logging en consola y archivo diario."""
@@ -126,10 +131,59 @@ class BaseETL(ABC):
             rutas_escritas.add(ruta)
             self._run_summary["files_written"].append(str(ruta))
             self.logger.info("[WRITE] archivo=%s destino=%s filas=%d", ruta, salida, len(df))
+            if salida == "history" and WRITE_HISTORY_PARQUET:
+                self._guardar_parquet_history(df, nombre_archivo, ruta)
 
         filas = len(df)
         self._run_summary["rows_written"] += filas
 
+    def _guardar_parquet_history(self, df, nombre_archivo, ruta_csv):
+        """Escribe la copia Parquet tipada de un snapshot historico.
+
+        El CSV ya escrito sigue siendo la fuente de verdad, asi que un fallo
+        aqui solo se registra como warning.
+        """
+        if not parquet_available():
+            self.logger.warning(
+                "DATA_WRITE_HISTORY_PARQUET=1 pero pyarrow no esta instalado; se omite Parquet"
+            )
+            return
+        try:
+            ruta = write_parquet(df, nombre_archivo, ruta_csv, compression=HISTORY_PARQUET_COMPRESSION)
+        except Exception as exc:  # pylint: disable=broad-exception-caught
+            self.logger.warning("No se pudo escribir Parquet para '%s': %s", nombre_archivo, exc)
+            return
+        self._run_summary["files_written"].append(str(ruta))
+        self.logger.info("[WRITE] archivo=%s destino=history_parquet filas=%d", ruta, len(df))
+
+    def _get_http_client(self, source, default_headers=None, **kwargs):
+        """Obtiene el cliente HTTP compartido de una fuente y lo registra para el resumen."""
+        client = get_http_client(source, default_headers, **kwargs)
+        if client not in self._http_clients:
+            self._http_clients.append(client)
+        return client
+
+    def _http_cache_stats(self):
+        """Suma los contadores de cache HTTP de los clientes usados por el ETL."""
+        totals = {"hits": 0, "misses": 0, "not_modified": 0}
+        caches = {
+            id(client.cache): client.cache
+            for client in self._http_clients
+            if getattr(client, "cache", None) is not None
+        }
+        for cache in caches.values():
+            for key in totals:
+                totals[key] += int(cache.stats.get(key, 0))
+        return totals
+
+    def _summary_extra_fields(self):
+        """Campos adicionales del resumen de ejecucion propios de cada fuente.
+
+        Returns:
+            list: Lista de tuplas (nombre_campo, valor) insertadas antes de duracion_s.
+        """
+        return []
+
     @abstractmethod
     def definir_pasos(self):
         """Define pasos ETL a ejecutar.
@@ -240,10 +294,17 @@ class BaseETL(ABC):
         total_duration = perf_counter() - run_start
         total_steps = len(self._run_summary["steps"])
         successful_steps = sum(1 for s in self._run_summary["steps"] if s["status"] == "success")
+        cache_stats = self._http_cache_stats()
+
+        extra_fields = "".join(
+            f"{name}={'na' if value is None else value} "
+            for name, value in self._summary_extra_fields()
+        )
 
         self.logger.info(
             "[RUN][SUMMARY] fuente=%s estado=%s pasos_total=%d pasos_ok=%d "
-            "fallos_no_criticos=%d fallos_criticos=%d archivos_escritos=%d filas_escritas=%d duracion_s=%.3f",
+            "fallos_no_criticos=%d fallos_criticos=%d archivos_escritos=%d filas_escritas=%d "
+            "cache_hits=%d cache_misses=%d cache_304=%d %sduracion_s=%.3f",
             self.nombre,
             final_status,
             total_steps,
@@ -252,5 +313,9 @@ class BaseETL(ABC):
             self._run_summary["critical_failures"],
             len(self._run_summary["files_written"]),
             self._run_summary["rows_written"],
+            cache_stats["hits"],
+            cache_stats["misses"],
+            cache_stats["not_modified"],
+            extra_fields,
             total_duration,
         )
@@ -0,0 +1,112 @@
+"""Partition-level checkpoints for long-running ETL extractions.
+
+The GitHub search crawl records, per partition, which pages were fetched
+and the repos they produced. The state is rewritten atomically after every
+page, so a run killed by a network error or the consecutive-failure stop
+can be resumed without refetching finished partitions.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import threading
+from datetime import datetime, timezone
+from pathlib import Path
+
+
+def queries_signature(queries):
+    """Returns a stable fingerprint of a partition plan."""
+    payload = json.dumps(
+        [[query["q"], int(query["pages"])] for query in queries],
+        sort_keys=True,
+    )
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+class ExtractionCheckpoint:
+    """Thread-safe JSON checkpoint of a partitioned crawl.
+
+    Args:
+        path: JSON file where the state is persisted.
+        queries: Partition plan being crawled; stored so a resumed run can
+            reuse it instead of rebuilding (and re-probing) the plan.
+        state: Previously persisted state to continue from.
+        metadata: Extra top-level fields persisted with the state (e.g. the
+            extraction window used to validate a resume).
+    """
+
+    def __init__(self, path, queries, state=None, metadata=None):
+        self.path = Path(path)
+        self.queries = list(queries)
+        self.metadata = dict(metadata or {})
+        self.signature = queries_signature(self.queries)
+        self._lock = threading.Lock()
+        self._partitions = {}
+        if state and state.get("signature") == self.signature:
+            self._partitions = state.get("partitions", {})
+
+    @staticmethod
+    def load(path):
+        """Returns the persisted state at ``path`` or None if missing/corrupt."""
+        try:
+            return json.loads(Path(path).read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            return None
+
+    def _partition(self, label):
+        return self._partitions.setdefault(
+            label, {"pages_done": [], "complete": False, "repos": []}
+        )
+
+    def is_complete(self, label):
+        with self._lock:
+            return bool(self._partitions.get(label, {}).get("complete"))
+
+    def pages_done(self, label):
+        with self._lock:
+            return set(self._partitions.get(label, {}).get("pages_done", []))
+
+    def repos(self, label):
+        with self._lock:
+            return list(self._partitions.get(label, {}).get("repos", []))
+
+    def record_page(self, label, page, repos):
+        """Stores the repos of a fetched page and persists the state."""
+        with self._lock:
+            partition = self._partition(label)
+            if page not in partition["pages_done"]:
+                partition["pages_done"].append(page)
+                partition["repos"].extend(repos)
+            self._save()
+
+    def mark_complete(self, label):
+        with self._lock:
+            self._partition(label)["complete"] = True
+            self._save()
+
+    def completed_count(self):
+        with self._lock:
+            return sum(1 for partition in self._partitions.values() if partition.get("complete"))
+
+    def _save(self):
+        payload = {
+            **self.metadata,
+            "signature": self.signature,
+            "updated_at_utc": datetime.now(timezone.utc).replace(microsecond=0).isoformat(),
+            "queries": self.queries,
+            "partitions": self._partitions,
+        }
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = self.path.with_suffix(".tmp")
+        tmp_path.write_text(json.dumps(payload), encoding="utf-8")
+        os.replace(tmp_path, self.path)
+
+    def clear(self):
+        """Deletes the persisted checkpoint once the crawl has finished."""
+        with self._lock:
+            try:
+                self.path.unlink()
+            except OSError:
+                pass
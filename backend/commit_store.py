@@ -0,0 +1,129 @@
+"""Persistent per-repo commit history for incremental framework activity.
+
+For every repository the store keeps daily commit buckets, the
+contributors seen per day and the newest commit already merged (date plus
+the SHAs sharing that timestamp, since the GitHub ``since`` filter is
+inclusive). Each run only pages commits newer than that checkpoint, and
+days that fall out of the analysis window are pruned, so totals start
+exactly at FECHA_INICIO like the ``since`` filter of the paging mode.
+"""
+
+from __future__ import annotations
+
+import json
+import os
+import threading
+from pathlib import Path
+
+
+class CommitHistoryStore:
+    """JSON-backed commit buckets keyed by repository path.
+
+    Args:
+        path: JSON file holding the store.
+    """
+
+    def __init__(self, path):
+        self.path = Path(path)
+        self._lock = threading.Lock()
+        self._data = self._load()
+
+    def _load(self):
+        try:
+            data = json.loads(self.path.read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            data = {}
+        data.setdefault("repos", {})
+        data.setdefault("runs", {})
+        return data
+
+    def checkpoint(self, repo_path):
+        """Returns ``(last_commit_date, boundary_shas)`` or ``(None, set())``."""
+        with self._lock:
+            entry = self._data["repos"].get(repo_path)
+            if not entry or not entry.get("last_commit_date"):
+                return None, set()
+            return entry["last_commit_date"], set(entry.get("boundary_shas", []))
+
+    def merge(self, repo_path, commits):
+        """Adds new commits (dicts with ``sha``, ``date``, ``day``, ``contributor``).
+
+        Commits already covered by the checkpoint boundary are ignored.
+        """
+        with self._lock:
+            entry = self._data["repos"].setdefault(
+                repo_path,
+                {"daily": {}, "contributors": {}, "last_commit_date": None, "boundary_shas": []},
+            )
+            already_merged = set(entry.get("boundary_shas", []))
+            boundary = set(already_merged)
+            last_date = entry.get("last_commit_date")
+
+            for commit in commits:
+                if commit["sha"] in already_merged:
+                    continue
+                day = commit.get("day")
+                if day:
+                    entry["daily"][day] = entry["daily"].get(day, 0) + 1
+                    if commit.get("contributor"):
+                        day_contributors = set(entry["contributors"].get(day, []))
+                        day_contributors.add(commit["contributor"])
+                        entry["contributors"][day] = sorted(day_contributors)
+
+                commit_date = commit.get("date")
+                if not commit_date:
+                    continue
+                if last_date is None or commit_date > last_date:
+                    last_date = commit_date
+                    boundary = {commit["sha"]}
+                elif commit_date == last_date:
+                    boundary.add(commit["sha"])
+
+            entry["last_commit_date"] = last_date
+            entry["boundary_shas"] = sorted(boundary)
+
+    def prune(self, first_day):
+        """Drops daily buckets older than ``first_day`` ('YYYY-MM-DD')."""
+        with self._lock:
+            for entry in self._data["repos"].values():
+                for section in ("daily", "contributors"):
+                    entry[section] = {
+                        day: value
+                        for day, value in entry.get(section, {}).items()
+                        if day >= first_day
+                    }
+
+    def totals(self, repo_path, first_day, last_day):
+        """Returns ``(commits, monthly_counts, active_contributors)`` for a day range."""
+        with self._lock:
+            entry = self._data["repos"].get(repo_path) or {}
+            monthly = {}
+            for day, count in entry.get("daily", {}).items():
+                if first_day <= day <= last_day:
+                    monthly[day[:7]] = monthly.get(day[:7], 0) + int(count)
+            contributors = set()
+            for day, values in entry.get("contributors", {}).items():
+                if first_day <= day <= last_day:
+                    contributors.update(values)
+            return sum(monthly.values()), monthly, len(contributors)
+
+    def previous_commits(self):
+        """Returns ``({framework: commits_2025}, run_date)`` from the last recorded run."""
+        with self._lock:
+            runs = self._data["runs"]
+            if not runs.get("commits"):
+                return {}, None
+            return dict(runs["commits"]), runs.get("date")
+
+    def record_run(self, commits_by_framework, run_date):
+        """Remembers this run's ``commits_2025`` per framework for the next delta."""
+        with self._lock:
+            self._data["runs"] = {"date": run_date, "commits": dict(commits_by_framework)}
+
+    def save(self):
+        """Atomically persists the store."""
+        with self._lock:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path = self.path.with_suffix(".tmp")
+            tmp_path.write_text(json.dumps(self._data, sort_keys=True), encoding="utf-8")
+            os.replace(tmp_path, self.path)
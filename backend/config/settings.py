@@ -44,6 +44,17 @@ def _parse_positive_int_env(name: str, default: int) -> int:
     except ValueError:
         return default
 
+
+def _parse_positive_float_env(name: str, default: float) -> float:
+    raw_value = os.getenv(name)
+    if raw_value is None or not raw_value.strip():
+        return default
+    try:
+        value = float(raw_value)
+    except ValueError:
+        return default
+    return value if value > 0 else default
+
 # API de GitHub
 GITHUB_TOKEN = os.getenv("GITHUB_TOKEN")
 GITHUB_API_BASE = "https://api.github.com"
@@ -62,6 +73,43 @@ GITHUB_FALLBACK_CLASSIFIABLE_REPOS = _parse_positive_int_env(
     1500,
 )
 PER_PAGE = 100
+# Concurrencia acotada para consultas GitHub independientes (p.ej. contributors)
+GITHUB_MAX_CONCURRENCY = _parse_positive_int_env("GITHUB_MAX_CONCURRENCY", 8)
+GITHUB_CORRELATION_MAX_REPOS = _parse_positive_int_env("GITHUB_CORRELATION_MAX_REPOS", 100)
+# Particiones de busqueda en paralelo; el bucket search (30 req/min) sigue limitando
+GITHUB_SEARCH_MAX_CONCURRENCY = _parse_positive_int_env("GITHUB_SEARCH_MAX_CONCURRENCY", 4)
+# Frameworks analizados en paralelo; cada uno lanza hasta 5 sub-consultas (pool HTTP de 16)
+GITHUB_FRAMEWORK_MAX_CONCURRENCY = _parse_positive_int_env("GITHUB_FRAMEWORK_MAX_CONCURRENCY", 3)
+# Sub-consultas simultaneas por framework; el total en vuelo es el producto de ambos limites
+GITHUB_FRAMEWORK_TASK_CONCURRENCY = _parse_positive_int_env("GITHUB_FRAMEWORK_TASK_CONCURRENCY", 2)
+# Particionado de la busqueda: monthly (calendario) | adaptive (por densidad de resultados)
+GITHUB_SEARCH_PARTITION_MODE = os.getenv("GITHUB_SEARCH_PARTITION_MODE", "monthly").strip().lower()
+# Techo de resultados que la Search API devuelve por query
+GITHUB_SEARCH_RESULT_CAP = 1000
+# Extraccion incremental: re-crawl de los meses recientes y refresco por muestra del resto
+GITHUB_INCREMENTAL_MODE = os.getenv("GITHUB_INCREMENTAL_MODE", "0") == "1"
+GITHUB_INCREMENTAL_RECENT_MONTHS = _parse_positive_int_env("GITHUB_INCREMENTAL_RECENT_MONTHS", 2)
+GITHUB_INCREMENTAL_SAMPLE_SIZE = _parse_positive_int_env("GITHUB_INCREMENTAL_SAMPLE_SIZE", 50)
+# Deriva mediana de stars tolerada en la muestra antes de forzar un crawl completo
+GITHUB_INCREMENTAL_TOLERANCE = _parse_positive_float_env("GITHUB_INCREMENTAL_TOLERANCE", 0.10)
+# Checkpoint por pagina de la extraccion de repos (github_etl.py --resume)
+GITHUB_CHECKPOINT_PATH = DATOS_METADATA_DIR / "github_repos_checkpoint.json"
+# Backend para metricas por repo: rest | graphql (lotes con aliases, requiere GITHUB_TOKEN)
+GITHUB_API_BACKEND = os.getenv("GITHUB_API_BACKEND", "rest").strip().lower()
+GITHUB_GRAPHQL_URL = f"{GITHUB_API_BASE}/graphql"
+GITHUB_GRAPHQL_BATCH_SIZE = _parse_positive_int_env("GITHUB_GRAPHQL_BATCH_SIZE", 25)
+# Commits de frameworks: stats (/stats/commit_activity + /stats/contributors) | paging (/commits)
+# | store (historial incremental por repo en datos/metadata)
+GITHUB_COMMITS_MODE = os.getenv("GITHUB_COMMITS_MODE", "stats").strip().lower()
+GITHUB_COMMIT_STORE_PATH = DATOS_METADATA_DIR / "github_commit_store.json"
+GITHUB_STATS_MAX_RETRIES = _parse_positive_int_env("GITHUB_STATS_MAX_RETRIES", 5)
+GITHUB_STATS_RETRY_SECONDS = 2.0
+# /stats/contributors solo devuelve los 100 autores principales
+GITHUB_STATS_CONTRIBUTORS_CAP = 100
+# Paginas de /commits para completar contributors cuando la lista de stats esta llena
+GITHUB_STATS_CONTRIBUTORS_MAX_PAGES = _parse_positive_int_env("GITHUB_STATS_CONTRIBUTORS_MAX_PAGES", 10)
+# Deteccion de repos IA por keywords: substring (historico) | word (limites de palabra)
+GITHUB_AI_KEYWORD_MATCH = os.getenv("GITHUB_AI_KEYWORD_MATCH", "substring").strip().lower()
 
 FRAMEWORK_REPOS = {
     "React": "react/react",
@@ -74,6 +122,12 @@ FRAMEWORK_REPOS = {
 # API de StackOverflow
 SO_API_KEY = os.getenv("STACKOVERFLOW_KEY")
 SO_API_URL = "https://api.stackexchange.com/2.3/search/advanced"
+SO_FILTER_CREATE_URL = "https://api.stackexchange.com/2.3/filters/create"
+# Cubo de conteos (tag, mes, aceptadas); un bucket se cierra N dias despues de su fin
+SO_COUNT_CUBE_PATH = DATOS_METADATA_DIR / "so_count_cube.json"
+SO_COUNT_CUBE_SETTLE_DAYS = _parse_positive_int_env("SO_COUNT_CUBE_SETTLE_DAYS", 7)
+# Consultas de conteo en paralelo; el scheduler mantiene el limite de 30 req/s por IP
+SO_MAX_CONCURRENCY = _parse_positive_int_env("SO_MAX_CONCURRENCY", 8)
 
 
 SO_TOP_LANGUAGES = _parse_csv_list(
@@ -88,6 +142,19 @@ REDDIT_CLIENT_ID = os.getenv("REDDIT_CLIENT_ID")
 REDDIT_CLIENT_SECRET = os.getenv("REDDIT_CLIENT_SECRET")
 REDDIT_SUBREDDIT = os.getenv("REDDIT_SUBREDDIT", "webdev")
 REDDIT_LIMIT = _parse_positive_int_env("REDDIT_LIMIT", 500)
+# Subreddits de REDDIT_SUBREDDIT_LIST descargados en paralelo (600 req/10 min con OAuth)
+REDDIT_MAX_CONCURRENCY = _parse_positive_int_env("REDDIT_MAX_CONCURRENCY", 4)
+# Post store SQLite incremental (1 = habilitado); el analisis usa los ultimos N dias
+REDDIT_POST_STORE_ENABLED = os.getenv("REDDIT_POST_STORE_ENABLED", "0") == "1"
+REDDIT_POST_STORE_PATH = DATOS_METADATA_DIR / "reddit_posts.sqlite"
+REDDIT_ANALYSIS_WINDOW_DAYS = _parse_positive_int_env("REDDIT_ANALYSIS_WINDOW_DAYS", 30)
+# Cache de puntuaciones VADER por hash de texto (se invalida al cambiar el lexicon)
+REDDIT_SENTIMENT_CACHE_PATH = DATOS_METADATA_DIR / "reddit_sentiment_cache.json"
+# Procesos para puntuar sentimiento de posts no cacheados (1 = serial)
+REDDIT_SENTIMENT_WORKERS = _parse_positive_int_env("REDDIT_SENTIMENT_WORKERS", 1)
+# Tamano de los rankings cruzados en la interseccion GitHub-Reddit
+INTERSECCION_TOP_GITHUB = _parse_positive_int_env("INTERSECCION_TOP_GITHUB", 5)
+INTERSECCION_TOP_REDDIT = _parse_positive_int_env("INTERSECCION_TOP_REDDIT", 10)
 REDDIT_USER_AGENT = (
     "TechTrendsETL/1.0 "
     "(github.com/Sam-24-dev/Technology-trend-analysis-platform)"
@@ -117,9 +184,15 @@ ARCHIVOS_SALIDA = {
 # - LEGACY: mantiene el comportamiento histórico actual
 # - LATEST: publica CSVs en datos/latest para consumo de sync
 # - HISTORY: guarda snapshots particionados por fecha (CSV por ahora)
+# - HISTORY_PARQUET: copia Parquet tipada junto a cada CSV historico (requiere pyarrow)
 WRITE_LEGACY_CSV = os.getenv("DATA_WRITE_LEGACY_CSV", "1") == "1"
 WRITE_LATEST_CSV = os.getenv("DATA_WRITE_LATEST_CSV", "0") == "1"
 WRITE_HISTORY_CSV = os.getenv("DATA_WRITE_HISTORY_CSV", "0") == "1"
+WRITE_HISTORY_PARQUET = os.getenv("DATA_WRITE_HISTORY_PARQUET", "0") == "1"
+# Compresion Parquet: zstd | snappy
+HISTORY_PARQUET_COMPRESSION = os.getenv("DATA_HISTORY_PARQUET_COMPRESSION", "zstd").strip().lower()
+if HISTORY_PARQUET_COMPRESSION not in {"zstd", "snappy"}:
+    HISTORY_PARQUET_COMPRESSION = "zstd"
 HISTORY_PARTITION_MODE = os.getenv("DATA_HISTORY_PARTITION_MODE", "day").strip().lower()
 
 
@@ -157,9 +230,15 @@ LOG_DATE_FORMAT = "%Y-%m-%d %H:%M:%S"
 REQUEST_TIMEOUT_SECONDS = 10
 HTTP_MAX_RETRIES = 3
 HTTP_RETRY_BACKOFF_SECONDS = 2
-REQUEST_PAGE_DELAY_SECONDS = 2.0
-REQUEST_MEDIUM_DELAY_SECONDS = 0.5
-REQUEST_SHORT_DELAY_SECONDS = 0.3
+# Espera maxima del scheduler de rate limit antes de dejar pasar la request
+RATE_LIMIT_MAX_WAIT_SECONDS = _parse_positive_int_env("RATE_LIMIT_MAX_WAIT_SECONDS", 300)
+# Pool keep-alive por fuente: hosts distintos y conexiones por host
+HTTP_POOL_CONNECTIONS = _parse_positive_int_env("HTTP_POOL_CONNECTIONS", 4)
+HTTP_POOL_MAXSIZE = _parse_positive_int_env("HTTP_POOL_MAXSIZE", 16)
+# Cache HTTP condicional (ETag/Last-Modified) persistido en datos/metadata
+HTTP_CACHE_ENABLED = os.getenv("HTTP_CACHE_ENABLED", "1") == "1"
+HTTP_CACHE_DIR = DATOS_METADATA_DIR / "http_cache"
+HTTP_CACHE_MAX_BYTES = _parse_positive_int_env("HTTP_CACHE_MAX_MB", 256) * 1024 * 1024
 
 # Rango dinámico de fechas (últimos 12 meses)
 # Permite fijar fecha de referencia en UTC vía env:
@@ -4,13 +4,19 @@ from __future__ import annotations
 
 import json
 import logging
-import re
 from datetime import datetime, timezone
 from pathlib import Path
 
 import pandas as pd
 
-from tech_normalization import normalize_technology_name
+from history_store import read_snapshot
+from tech_normalization import (
+    normalize_series,
+    normalize_so_tag,
+    normalize_technology_name,
+    so_trend_display_name,
+    technology_slug,
+)
 
 
 logger = logging.getLogger("export_history_json")
@@ -43,13 +49,6 @@ TREND_SOURCE_COLUMNS = (
     ("reddit_score", "RD", "reddit", "Reddit"),
 )
 
-SPECIAL_TECH_SLUGS = {
-    "ai/ml": "ai-ml",
-    "c#": "c-sharp",
-    "c++": "c-plus-plus",
-}
-
-
 def _utc_now_iso():
     return datetime.now(timezone.utc).replace(microsecond=0).isoformat().replace("+00:00", "Z")
 
@@ -124,25 +123,6 @@ def _safe_percent(value):
     return round(number, 2)
 
 
-def _normalize_trend_technology_name(name):
-    text = str(name or "").strip()
-    lowered = text.lower()
-    if lowered in {"ai/ml", "ia/machine learning"}:
-        return "AI/ML"
-    return normalize_technology_name(text)
-
-
-def _technology_slug(name):
-    display_name = _normalize_trend_technology_name(name)
-    lowered = display_name.strip().lower()
-    if not lowered:
-        return ""
-    if lowered in SPECIAL_TECH_SLUGS:
-        return SPECIAL_TECH_SLUGS[lowered]
-    slug = re.sub(r"[^a-z0-9]+", "-", lowered).strip("-")
-    return slug
-
-
 def _trend_available_source_codes(row):
     codes = []
     for column, code, _, _ in TREND_SOURCE_COLUMNS:
@@ -178,8 +158,8 @@ def _prepare_trend_snapshot_df(df):
     else:
         working["fuentes"] = pd.to_numeric(working["fuentes"], errors="coerce").fillna(0).astype(int)
 
-    working["tecnologia"] = working["tecnologia"].apply(_normalize_trend_technology_name)
-    working["slug"] = working["tecnologia"].apply(_technology_slug)
+    working["tecnologia"] = normalize_series(working["tecnologia"])
+    working["slug"] = normalize_series(working["tecnologia"], technology_slug)
 
     if "ranking" not in working.columns:
         working = working.sort_values("trend_score", ascending=False).reset_index(drop=True)
@@ -336,7 +316,7 @@ def _extract_partition_date(parts):
 
 def _count_rows(csv_path):
     try:
-        return len(pd.read_csv(csv_path))
+        return len(read_snapshot(csv_path))
     except Exception:  # pylint: disable=broad-exception-caught
         return None
 
@@ -571,7 +551,7 @@ def _collect_trend_snapshot_data(project_root, history_index):
     for source in sources:
         csv_path = project_root / source["path"]
         try:
-            df = pd.read_csv(csv_path)
+            df = read_snapshot(csv_path)
         except Exception as exc:  # pylint: disable=broad-exception-caught
             logger.warning("Skipping trend snapshot %s due to read error: %s", csv_path, exc)
             continue
@@ -599,7 +579,7 @@ def _collect_trend_snapshot_data(project_root, history_index):
             latest_csv_path = project_root / latest_path
             if latest_csv_path.exists():
                 try:
-                    latest_df = pd.read_csv(latest_csv_path)
+                    latest_df = read_snapshot(latest_csv_path)
                     if _is_valid_trend_snapshot_df(latest_df):
                         prepared_df = _prepare_trend_snapshot_df(latest_df)
                         mtime = datetime.fromtimestamp(latest_csv_path.stat().st_mtime, tz=timezone.utc)
@@ -758,7 +738,7 @@ def build_reddit_sentiment_public(project_root):
         return payload
 
     try:
-        dataframe = pd.read_csv(csv_path)
+        dataframe = read_snapshot(csv_path)
     except Exception as exc:  # pylint: disable=broad-exception-caught
         logger.warning("Skipping reddit sentiment public payload due to read error: %s", exc)
         return payload
@@ -917,7 +897,7 @@ def build_github_languages_public(project_root):
         return payload
 
     try:
-        dataframe = pd.read_csv(csv_path)
+        dataframe = read_snapshot(csv_path)
     except Exception as exc:  # pylint: disable=broad-exception-caught
         logger.warning("Skipping github languages public payload due to read error: %s", exc)
         return payload
@@ -1033,51 +1013,6 @@ def _is_valid_so_trends_df(df):
     return len(technology_columns) > 0
 
 
-def _normalize_so_volume_language_label(value):
-    raw = str(value or "").strip()
-    if not raw:
-        return ""
-    normalized = raw.lower()
-    alias_map = {
-        "csharp": "c#",
-        "cpp": "c++",
-    }
-    return alias_map.get(normalized, normalized)
-
-
-def _normalize_so_trend_technology_label(value):
-    raw = str(value or "").strip()
-    if not raw:
-        return ""
-    normalized = raw.lower()
-    alias_map = {
-        "python": "Python",
-        "javascript": "JavaScript",
-        "typescript": "TypeScript",
-        "reactjs": "ReactJS",
-        "react.js": "ReactJS",
-        "nextjs": "Next.js",
-        "next.js": "Next.js",
-        "vuejs": "Vue.js",
-        "vue.js": "Vue.js",
-        "nodejs": "Node.js",
-        "node.js": "Node.js",
-        "csharp": "C#",
-        "c#": "C#",
-        "cpp": "C++",
-        "c++": "C++",
-        "php": "PHP",
-        "go": "Go",
-        "ruby": "Ruby",
-        "java": "Java",
-    }
-    if normalized in alias_map:
-        return alias_map[normalized]
-    if raw != normalized:
-        return raw
-    return raw.title()
-
-
 def _normalize_so_volume_df(df):
     working = df.copy()
     if "lenguaje" not in working.columns:
@@ -1085,7 +1020,7 @@ def _normalize_so_volume_df(df):
     if "preguntas_nuevas_2025" not in working.columns:
         working["preguntas_nuevas_2025"] = 0
 
-    working["lenguaje"] = working["lenguaje"].map(_normalize_so_volume_language_label)
+    working["lenguaje"] = normalize_series(working["lenguaje"], normalize_so_tag)
     working["preguntas_nuevas_2025"] = (
         pd.to_numeric(working["preguntas_nuevas_2025"], errors="coerce")
         .fillna(0)
@@ -1249,7 +1184,7 @@ def build_so_volume_history(project_root, history_index):
     for source in sources:
         csv_path = project_root / source["path"]
         try:
-            df = pd.read_csv(csv_path)
+            df = read_snapshot(csv_path)
         except Exception as exc:  # pylint: disable=broad-exception-caught
             logger.warning("Skipping StackOverflow volume snapshot %s due to read error: %s", csv_path, exc)
             continue
@@ -1691,7 +1626,7 @@ def _load_so_trends_metadata(project_root):
     for item in raw_series:
         if not isinstance(item, dict):
             continue
-        tecnologia = _normalize_so_trend_technology_label(item.get("tecnologia"))
+        tecnologia = so_trend_display_name(item.get("tecnologia"))
         points = item.get("points")
         if not tecnologia or not isinstance(points, list) or len(points) != len(months):
             continue
@@ -1798,7 +1733,7 @@ def _build_so_trends_history_payload(df):
         series.append(
             _compute_so_trends_series(
                 months,
-                _normalize_so_trend_technology_label(column),
+                so_trend_display_name(column),
                 points,
             )
         )
@@ -1820,7 +1755,7 @@ def build_so_trends_history(project_root, history_index):
         latest_source = sources[-1]
         csv_path = project_root / latest_source["path"]
         try:
-            df = pd.read_csv(csv_path)
+            df = read_snapshot(csv_path)
             if _is_valid_so_trends_df(df):
                 latest_df = df
                 history_count = sum(1 for item in sources if item["source_type"] == "history")
@@ -2223,7 +2158,7 @@ def build_so_acceptance_history(project_root, history_index):
     for source in sources:
         csv_path = project_root / source["path"]
         try:
-            df = pd.read_csv(csv_path)
+            df = read_snapshot(csv_path)
         except Exception as exc:  # pylint: disable=broad-exception-caught
             logger.warning(
                 "Skipping StackOverflow acceptance snapshot %s due to read error: %s",
@@ -2718,7 +2653,7 @@ def _build_github_frameworks_monthly_series(project_root, history_index):
     latest_source = sources[-1]
     csv_path = project_root / latest_source["path"]
     try:
-        df = pd.read_csv(csv_path)
+        df = read_snapshot(csv_path)
     except Exception as exc:  # pylint: disable=broad-exception-caught
         logger.warning("Skipping github monthly snapshot %s due to read error: %s", csv_path, exc)
         return []
@@ -2761,7 +2696,7 @@ def build_github_frameworks_history(project_root, history_index):
     for source in sources:
         csv_path = project_root / source["path"]
         try:
-            df = pd.read_csv(csv_path)
+            df = read_snapshot(csv_path)
         except Exception as exc:  # pylint: disable=broad-exception-caught
             logger.warning("Skipping github frameworks snapshot %s due to read error: %s", csv_path, exc)
             continue
@@ -2826,7 +2761,7 @@ def build_github_correlation_history(project_root, history_index):
     for source in sources:
         csv_path = project_root / source["path"]
         try:
-            df = pd.read_csv(csv_path)
+            df = read_snapshot(csv_path)
         except Exception as exc:  # pylint: disable=broad-exception-caught
             logger.warning("Skipping github correlation snapshot %s due to read error: %s", csv_path, exc)
             continue
@@ -3076,7 +3011,7 @@ def build_reddit_topics_history(project_root, history_index):
     for source in sources:
         csv_path = project_root / source["path"]
         try:
-            df = pd.read_csv(csv_path)
+            df = read_snapshot(csv_path)
         except Exception as exc:  # pylint: disable=broad-exception-caught
             logger.warning("Skipping reddit topics snapshot %s due to read error: %s", csv_path, exc)
             continue
@@ -3388,7 +3323,7 @@ def build_reddit_intersection_history(project_root, history_index):
     for source in sources:
         csv_path = project_root / source["path"]
         try:
-            df = pd.read_csv(csv_path)
+            df = read_snapshot(csv_path)
         except Exception as exc:  # pylint: disable=broad-exception-caught
             logger.warning("Skipping reddit intersection snapshot %s due to read error: %s", csv_path, exc)
             continue
@@ -3591,9 +3526,9 @@ def _build_compact_frontend_payload(
                 normalized_item["points"] = kept_points
                 tech_name = normalized_item.get("tecnologia")
                 if isinstance(tech_name, str) and tech_name.strip():
-                    normalized_name = _normalize_trend_technology_name(tech_name)
+                    normalized_name = normalize_technology_name(tech_name)
                     normalized_item["tecnologia"] = normalized_name
-                    normalized_item["slug"] = _technology_slug(normalized_name)
+                    normalized_item["slug"] = technology_slug(normalized_name)
                 filtered_series.append(normalized_item)
 
             compact["series"] = filtered_series
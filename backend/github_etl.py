@@ -7,7 +7,9 @@ actividad de frameworks y correlación entre stars y
 contributors.
 Author: Samir Caizapasto
 """
+import argparse
 from datetime import datetime, timezone
+from functools import lru_cache
 
 import requests
 import pandas as pd
@@ -17,14 +19,28 @@ import re
 from config.settings import (
     GITHUB_API_BASE, GITHUB_HEADERS, MAX_REPOS, PER_PAGE,
     GITHUB_MIN_CLASSIFIABLE_REPOS, GITHUB_FALLBACK_CLASSIFIABLE_REPOS,
-    FRAMEWORK_REPOS,
+    FRAMEWORK_REPOS, GITHUB_CORRELATION_MAX_REPOS, GITHUB_MAX_CONCURRENCY,
+    GITHUB_SEARCH_MAX_CONCURRENCY, GITHUB_SEARCH_PARTITION_MODE, GITHUB_SEARCH_RESULT_CAP,
+    GITHUB_INCREMENTAL_MODE, GITHUB_INCREMENTAL_RECENT_MONTHS,
+    GITHUB_INCREMENTAL_SAMPLE_SIZE, GITHUB_INCREMENTAL_TOLERANCE,
     FECHA_INICIO_STR, FECHA_FIN_STR, FECHA_INICIO_ISO,
-    DATOS_HISTORY_DIR,
-    REQUEST_TIMEOUT_SECONDS, HTTP_MAX_RETRIES, HTTP_RETRY_BACKOFF_SECONDS,
-    REQUEST_PAGE_DELAY_SECONDS, REQUEST_MEDIUM_DELAY_SECONDS, REQUEST_SHORT_DELAY_SECONDS
+    DATOS_HISTORY_DIR, GITHUB_CHECKPOINT_PATH, GITHUB_API_BACKEND,
+    GITHUB_COMMITS_MODE, GITHUB_STATS_MAX_RETRIES, GITHUB_STATS_RETRY_SECONDS,
+    GITHUB_STATS_CONTRIBUTORS_CAP, GITHUB_FRAMEWORK_MAX_CONCURRENCY, GITHUB_COMMIT_STORE_PATH,
+    GITHUB_FRAMEWORK_TASK_CONCURRENCY, GITHUB_STATS_CONTRIBUTORS_MAX_PAGES,
+    GITHUB_AI_KEYWORD_MATCH,
+    HTTP_MAX_RETRIES, HTTP_RETRY_BACKOFF_SECONDS,
 )
 from exceptions import ETLExtractionError, ETLValidationError
 from base_etl import BaseETL
+from http_client import build_response_cache
+from rate_limit import GitHubRateLimitScheduler
+from parallel import ConsecutiveFailureCircuit, map_bounded
+from checkpoint import ExtractionCheckpoint
+from github_graphql import GitHubGraphQLBackend
+from commit_store import CommitHistoryStore
+from history_store import read_snapshot
+from keyword_matcher import bounded_pattern
 
 
 class GitHubETL(BaseETL):
@@ -46,9 +62,25 @@ class GitHubETL(BaseETL):
         "anthropic", "prompt", "rag", "vector db",
     ]
 
-    def __init__(self):
+    LENGUAJES_AI = {"llms/ai", "ai/ml", "ai", "llm", "genai", "artificial intelligence"}
+
+    def __init__(self, resume=False):
         super().__init__("github")
         self.df_repos = None
+        self.resume = resume
+        self.http = self._get_http_client(
+            "github",
+            GITHUB_HEADERS,
+            scheduler=GitHubRateLimitScheduler(
+                authenticated=bool(GITHUB_HEADERS.get("Authorization"))
+            ),
+            cache=build_response_cache("github"),
+        )
+        self.graphql = None
+        self._framework_activity = {}
+        self.commit_store = None
+        if GITHUB_API_BACKEND == "graphql" and GITHUB_HEADERS.get("Authorization"):
+            self.graphql = GitHubGraphQLBackend(self.http, self.logger)
 
     def definir_pasos(self):
         """Define los pasos del ETL de GitHub."""
@@ -68,6 +100,8 @@ class GitHubETL(BaseETL):
                 "GITHUB_TOKEN no configurado. Se ejecutara en modo degradado "
                 "(limite de 60 requests/h)."
             )
+            if GITHUB_API_BACKEND == "graphql":
+                self.logger.warning("GITHUB_API_BACKEND=graphql requiere token; se usara REST")
 
     def _normalizar_lenguaje(self, valor):
         """Normaliza valores de lenguaje provenientes de la GitHub API."""
@@ -88,11 +122,54 @@ class GitHubETL(BaseETL):
         desc = str(description or "").lower()
         lenguaje = str(language or "").strip().lower()
 
-        if lenguaje in {"llms/ai", "ai/ml", "ai", "llm", "genai", "artificial intelligence"}:
+        if lenguaje in self.LENGUAJES_AI:
             return True
 
         texto = f"{nombre} {desc}"
-        return any(kw in texto for kw in self.KEYWORDS_AI)
+        return self._ai_keyword_pattern(GITHUB_AI_KEYWORD_MATCH).search(texto) is not None
+
+    @classmethod
+    def _ai_keyword_patterns(cls, mode):
+        """Returns one regex source per AI keyword for the given match mode.
+
+        ``substring`` keeps the historical ``kw in texto`` semantics (``ai``
+        also hits ``openai``); ``word`` applies the Reddit keyword boundaries.
+        """
+        if mode == "word":
+            return {kw: bounded_pattern(kw) for kw in cls.KEYWORDS_AI}
+        return {kw: re.escape(kw) for kw in cls.KEYWORDS_AI}
+
+    @classmethod
+    @lru_cache(maxsize=4)
+    def _ai_keyword_pattern(cls, mode):
+        """Single precompiled alternation of every AI keyword."""
+        patterns = cls._ai_keyword_patterns(mode)
+        ordered = sorted(patterns, key=len, reverse=True)
+        return re.compile("|".join(patterns[kw] for kw in ordered))
+
+    def _mask_repos_ai(self, df):
+        """Vectorized ``_es_repo_ai`` over a repos frame."""
+        texto = self._texto_repos(df)
+        lenguaje = df["language"].fillna("").astype(str).str.strip().str.lower()
+        por_keyword = texto.str.contains(
+            self._ai_keyword_pattern(GITHUB_AI_KEYWORD_MATCH), regex=True
+        )
+        return lenguaje.isin(self.LENGUAJES_AI) | por_keyword
+
+    @staticmethod
+    def _texto_repos(df):
+        return (
+            df["repo_name"].fillna("").astype(str) + " " + df["description"].fillna("").astype(str)
+        ).str.lower()
+
+    def _contar_keywords_ai(self, texto):
+        """Counts each AI keyword independently over a lowercase text column."""
+        conteos = {}
+        for kw, pattern in self._ai_keyword_patterns(GITHUB_AI_KEYWORD_MATCH).items():
+            total = int(texto.str.count(pattern).sum()) if not texto.empty else 0
+            if total > 0:
+                conteos[kw] = total
+        return conteos
 
     @staticmethod
     def _classify_correlation_trend_bucket(outlier_score):
@@ -164,11 +241,7 @@ class GitHubETL(BaseETL):
         self.logger.info("Verificando conexion con GitHub API...")
 
         try:
-            response = requests.get(
-                f"{GITHUB_API_BASE}/rate_limit",
-                headers=GITHUB_HEADERS,
-                timeout=REQUEST_TIMEOUT_SECONDS,
-            )
+            response = self.http.get(f"{GITHUB_API_BASE}/rate_limit")
         except requests.exceptions.RequestException as e:
             raise ETLExtractionError(f"Error de red: {e}", critical=True) from e
 
@@ -220,6 +293,12 @@ class GitHubETL(BaseETL):
 
     def _build_repo_search_queries(self, max_repos):
         """Crea queries particionadas para evitar el techo de una sola busqueda."""
+        if GITHUB_SEARCH_PARTITION_MODE == "adaptive":
+            queries = self._build_adaptive_search_queries(max_repos)
+            if queries:
+                return queries
+            self.logger.warning("Particionado adaptativo no disponible, usando particiones mensuales")
+
         partitions = self._build_created_date_partitions()
         per_partition_goal = min(
             1000,
@@ -237,6 +316,108 @@ class GitHubETL(BaseETL):
             for start_date, end_date in partitions
         ]
 
+    def _probe_search_total(self, q):
+        """Consulta total_count de una busqueda con per_page=1 (None si falla)."""
+        response = self._fetch_search_page({"q": q, "label": q}, 1, per_page=1)
+        if response is None:
+            return None
+        return int(response.json().get("total_count", 0) or 0)
+
+    def _find_star_threshold(self, date_q, max_repos):
+        """Busca el mayor umbral de stars que aun cubre ``max_repos`` resultados.
+
+        Primero duplica el umbral hasta quedar por debajo del objetivo y luego
+        biseca; se detiene con una tolerancia del 5% para ahorrar sondeos.
+        Retorna None si algun sondeo falla.
+        """
+        low, high = 0, 1
+        while True:
+            count = self._probe_search_total(f"{date_q} stars:>={high}")
+            if count is None:
+                return None
+            if count < max_repos:
+                break
+            low, high = high, high * 2
+
+        while high - low > max(1, low // 20):
+            mid = (low + high) // 2
+            count = self._probe_search_total(f"{date_q} stars:>={mid}")
+            if count is None:
+                return None
+            if count >= max_repos:
+                low = mid
+            else:
+                high = mid
+        return low
+
+    def _build_adaptive_search_queries(self, max_repos):
+        """Particiona por densidad de resultados en vez de por mes calendario.
+
+        Con el umbral de stars que cubre ``max_repos`` se biseca el rango de
+        fechas hasta que cada particion quede bajo el techo de 1000 resultados
+        de la Search API, y cada una recibe solo las paginas que necesita.
+        Retorna una lista vacia si algun sondeo falla.
+        """
+        start = pd.to_datetime(FECHA_INICIO_STR, errors="coerce")
+        end = pd.to_datetime(FECHA_FIN_STR, errors="coerce")
+        if pd.isna(start) or pd.isna(end) or start > end:
+            return []
+
+        threshold = self._find_star_threshold(f"created:{FECHA_INICIO_STR}..{FECHA_FIN_STR}", max_repos)
+        if threshold is None:
+            return []
+        star_filter = f" stars:>={threshold}" if threshold > 0 else ""
+        self.logger.info("  Umbral adaptativo de stars: %s", threshold)
+
+        def _query(date_range):
+            range_start, range_end = date_range
+            label = f"{range_start:%Y-%m-%d}..{range_end:%Y-%m-%d}"
+            return f"created:{label}{star_filter}", label
+
+        queries = []
+        pending = [(start.normalize(), end.normalize())]
+        while pending:
+            counts = map_bounded(
+                lambda date_range: self._probe_search_total(_query(date_range)[0]),
+                pending,
+                GITHUB_SEARCH_MAX_CONCURRENCY,
+            )
+            next_pending = []
+            for date_range, count in zip(pending, counts):
+                if count is None:
+                    return []
+                range_start, range_end = date_range
+                if count > GITHUB_SEARCH_RESULT_CAP and range_start < range_end:
+                    middle = range_start + (range_end - range_start) // 2
+                    next_pending.append((range_start, middle.normalize()))
+                    next_pending.append((middle.normalize() + pd.Timedelta(days=1), range_end))
+                    continue
+                if count > GITHUB_SEARCH_RESULT_CAP:
+                    self.logger.warning(
+                        "  Particion %s supera %s resultados incluso en un dia; se truncara",
+                        range_start.strftime("%Y-%m-%d"),
+                        GITHUB_SEARCH_RESULT_CAP,
+                    )
+                if count == 0:
+                    continue
+                q, label = _query(date_range)
+                queries.append(
+                    {
+                        "q": q,
+                        "pages": (min(count, GITHUB_SEARCH_RESULT_CAP) + PER_PAGE - 1) // PER_PAGE,
+                        "label": label,
+                    }
+                )
+            pending = next_pending
+
+        queries.sort(key=lambda query: query["label"])
+        self.logger.info(
+            "  Particionado adaptativo: %s particiones, %s paginas",
+            len(queries),
+            sum(query["pages"] for query in queries),
+        )
+        return queries
+
     def _validate_repo_coverage(self, max_repos):
         if self.df_repos is None or self.df_repos.empty:
             return
@@ -269,99 +450,299 @@ class GitHubETL(BaseETL):
                 min_expected,
             )
 
-    def extraer_repos(self, max_repos=MAX_REPOS):
-        """Extrae repositorios recientes usando busquedas mensuales particionadas.
+    def _fetch_search_page(self, query, page, per_page=PER_PAGE):
+        """Descarga una pagina de busqueda; retorna la respuesta 200 o None."""
+        params = {
+            "q": query["q"],
+            "sort": "stars",
+            "order": "desc",
+            "per_page": per_page,
+            "page": page,
+        }
 
-        Raises:
-            ETLExtractionError: Si no se pudo extraer ningun repositorio o la
-            cobertura queda por debajo del minimo de respaldo.
+        response = None
+        for retry in range(HTTP_MAX_RETRIES):
+            try:
+                response = self.http.get(
+                    f"{GITHUB_API_BASE}/search/repositories",
+                    params=params,
+                )
+            except requests.exceptions.RequestException as e:
+                self.logger.error(f"Error de red en {query['label']} pagina {page}: {e}")
+                return None
+
+            if response.status_code == 200:
+                return response
+            if response.status_code == 403:
+                if self.esperar_rate_limit(response):
+                    continue
+                self.logger.warning(f"  Error 403, reintentando ({retry+1}/{HTTP_MAX_RETRIES})...")
+                time.sleep(HTTP_RETRY_BACKOFF_SECONDS * (retry + 1))
+            else:
+                self.logger.error(f"Error en {query['label']} pagina {page}: {response.status_code}")
+                return None
+        return None
+
+    def _crawl_search_partition(self, query, circuit, position=None, total=None, checkpoint=None):
+        """Recorre las paginas de una particion y retorna sus repos en orden.
+
+        Con ``checkpoint`` se omiten las paginas ya descargadas y cada pagina
+        nueva se persiste antes de continuar.
         """
-        self.logger.info(f"Extrayendo top {max_repos} repos ({FECHA_INICIO_STR} a {FECHA_FIN_STR})...")
+        label = query["label"]
+        if checkpoint is not None and checkpoint.is_complete(label):
+            return checkpoint.repos(label)
+
+        pages_done = checkpoint.pages_done(label) if checkpoint is not None else set()
+        repos_particion = checkpoint.repos(label) if checkpoint is not None else []
+        pages_failed = 0
+        for page in range(1, query["pages"] + 1):
+            if circuit.is_open:
+                break
+            if page in pages_done:
+                continue
+            self.logger.info(
+                "  Particion %s/%s %s - pagina %s/%s...",
+                position,
+                total,
+                label,
+                page,
+                query["pages"],
+            )
+
+            response = self._fetch_search_page(query, page)
+            if response is None:
+                pages_failed += 1
+                if circuit.record_failure():
+                    self.logger.error(
+                        "Demasiados fallos consecutivos (%s), deteniendo extraccion",
+                        circuit.failures,
+                    )
+                continue
+
+            circuit.record_success()
+            items = response.json().get("items", [])
+            repos_pagina = [self._repo_record(repo) for repo in items]
+            repos_particion.extend(repos_pagina)
+            if checkpoint is not None:
+                checkpoint.record_page(label, page, repos_pagina)
+            if len(items) < PER_PAGE:
+                break
+
+        if checkpoint is not None and not pages_failed and not circuit.is_open:
+            checkpoint.mark_complete(label)
+        return repos_particion
+
+    def _repo_record(self, repo):
+        """Convierte un item de la Search/Repos API en una fila de github_repos."""
+        return {
+            "repo_name": repo["full_name"],
+            "language": self._normalizar_lenguaje(repo.get("language")),
+            "stars": repo["stargazers_count"],
+            "forks": repo["forks_count"],
+            "created_at": repo["created_at"],
+            "description": repo.get("description", "").strip()[:100].strip() if repo.get("description") else "",
+        }
+
+    def _crawl_search_queries(self, queries, checkpoint=None):
+        """Recorre las particiones en paralelo y combina los repos en orden."""
+        circuit = ConsecutiveFailureCircuit(threshold=5)
+
+        repos_por_particion = map_bounded(
+            lambda indexed: self._crawl_search_partition(
+                indexed[1],
+                circuit,
+                position=indexed[0],
+                total=len(queries),
+                checkpoint=checkpoint,
+            ),
+            enumerate(queries, start=1),
+            GITHUB_SEARCH_MAX_CONCURRENCY,
+        )
 
         repos_by_name = {}
+        for repos in repos_por_particion:
+            for repo in repos:
+                repos_by_name.setdefault(repo["repo_name"], repo)
+        return repos_by_name
+
+    def _open_checkpoint(self, max_repos):
+        """Prepara el checkpoint de extraccion y las queries a recorrer.
+
+        Con ``--resume`` se reutiliza el plan de particiones guardado (sin
+        volver a sondear) si corresponde a la misma ventana y objetivo.
+        """
+        window = {"desde": FECHA_INICIO_STR, "hasta": FECHA_FIN_STR, "max_repos": max_repos}
+        state = ExtractionCheckpoint.load(GITHUB_CHECKPOINT_PATH) if self.resume else None
+        if state is not None and state.get("window") == window and state.get("queries"):
+            checkpoint = ExtractionCheckpoint(
+                GITHUB_CHECKPOINT_PATH, state["queries"], state=state, metadata={"window": window}
+            )
+            self.logger.info(
+                "  Reanudando desde checkpoint: %s/%s particiones completas",
+                checkpoint.completed_count(),
+                len(checkpoint.queries),
+            )
+            return checkpoint
+        if self.resume:
+            self.logger.warning("  Checkpoint ausente o de otra ventana, se inicia extraccion completa")
+
         queries = self._build_repo_search_queries(max_repos)
-        max_retries = HTTP_MAX_RETRIES
-        max_fallos_consecutivos = 5
-        fallos_consecutivos = 0
-
-        for query_index, query in enumerate(queries, start=1):
-            for page in range(1, query["pages"] + 1):
-                self.logger.info(
-                    "  Particion %s/%s %s - pagina %s/%s...",
-                    query_index,
-                    len(queries),
-                    query["label"],
-                    page,
-                    query["pages"],
-                )
+        return ExtractionCheckpoint(GITHUB_CHECKPOINT_PATH, queries, metadata={"window": window})
 
-                params = {
-                    "q": query["q"],
-                    "sort": "stars",
-                    "order": "desc",
-                    "per_page": PER_PAGE,
-                    "page": page,
-                }
-
-                response = None
-                for retry in range(max_retries):
-                    try:
-                        response = requests.get(
-                            f"{GITHUB_API_BASE}/search/repositories",
-                            headers=GITHUB_HEADERS,
-                            params=params,
-                            timeout=REQUEST_TIMEOUT_SECONDS,
-                        )
-                    except requests.exceptions.RequestException as e:
-                        self.logger.error(f"Error de red en pagina {page}: {e}")
-                        break
-
-                    if response.status_code == 200:
-                        break
-                    if response.status_code == 403:
-                        if self.esperar_rate_limit(response):
-                            continue
-                        self.logger.warning(f"  Error 403, reintentando ({retry+1}/{max_retries})...")
-                        time.sleep(HTTP_RETRY_BACKOFF_SECONDS * (retry + 1))
-                    else:
-                        self.logger.error(f"Error en pagina {page}: {response.status_code}")
-                        break
-
-                if response is None or response.status_code != 200:
-                    fallos_consecutivos += 1
-                    if fallos_consecutivos >= max_fallos_consecutivos:
-                        self.logger.error(
-                            "Demasiados fallos consecutivos (%s), deteniendo extraccion",
-                            fallos_consecutivos,
-                        )
-                        break
-                    continue
+    def _load_previous_repos_snapshot(self):
+        """Carga el snapshot historico mas reciente de github_repos."""
+        snapshot_date, snapshot_path = self._resolve_previous_snapshot(
+            "github_repos", "github_repos_2025.csv"
+        )
+        if snapshot_path is None:
+            return None, None
 
-                fallos_consecutivos = 0
-                items = response.json().get("items", [])
-                if not items:
-                    break
-
-                for repo in items:
-                    repo_name = repo["full_name"]
-                    if repo_name in repos_by_name:
-                        continue
-                    language = self._normalizar_lenguaje(repo.get("language"))
-                    repos_by_name[repo_name] = {
-                        "repo_name": repo_name,
-                        "language": language,
-                        "stars": repo["stargazers_count"],
-                        "forks": repo["forks_count"],
-                        "created_at": repo["created_at"],
-                        "description": repo.get("description", "").strip()[:100].strip() if repo.get("description") else "",
-                    }
+        try:
+            previous_df = read_snapshot(snapshot_path)
+        except Exception as exc:  # pylint: disable=broad-exception-caught
+            self.logger.warning(
+                "No se pudo leer snapshot historico previo de repos (%s): %s",
+                snapshot_path,
+                exc,
+            )
+            return None, None
 
-                if len(items) < PER_PAGE:
-                    break
-                time.sleep(REQUEST_PAGE_DELAY_SECONDS)
+        required = {"repo_name", "language", "stars", "forks", "created_at", "description"}
+        if not required.issubset(previous_df.columns) or previous_df.empty:
+            return None, None
+        previous_df["description"] = previous_df["description"].fillna("")
+        return previous_df, snapshot_date
 
-            if fallos_consecutivos >= max_fallos_consecutivos:
-                break
+    def _fetch_repo_counts(self, repo_name):
+        """Obtiene stars/forks actuales de un repo.
+
+        Retorna un dict, ``{}`` si el repo ya no existe (404) o None si falla.
+        """
+        try:
+            response = self.http.get(f"{GITHUB_API_BASE}/repos/{repo_name}")
+        except requests.exceptions.RequestException as e:
+            self.logger.warning(f" Error de red refrescando {repo_name}: {e}")
+            return None
+        if response.status_code == 404:
+            return {}
+        if response.status_code != 200:
+            return None
+        data = response.json()
+        return {"stars": data["stargazers_count"], "forks": data["forks_count"]}
+
+    def _refresh_retained_repos(self, retained):
+        """Refresca una muestra de repos retenidos y mide la deriva de stars.
+
+        Solo se consultan los GITHUB_INCREMENTAL_SAMPLE_SIZE repos con mas
+        stars (los que deciden el ranking); el resto conserva los valores del
+        snapshot. Retorna (repos refrescados, deriva mediana o None).
+        """
+        retained = sorted(retained, key=lambda repo: int(repo["stars"]), reverse=True)
+        sample = retained[:GITHUB_INCREMENTAL_SAMPLE_SIZE]
+        if self.graphql is not None:
+            batched = self.graphql.fetch_repo_counts([repo["repo_name"] for repo in sample])
+            counts = [batched.get(repo["repo_name"]) for repo in sample]
+        else:
+            counts = map_bounded(
+                lambda repo: self._fetch_repo_counts(repo["repo_name"]),
+                sample,
+                GITHUB_MAX_CONCURRENCY,
+            )
+
+        drifts = []
+        removed = set()
+        refreshed = {repo["repo_name"]: dict(repo) for repo in retained}
+        for repo, current in zip(sample, counts):
+            if current is None:
+                continue
+            if not current:
+                removed.add(repo["repo_name"])
+                continue
+            previous_stars = int(repo["stars"])
+            drifts.append(abs(current["stars"] - previous_stars) / max(previous_stars, 1))
+            refreshed[repo["repo_name"]].update(current)
+
+        for repo_name in removed:
+            refreshed.pop(repo_name, None)
+        stale = len(refreshed) - len(drifts)
+        if stale:
+            self.logger.info(
+                "  %d repos retenidos conservan stars/forks del snapshot (fuera de la muestra o sin respuesta)",
+                stale,
+            )
+        drift = float(pd.Series(drifts).median()) if drifts else None
+        return refreshed, drift
+
+    def _extraer_repos_incremental(self, queries):
+        """Re-crawlea solo las particiones recientes y reutiliza el snapshot previo.
+
+        Retorna None cuando no hay snapshot utilizable o la muestra refrescada
+        deriva mas de GITHUB_INCREMENTAL_TOLERANCE, para forzar un crawl completo.
+        """
+        previous_df, snapshot_date = self._load_previous_repos_snapshot()
+        if previous_df is None:
+            self.logger.info("  Sin snapshot previo de repos, se hara crawl completo")
+            return None
+
+        cutoff = pd.to_datetime(FECHA_FIN_STR) - pd.DateOffset(months=GITHUB_INCREMENTAL_RECENT_MONTHS)
+        cutoff_str = cutoff.strftime("%Y-%m-%d")
+        recent_queries = [query for query in queries if query["label"].split("..")[-1] >= cutoff_str]
+        older_queries = [query for query in queries if query["label"].split("..")[-1] < cutoff_str]
+        if not older_queries:
+            return None
+
+        older_end = max(query["label"].split("..")[-1] for query in older_queries)
+        created = pd.to_datetime(previous_df["created_at"], errors="coerce", utc=True).dt.strftime("%Y-%m-%d")
+        # Both bounds: repos created before the current window start drop out,
+        # so the rolling window keeps sliding across incremental runs.
+        retained_df = previous_df[(created >= FECHA_INICIO_STR) & (created <= older_end)]
+        refreshed, drift = self._refresh_retained_repos(retained_df.to_dict("records"))
+
+        if drift is None or drift > GITHUB_INCREMENTAL_TOLERANCE:
+            self.logger.warning(
+                "  Deriva de stars fuera de tolerancia (%s > %s), se hara crawl completo",
+                "N/A" if drift is None else f"{drift:.3f}",
+                GITHUB_INCREMENTAL_TOLERANCE,
+            )
+            return None
+
+        self.logger.info(
+            "  Modo incremental: snapshot %s, %s particiones recientes, %s repos retenidos (deriva %.3f)",
+            snapshot_date,
+            len(recent_queries),
+            len(refreshed),
+            drift,
+        )
+        repos_by_name = self._crawl_search_queries(recent_queries)
+        for repo_name, repo in refreshed.items():
+            repos_by_name.setdefault(repo_name, repo)
+        return repos_by_name
+
+    def extraer_repos(self, max_repos=MAX_REPOS):
+        """Extrae repositorios recientes usando busquedas mensuales particionadas.
+
+        Las particiones se recorren en paralelo (GITHUB_SEARCH_MAX_CONCURRENCY)
+        bajo el presupuesto compartido del bucket ``search``; los resultados
+        se combinan en el orden de las particiones para que la deduplicacion
+        sea deterministica. Con GITHUB_INCREMENTAL_MODE solo se re-crawlean
+        los meses recientes sobre el snapshot previo. El progreso se guarda
+        por pagina en GITHUB_CHECKPOINT_PATH para poder reanudar con
+        ``--resume``.
+
+        Raises:
+            ETLExtractionError: Si no se pudo extraer ningun repositorio o la
+            cobertura queda por debajo del minimo de respaldo.
+        """
+        self.logger.info(f"Extrayendo top {max_repos} repos ({FECHA_INICIO_STR} a {FECHA_FIN_STR})...")
+
+        checkpoint = None
+        repos_by_name = None
+        if GITHUB_INCREMENTAL_MODE:
+            repos_by_name = self._extraer_repos_incremental(self._build_repo_search_queries(max_repos))
+        if repos_by_name is None:
+            checkpoint = self._open_checkpoint(max_repos)
+            repos_by_name = self._crawl_search_queries(checkpoint.queries, checkpoint=checkpoint)
 
         repos_data = sorted(
             repos_by_name.values(),
@@ -374,6 +755,9 @@ class GitHubETL(BaseETL):
 
         self.logger.info(f"Extraidos {len(repos_data)} repos unicos")
 
+        if checkpoint is not None and checkpoint.completed_count() == len(checkpoint.queries):
+            checkpoint.clear()
+
         self.df_repos = pd.DataFrame(repos_data)
         self._validate_repo_coverage(max_repos)
         self.guardar_csv(self.df_repos, "github_repos")
@@ -426,10 +810,7 @@ class GitHubETL(BaseETL):
         df["language"] = df["language"].apply(self._normalizar_lenguaje)
         df["description"] = df["description"].fillna("")
 
-        mask_ai = df.apply(
-            lambda row: self._es_repo_ai(row["repo_name"], row["description"], row["language"]),
-            axis=1,
-        )
+        mask_ai = self._mask_repos_ai(df)
         ai_df = df[mask_ai].copy()
 
         total_repos = len(df)
@@ -446,11 +827,7 @@ class GitHubETL(BaseETL):
                 mes_pico = str(conteo_meses.index[0])
                 repos_mes_pico = int(conteo_meses.iloc[0])
 
-        texto_ai = " ".join((ai_df["repo_name"].fillna("") + " " + ai_df["description"].fillna("")) if not ai_df.empty else [])
-        texto_ai = texto_ai.lower()
-        conteo_keywords = {
-            kw: texto_ai.count(kw) for kw in self.KEYWORDS_AI if texto_ai.count(kw) > 0
-        }
+        conteo_keywords = self._contar_keywords_ai(self._texto_repos(ai_df))
         top_keywords = sorted(conteo_keywords.items(), key=lambda item: item[1], reverse=True)[:5]
         top_keywords_str = " | ".join([f"{kw}:{cnt}" for kw, cnt in top_keywords]) if top_keywords else "N/A"
 
@@ -493,12 +870,15 @@ class GitHubETL(BaseETL):
         return f"{year}-{month}-{day}"
 
     def _resolve_previous_commits_snapshot(self):
-        history_root = DATOS_HISTORY_DIR / "github_commits"
+        return self._resolve_previous_snapshot("github_commits", "github_commits_frameworks.csv")
+
+    def _resolve_previous_snapshot(self, dataset, filename):
+        history_root = DATOS_HISTORY_DIR / dataset
         if not history_root.exists():
             return None, None
 
         snapshots = []
-        for csv_path in history_root.rglob("github_commits_frameworks.csv"):
+        for csv_path in history_root.rglob(filename):
             rel_parts = csv_path.relative_to(history_root).parts
             date_label = self._extract_partition_date(rel_parts)
             if date_label is None:
@@ -512,12 +892,17 @@ class GitHubETL(BaseETL):
         return snapshots[-1]
 
     def _load_previous_commits_map(self):
+        if self.commit_store is not None:
+            commits_prev, run_date = self.commit_store.previous_commits()
+            if commits_prev:
+                return commits_prev, run_date
+
         snapshot_date, snapshot_path = self._resolve_previous_commits_snapshot()
         if snapshot_path is None:
             return {}, None
 
         try:
-            previous_df = pd.read_csv(snapshot_path)
+            previous_df = read_snapshot(snapshot_path)
         except Exception as exc:  # pylint: disable=broad-exception-caught
             self.logger.warning(
                 "No se pudo leer snapshot historico previo de commits (%s): %s",
@@ -541,11 +926,11 @@ class GitHubETL(BaseETL):
         return commits_prev, snapshot_date
 
     @staticmethod
-    def _safe_month_label(value):
+    def _safe_day_label(value):
         parsed = pd.to_datetime(value, errors="coerce", utc=True)
         if pd.isna(parsed):
             return None
-        return parsed.strftime("%Y-%m")
+        return parsed.strftime("%Y-%m-%d")
 
     @staticmethod
     def _compute_growth(current_value, previous_value):
@@ -564,23 +949,29 @@ class GitHubETL(BaseETL):
         return "estable"
 
     def _count_search_items(self, query):
+        """Returns ``total_count`` for a search query, or None when it could not be read.
+
+        Transport errors and 5xx were already retried by the client adapter;
+        this loop only waits out search rate limits. A failure is reported
+        as None (an unknown count), never as 0.
+        """
         for retry in range(HTTP_MAX_RETRIES):
             try:
-                response = requests.get(
+                response = self.http.get(
                     f"{GITHUB_API_BASE}/search/issues",
-                    headers=GITHUB_HEADERS,
                     params={"q": query, "per_page": 1},
-                    timeout=REQUEST_TIMEOUT_SECONDS,
                 )
             except requests.exceptions.RequestException as exc:
                 self.logger.warning("Error de red en query search '%s': %s", query, exc)
-                time.sleep(HTTP_RETRY_BACKOFF_SECONDS * (retry + 1))
-                continue
+                return None
 
             if response.status_code == 200:
                 return int(response.json().get("total_count", 0))
 
-            if response.status_code == 403 and self.esperar_rate_limit(response):
+            if response.status_code == 403:
+                if self.esperar_rate_limit(response):
+                    continue
+                time.sleep(HTTP_RETRY_BACKOFF_SECONDS * (retry + 1))
                 continue
 
             self.logger.warning(
@@ -588,8 +979,9 @@ class GitHubETL(BaseETL):
                 response.status_code,
                 query,
             )
-            time.sleep(HTTP_RETRY_BACKOFF_SECONDS * (retry + 1))
-        return 0
+            return None
+        self.logger.warning("Query search sin respuesta tras %s intentos: '%s'", HTTP_MAX_RETRIES, query)
+        return None
 
     def _count_releases_since(self, repo_path):
         since_ref = pd.to_datetime(FECHA_INICIO_ISO, errors="coerce", utc=True)
@@ -600,11 +992,9 @@ class GitHubETL(BaseETL):
         page = 1
         while page <= 10:
             try:
-                response = requests.get(
+                response = self.http.get(
                     f"{GITHUB_API_BASE}/repos/{repo_path}/releases",
-                    headers=GITHUB_HEADERS,
                     params={"per_page": 100, "page": page},
-                    timeout=REQUEST_TIMEOUT_SECONDS,
                 )
             except requests.exceptions.RequestException as exc:
                 self.logger.warning(
@@ -640,32 +1030,34 @@ class GitHubETL(BaseETL):
             if len(releases) < 100:
                 break
             page += 1
-            time.sleep(REQUEST_SHORT_DELAY_SECONDS)
 
         return releases_count
 
-    def _collect_framework_metrics(self, framework, repo_path):
+    def _fetch_commit_records(self, framework, repo_path, since_iso, max_pages=50, until_iso=None):
+        """Pagina /commits desde ``since_iso`` (hasta ``until_iso``) y normaliza cada commit.
+
+        Retorna (commits, completo); ``completo`` es False si la paginacion
+        se corto por un error o por ``max_pages``.
+        """
         params = {
-            "since": FECHA_INICIO_ISO,
+            "since": since_iso,
             "per_page": 100,
         }
-        total_commits = 0
+        if until_iso is not None:
+            params["until"] = until_iso
+        records = []
         page = 1
-        monthly_counts = {}
-        unique_contributors = set()
 
         while True:
             params["page"] = page
             try:
-                response = requests.get(
+                response = self.http.get(
                     f"{GITHUB_API_BASE}/repos/{repo_path}/commits",
-                    headers=GITHUB_HEADERS,
                     params=params,
-                    timeout=REQUEST_TIMEOUT_SECONDS,
                 )
             except requests.exceptions.RequestException as exc:
                 self.logger.error("  Error de red para %s: %s", framework, exc)
-                break
+                return records, False
 
             if response.status_code != 200:
                 if response.status_code == 403 and self.esperar_rate_limit(response):
@@ -675,50 +1067,255 @@ class GitHubETL(BaseETL):
                     framework,
                     response.status_code,
                 )
-                break
+                return records, False
 
             commits = response.json()
             if not commits:
-                break
+                return records, True
 
-            total_commits += len(commits)
             for commit in commits:
                 commit_author = commit.get("commit", {}).get("author", {}) or {}
                 commit_committer = commit.get("commit", {}).get("committer", {}) or {}
-                month_label = self._safe_month_label(
-                    commit_author.get("date") or commit_committer.get("date")
-                )
-                if month_label:
-                    monthly_counts[month_label] = monthly_counts.get(month_label, 0) + 1
-
+                contributor = None
                 author = commit.get("author") or {}
                 login = str(author.get("login", "")).strip().lower()
                 if login:
-                    unique_contributors.add(f"login:{login}")
+                    contributor = f"login:{login}"
                 else:
                     email = str(commit_author.get("email", "")).strip().lower()
                     name = str(commit_author.get("name", "")).strip().lower()
                     if email or name:
-                        unique_contributors.add(f"anon:{email}|{name}")
+                        contributor = f"anon:{email}|{name}"
+                day = self._safe_day_label(commit_author.get("date") or commit_committer.get("date"))
+                records.append({
+                    "sha": commit.get("sha"),
+                    "date": commit_committer.get("date") or commit_author.get("date"),
+                    "day": day,
+                    "month": day[:7] if day else None,
+                    "contributor": contributor,
+                })
 
             page += 1
-            time.sleep(REQUEST_MEDIUM_DELAY_SECONDS)
-            if page > 50:
-                break
+            if max_pages is not None and page > max_pages:
+                return records, False
 
-        merged_prs = self._count_search_items(
-            f"repo:{repo_path} is:pr is:merged merged:{FECHA_INICIO_STR}..{FECHA_FIN_STR}"
+    @staticmethod
+    def _aggregate_commit_records(records):
+        monthly_counts = {}
+        for record in records:
+            if record["month"]:
+                monthly_counts[record["month"]] = monthly_counts.get(record["month"], 0) + 1
+        contributors = {record["contributor"] for record in records if record["contributor"]}
+        return len(records), monthly_counts, len(contributors)
+
+    def _page_commit_history(self, framework, repo_path):
+        """Pagina /commits (hasta 50x100) y retorna (total, conteo mensual, contributors)."""
+        records, _ = self._fetch_commit_records(framework, repo_path, FECHA_INICIO_ISO)
+        return self._aggregate_commit_records(records)
+
+    def _collect_from_commit_store(self, framework, repo_path):
+        """Actualiza el store con los commits nuevos y retorna sus totales de la ventana.
+
+        Solo se pagina desde el ultimo commit registrado. Una paginacion
+        incompleta no se fusiona (dejaria huecos permanentes): se usan los
+        totales ya guardados o, sin historial, el resultado parcial.
+        """
+        since_iso, _ = self.commit_store.checkpoint(repo_path)
+        records, complete = self._fetch_commit_records(
+            framework,
+            repo_path,
+            since_iso or FECHA_INICIO_ISO,
+            max_pages=None,
         )
-        closed_issues = self._count_search_items(
-            f"repo:{repo_path} is:issue closed:{FECHA_INICIO_STR}..{FECHA_FIN_STR}"
+        if complete:
+            self.commit_store.merge(repo_path, records)
+            self.logger.info("  %s: %s commits nuevos en el store", framework, len(records))
+        elif since_iso is None:
+            self.logger.warning("  %s: paginacion incompleta, no se guarda en el store", framework)
+            return self._aggregate_commit_records(records)
+        else:
+            self.logger.warning("  %s: paginacion incompleta, se usan totales previos del store", framework)
+
+        return self.commit_store.totals(repo_path, FECHA_INICIO_STR, FECHA_FIN_STR)
+
+    def _fetch_repo_stats(self, repo_path, endpoint):
+        """Consulta /stats/<endpoint>, reintentando mientras GitHub responde 202.
+
+        GitHub calcula estas estadisticas en segundo plano y responde 202
+        hasta tenerlas listas. Retorna la lista JSON o None si no estan
+        disponibles.
+        """
+        url = f"{GITHUB_API_BASE}/repos/{repo_path}/stats/{endpoint}"
+        for attempt in range(GITHUB_STATS_MAX_RETRIES):
+            try:
+                response = self.http.get(url)
+            except requests.exceptions.RequestException as exc:
+                self.logger.warning("Error de red en stats/%s para %s: %s", endpoint, repo_path, exc)
+                return None
+
+            if response.status_code == 202:
+                time.sleep(GITHUB_STATS_RETRY_SECONDS * (attempt + 1))
+                continue
+            if response.status_code == 403 and self.esperar_rate_limit(response):
+                continue
+            if response.status_code != 200:
+                self.logger.warning(
+                    "stats/%s no disponible para %s (status=%s)",
+                    endpoint,
+                    repo_path,
+                    response.status_code,
+                )
+                return None
+
+            payload = response.json()
+            return payload if isinstance(payload, list) and payload else None
+
+        self.logger.warning("stats/%s de %s sigue en calculo (202), se usara paginacion", endpoint, repo_path)
+        return None
+
+    def _collect_commit_stats(self, framework, repo_path):
+        """Construye commits y conteo mensual desde /stats/commit_activity.
+
+        Retorna None si las 52 semanas no cubren la ventana de analisis (p.ej.
+        con ETL_REFERENCE_DATE en el pasado). Los dias del inicio que quedan
+        fuera del horizonte de 52 semanas (como mucho una semana) se cuentan
+        paginando /commits solo entre FECHA_INICIO y la primera semana.
+        """
+        weeks = self._fetch_repo_stats(repo_path, "commit_activity")
+        if weeks is None:
+            return None
+
+        window_start = pd.Timestamp(FECHA_INICIO_STR, tz="UTC")
+        window_end = pd.Timestamp(FECHA_FIN_STR, tz="UTC")
+        first_week = pd.to_datetime(int(weeks[0]["week"]), unit="s", utc=True)
+        last_day = pd.to_datetime(int(weeks[-1]["week"]), unit="s", utc=True) + pd.Timedelta(days=6)
+        if first_week > window_start + pd.Timedelta(days=7) or last_day < window_end:
+            return None
+
+        total_commits = 0
+        monthly_counts = {}
+        if first_week > window_start:
+            records, complete = self._fetch_commit_records(
+                framework,
+                repo_path,
+                FECHA_INICIO_ISO,
+                until_iso=(first_week - pd.Timedelta(seconds=1)).strftime("%Y-%m-%dT%H:%M:%SZ"),
+            )
+            if not complete:
+                return None
+            total_commits, monthly_counts, _ = self._aggregate_commit_records(records)
+
+        for week in weeks:
+            week_start = pd.to_datetime(int(week["week"]), unit="s", utc=True)
+            for offset, commits in enumerate(week.get("days") or []):
+                day = week_start + pd.Timedelta(days=offset)
+                if not commits or day < window_start or day > window_end:
+                    continue
+                month_label = day.strftime("%Y-%m")
+                monthly_counts[month_label] = monthly_counts.get(month_label, 0) + int(commits)
+                total_commits += int(commits)
+        return total_commits, monthly_counts
+
+    def _collect_contributor_stats(self, framework, repo_path):
+        """Cuenta autores con commits en la ventana desde /stats/contributors.
+
+        GitHub solo devuelve los 100 autores principales; con la lista llena
+        los autores activos se completan con los de las primeras
+        GITHUB_STATS_CONTRIBUTORS_MAX_PAGES paginas de /commits (solo para
+        contributors, los commits siguen saliendo de commit_activity).
+        """
+        authors = self._fetch_repo_stats(repo_path, "contributors")
+        if authors is None:
+            return None
+
+        window_start = pd.Timestamp(FECHA_INICIO_STR, tz="UTC").timestamp()
+        window_end = pd.Timestamp(FECHA_FIN_STR, tz="UTC").timestamp()
+        active = set()
+        for index, author in enumerate(authors):
+            if any(
+                int(week.get("c", 0)) > 0 and window_start - 6 * 86400 <= int(week.get("w", 0)) <= window_end
+                for week in author.get("weeks") or []
+            ):
+                login = str((author.get("author") or {}).get("login", "")).strip().lower()
+                active.add(f"login:{login}" if login else f"stats:{index}")
+        if len(authors) < GITHUB_STATS_CONTRIBUTORS_CAP:
+            return len(active)
+
+        records, complete = self._fetch_commit_records(
+            framework,
+            repo_path,
+            FECHA_INICIO_ISO,
+            max_pages=GITHUB_STATS_CONTRIBUTORS_MAX_PAGES,
         )
-        releases_count = self._count_releases_since(repo_path)
+        active.update(record["contributor"] for record in records if record["contributor"])
+        if not complete:
+            self.logger.info(
+                "  %s: contributors acotados a %s paginas de commits (cota inferior)",
+                framework,
+                GITHUB_STATS_CONTRIBUTORS_MAX_PAGES,
+            )
+        return len(active)
+
+    def _collect_framework_metrics(self, framework, repo_path):
+        """Recolecta commits, contributors, PRs, issues y releases de un framework.
+
+        Con GITHUB_COMMITS_MODE=stats los commits mensuales y los contributors
+        activos salen de /stats (un par de llamadas por repo); con ``store``
+        salen del historial incremental persistido; la paginacion de
+        /commits queda como respaldo. Los conteos ya resueltos por GraphQL
+        (``self._framework_activity``) se reutilizan; los campos en None se
+        consultan por REST.
+        """
+        prefetched = self._framework_activity.get(repo_path) or {}
+        window = f"{FECHA_INICIO_STR}..{FECHA_FIN_STR}"
+
+        # Sub-consultas independientes en paralelo, acotadas por
+        # GITHUB_FRAMEWORK_TASK_CONCURRENCY; cada endpoint sigue limitado por
+        # su bucket (search tiene su propio cupo, menor).
+        tasks = {}
+        if GITHUB_COMMITS_MODE == "store":
+            tasks["store"] = lambda: self._collect_from_commit_store(framework, repo_path)
+        if GITHUB_COMMITS_MODE == "stats":
+            tasks["commit_stats"] = lambda: self._collect_commit_stats(framework, repo_path)
+            tasks["active_contributors"] = lambda: self._collect_contributor_stats(framework, repo_path)
+        if prefetched.get("merged_prs") is None:
+            tasks["merged_prs"] = lambda: self._count_search_items(
+                f"repo:{repo_path} is:pr is:merged merged:{window}"
+            )
+        if prefetched.get("closed_issues") is None:
+            tasks["closed_issues"] = lambda: self._count_search_items(
+                f"repo:{repo_path} is:issue closed:{window}"
+            )
+        if prefetched.get("releases_count") is None:
+            tasks["releases_count"] = lambda: self._count_releases_since(repo_path)
+
+        fetched = dict(zip(tasks, map_bounded(
+            lambda task: task(), tasks.values(), GITHUB_FRAMEWORK_TASK_CONCURRENCY
+        )))
+        commit_stats = fetched.get("commit_stats")
+        active_contributors = fetched.get("active_contributors")
+        if "store" in fetched:
+            store_total, store_monthly, active_contributors = fetched["store"]
+            commit_stats = (store_total, store_monthly)
+
+        if commit_stats is None or active_contributors is None:
+            self.logger.info("  %s: usando paginacion de commits como respaldo", framework)
+            paged_total, paged_monthly, paged_contributors = self._page_commit_history(framework, repo_path)
+            if commit_stats is None:
+                commit_stats = (paged_total, paged_monthly)
+            if active_contributors is None:
+                active_contributors = paged_contributors
+        total_commits, monthly_counts = commit_stats
+
+        merged_prs = fetched.get("merged_prs", prefetched.get("merged_prs"))
+        closed_issues = fetched.get("closed_issues", prefetched.get("closed_issues"))
+        releases_count = fetched.get("releases_count", prefetched.get("releases_count"))
 
         return {
             "framework": framework,
             "repo": repo_path,
             "commits_2025": total_commits,
-            "active_contributors": len(unique_contributors),
+            "active_contributors": active_contributors,
             "merged_prs": merged_prs,
             "closed_issues": closed_issues,
             "releases_count": releases_count,
@@ -746,9 +1343,17 @@ class GitHubETL(BaseETL):
         ]
 
     def analizar_commits_frameworks(self):
-        """Analiza la actividad de commits de frameworks frontend."""
+        """Analiza la actividad de commits de frameworks frontend.
+
+        Los frameworks se procesan en paralelo (GITHUB_FRAMEWORK_MAX_CONCURRENCY)
+        y se reensamblan en el orden de FRAMEWORK_REPOS; el ranking usa un
+        orden estable para que los empates sean deterministicos.
+        """
         self.logger.info("PREGUNTA 2: Analizando commits de frameworks...")
 
+        if GITHUB_COMMITS_MODE == "store":
+            self.commit_store = CommitHistoryStore(GITHUB_COMMIT_STORE_PATH)
+
         commits_prev_map, previous_snapshot_date = self._load_previous_commits_map()
         if previous_snapshot_date:
             self.logger.info(
@@ -759,9 +1364,26 @@ class GitHubETL(BaseETL):
         commits_data = []
         monthly_rows = []
 
-        for framework, repo_path in FRAMEWORK_REPOS.items():
+        if self.graphql is not None:
+            self._framework_activity = self.graphql.fetch_framework_activity(
+                list(FRAMEWORK_REPOS.values()),
+                FECHA_INICIO_STR,
+                FECHA_FIN_STR,
+                FECHA_INICIO_ISO,
+            )
+
+        def _collect(item):
+            framework, repo_path = item
             self.logger.info(f"  Analizando {framework} ({repo_path})...")
-            metrics = self._collect_framework_metrics(framework, repo_path)
+            return self._collect_framework_metrics(framework, repo_path)
+
+        collected = map_bounded(
+            _collect,
+            FRAMEWORK_REPOS.items(),
+            GITHUB_FRAMEWORK_MAX_CONCURRENCY,
+        )
+
+        for (framework, repo_path), metrics in zip(FRAMEWORK_REPOS.items(), collected):
             previous_commits = commits_prev_map.get(framework)
             delta_commits = (
                 metrics["commits_2025"] - previous_commits
@@ -806,8 +1428,20 @@ class GitHubETL(BaseETL):
         if not commits_data:
             raise ETLExtractionError("No se pudo extraer datos de commits de ningun framework")
 
+        if self.commit_store is not None:
+            self.commit_store.prune(FECHA_INICIO_STR)
+            self.commit_store.record_run(
+                {row["framework"]: row["commits_2025"] for row in commits_data},
+                FECHA_FIN_STR,
+            )
+            self.commit_store.save()
+
         df_commits = pd.DataFrame(commits_data)
-        df_commits = df_commits.sort_values("commits_2025", ascending=False).reset_index(drop=True)
+        df_commits = df_commits.sort_values(
+            "commits_2025",
+            ascending=False,
+            kind="stable",
+        ).reset_index(drop=True)
         df_commits["ranking"] = range(1, len(df_commits) + 1)
         df_commits = df_commits[
             [
@@ -846,77 +1480,86 @@ class GitHubETL(BaseETL):
             ).reset_index(drop=True)
             self.guardar_csv(df_monthly, "github_commits_monthly")
 
+    def _fetch_contributors_count(self, repo_name):
+        """Obtiene el numero de contributors de un repo (None si falla)."""
+        response = None
+        for attempt in range(HTTP_MAX_RETRIES):
+            try:
+                response = self.http.get(
+                    f"{GITHUB_API_BASE}/repos/{repo_name}/contributors",
+                    params={"per_page": 1, "anon": "true"},
+                )
+            except requests.exceptions.RequestException as e:
+                # The client adapter already retried the transport failure.
+                self.logger.warning(f" Error de red en {repo_name}: {e}")
+                return None
+
+            if response.status_code == 200:
+                break
+            if response.status_code == 403:
+                if self.esperar_rate_limit(response):
+                    continue
+                self.logger.warning(" Rate limit en %s, esperando backoff...", repo_name)
+                time.sleep(HTTP_RETRY_BACKOFF_SECONDS * (attempt + 1))
+            else:
+                self.logger.error(f" Error en {repo_name}: {response.status_code}")
+                return None
+
+        if response is None or response.status_code != 200:
+            return None
+
+        contributors = len(response.json())
+        link_header = response.headers.get("Link", "")
+        if "last" in link_header:
+            match = re.search(r'page=(\d+)>; rel="last"', link_header)
+            if match:
+                contributors = int(match.group(1))
+        return contributors
+
     def analizar_correlacion(self):
-        """Analiza la correlación entre Stars y Contributors."""
+        """Analiza la correlación entre Stars y Contributors.
+
+        Las consultas de contributors se ejecutan con concurrencia acotada
+        (GITHUB_MAX_CONCURRENCY); el scheduler de rate limit del cliente
+        HTTP mantiene el presupuesto de la API.
+        """
         self.logger.info("PREGUNTA 3: Analizando correlacion Stars vs Contributors...")
 
         if self.df_repos is None or self.df_repos.empty:
             raise ETLValidationError("DataFrame de repos vacio, no se puede analizar correlacion")
 
-        correlacion_data = []
-        total = min(100, len(self.df_repos))
-
-        count = 0
-        for _, row in self.df_repos.head(total).iterrows():
-            count += 1
-            repo_name = row["repo_name"]
-            self.logger.info(f"  [{count}/{total}] {repo_name}...")
-
-            max_retries = HTTP_MAX_RETRIES
-            success = False
-            response = None
-
-            for attempt in range(max_retries):
-                try:
-                    response = requests.get(
-                        f"{GITHUB_API_BASE}/repos/{repo_name}/contributors",
-                        headers=GITHUB_HEADERS,
-                        params={"per_page": 1, "anon": "true"},
-                        timeout=REQUEST_TIMEOUT_SECONDS
-                    )
+        total = min(GITHUB_CORRELATION_MAX_REPOS, len(self.df_repos))
+        rows = self.df_repos.head(total).to_dict("records")
+        self.logger.info(
+            "  Consultando contributors de %s repos (concurrencia=%s)...",
+            total,
+            GITHUB_MAX_CONCURRENCY,
+        )
 
-                    if response.status_code == 200:
-                        success = True
-                        break
-                    elif response.status_code == 403:
-                        if self.esperar_rate_limit(response):
-                            continue
-                        else:
-                            self.logger.warning(" Rate limit, esperando backoff...")
-                            time.sleep(HTTP_RETRY_BACKOFF_SECONDS * (attempt + 1))
-                    else:
-                        self.logger.error(f" Error: {response.status_code}")
-                        break
-                except requests.exceptions.RequestException as e:
-                    self.logger.warning(f" Error de red, reintento {attempt + 1}/{max_retries}: {e}")
-                    time.sleep(HTTP_RETRY_BACKOFF_SECONDS * (attempt + 1))
-
-            if success and response:
-                contributors = len(response.json())
-
-                link_header = response.headers.get("Link", "")
-                if "last" in link_header:
-                    match = re.search(r'page=(\d+)>; rel="last"', link_header)
-                    if match:
-                        contributors = int(match.group(1))
-
-                correlacion_data.append({
-                    "repo_name": repo_name,
-                    "stars": row["stars"],
-                    "contributors": contributors,
-                    "language": row["language"]
-                })
-                self.logger.info(f"    {contributors} contributors")
+        def _lookup(indexed_row):
+            index, row = indexed_row
+            contributors = self._fetch_contributors_count(row["repo_name"])
+            if contributors is None:
+                self.logger.warning(f"  [{index}/{total}] {row['repo_name']}: no se pudo obtener contributors")
             else:
-                self.logger.warning("    No se pudo obtener contributors")
-                correlacion_data.append({
-                    "repo_name": repo_name,
-                    "stars": row["stars"],
-                    "contributors": 0,
-                    "language": row["language"]
-                })
+                self.logger.info(f"  [{index}/{total}] {row['repo_name']}: {contributors} contributors")
+            return contributors
 
-            time.sleep(REQUEST_SHORT_DELAY_SECONDS)
+        contributors_by_row = map_bounded(
+            _lookup,
+            enumerate(rows, start=1),
+            GITHUB_MAX_CONCURRENCY,
+        )
+
+        correlacion_data = [
+            {
+                "repo_name": row["repo_name"],
+                "stars": row["stars"],
+                "contributors": contributors or 0,
+                "language": row["language"],
+            }
+            for row, contributors in zip(rows, contributors_by_row)
+        ]
 
         df_correlacion, correlacion = self._build_correlation_dataframe(correlacion_data)
 
@@ -935,9 +1578,20 @@ class GitHubETL(BaseETL):
         self.guardar_csv(df_correlacion, "github_correlacion")
 
 
-def main():
+def _build_parser():
+    parser = argparse.ArgumentParser(description="ETL de GitHub")
+    parser.add_argument(
+        "--resume",
+        action="store_true",
+        help="Reanuda la extraccion de repos desde el ultimo checkpoint en datos/metadata.",
+    )
+    return parser
+
+
+def main(argv=None):
     """Punto de entrada para el pipeline ETL de GitHub."""
-    etl = GitHubETL()
+    args = _build_parser().parse_args(argv)
+    etl = GitHubETL(resume=args.resume)
     etl.ejecutar()
 
 
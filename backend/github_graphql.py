@@ -0,0 +1,165 @@
+"""Batched GitHub GraphQL lookups for per-repo metrics.
+
+One GraphQL document carries dozens of aliased ``repository``/``search``
+fields, so metrics that cost one REST call per repo (stars refresh, merged
+PR and closed issue counts, releases) are fetched in a handful of queries.
+Fields GraphQL cannot answer (contributor counts, releases beyond the first
+page) are returned as None so the ETL falls back to REST for them.
+"""
+
+from __future__ import annotations
+
+import json
+
+import pandas as pd
+import requests
+
+from config.settings import GITHUB_GRAPHQL_URL, GITHUB_GRAPHQL_BATCH_SIZE
+
+
+RELEASES_PAGE_SIZE = 100
+
+
+def _literal(value):
+    """Returns ``value`` as a GraphQL string literal."""
+    return json.dumps(str(value))
+
+
+def _split_repo(repo_path):
+    owner, _, name = str(repo_path).partition("/")
+    return owner, name
+
+
+def _batches(items, size):
+    items = list(items)
+    for start in range(0, len(items), max(1, size)):
+        yield start, items[start:start + size]
+
+
+class GitHubGraphQLBackend:
+    """Runs aliased GraphQL batches through the GitHub HTTP client.
+
+    Args:
+        http: ``http_client.SourceHttpClient`` authenticated for GitHub.
+        logger: Logger of the calling ETL.
+        batch_size: Repositories per GraphQL document.
+    """
+
+    def __init__(self, http, logger, batch_size=GITHUB_GRAPHQL_BATCH_SIZE):
+        self.http = http
+        self.logger = logger
+        self.batch_size = batch_size
+        self.queries_sent = 0
+
+    def execute(self, query):
+        """Posts one GraphQL document and returns ``(data, alias_errors)``.
+
+        ``data`` is None on failure. Partial errors (e.g. a repository that
+        no longer exists) null their alias while the remaining aliases are
+        still returned; ``alias_errors`` maps each failed alias to its error
+        type (``NOT_FOUND``, ``FORBIDDEN``, ...).
+        """
+        try:
+            response = self.http.post(GITHUB_GRAPHQL_URL, json={"query": query})
+        except requests.exceptions.RequestException as exc:
+            self.logger.warning("Error de red en query GraphQL: %s", exc)
+            return None, {}
+        self.queries_sent += 1
+
+        if response.status_code != 200:
+            self.logger.warning("Query GraphQL fallo (status=%s)", response.status_code)
+            return None, {}
+        try:
+            payload = response.json()
+        except ValueError:
+            self.logger.warning("Respuesta GraphQL no es JSON valido")
+            return None, {}
+
+        alias_errors = {}
+        for error in payload.get("errors") or []:
+            if error.get("type") != "NOT_FOUND":
+                self.logger.warning("Error GraphQL: %s", error.get("message"))
+            path = error.get("path") or []
+            if path:
+                alias_errors[str(path[0])] = error.get("type")
+        return payload.get("data"), alias_errors
+
+    def fetch_repo_counts(self, repo_names):
+        """Returns ``{repo: {"stars", "forks"}}`` for the given repositories.
+
+        Repos that no longer exist (``NOT_FOUND``) map to ``{}``; repos of a
+        failed batch or nulled by any other error (``FORBIDDEN``, timeouts,
+        rate limits) are omitted so the caller can treat them as unknown.
+        """
+        results = {}
+        for offset, batch in _batches(repo_names, self.batch_size):
+            fields = []
+            for index, repo_name in enumerate(batch):
+                owner, name = _split_repo(repo_name)
+                fields.append(
+                    f"r{index}: repository(owner: {_literal(owner)}, name: {_literal(name)}) "
+                    "{ stargazerCount forkCount }"
+                )
+            data, alias_errors = self.execute("query { " + " ".join(fields) + " }")
+            if data is None:
+                self.logger.warning(
+                    "Lote GraphQL de repos %s-%s sin datos",
+                    offset + 1,
+                    offset + len(batch),
+                )
+                continue
+            for index, repo_name in enumerate(batch):
+                node = data.get(f"r{index}")
+                if node:
+                    results[repo_name] = {"stars": node["stargazerCount"], "forks": node["forkCount"]}
+                elif alias_errors.get(f"r{index}") == "NOT_FOUND":
+                    results[repo_name] = {}
+        return results
+
+    def fetch_framework_activity(self, repo_paths, since_date, until_date, since_iso):
+        """Returns merged PRs, closed issues and releases per repository.
+
+        Values GraphQL could not resolve are None (REST fallback): a failed
+        batch, or more than one page of releases inside the window.
+        """
+        since_ref = pd.to_datetime(since_iso, errors="coerce", utc=True)
+        results = {}
+        for _, batch in _batches(repo_paths, self.batch_size):
+            fields = []
+            for index, repo_path in enumerate(batch):
+                owner, name = _split_repo(repo_path)
+                fields.append(
+                    f"r{index}: repository(owner: {_literal(owner)}, name: {_literal(name)}) {{ "
+                    f"releases(first: {RELEASES_PAGE_SIZE}, orderBy: {{field: CREATED_AT, direction: DESC}}) "
+                    "{ pageInfo { hasNextPage } nodes { publishedAt } } }"
+                )
+                merged_q = f"repo:{repo_path} is:pr is:merged merged:{since_date}..{until_date}"
+                closed_q = f"repo:{repo_path} is:issue closed:{since_date}..{until_date}"
+                fields.append(f"p{index}: search(query: {_literal(merged_q)}, type: ISSUE, first: 1) {{ issueCount }}")
+                fields.append(f"i{index}: search(query: {_literal(closed_q)}, type: ISSUE, first: 1) {{ issueCount }}")
+
+            data, _ = self.execute("query { " + " ".join(fields) + " }")
+            data = data or {}
+            for index, repo_path in enumerate(batch):
+                merged = data.get(f"p{index}")
+                closed = data.get(f"i{index}")
+                results[repo_path] = {
+                    "merged_prs": int(merged["issueCount"]) if merged else None,
+                    "closed_issues": int(closed["issueCount"]) if closed else None,
+                    "releases_count": self._count_releases(data.get(f"r{index}"), since_ref),
+                }
+        return results
+
+    @staticmethod
+    def _count_releases(repository, since_ref):
+        if not repository or pd.isna(since_ref):
+            return None
+        releases = repository.get("releases") or {}
+        published = [
+            pd.to_datetime(node.get("publishedAt"), errors="coerce", utc=True)
+            for node in releases.get("nodes") or []
+        ]
+        count = sum(1 for value in published if not pd.isna(value) and value >= since_ref)
+        if count == len(published) and (releases.get("pageInfo") or {}).get("hasNextPage"):
+            return None
+        return count
@@ -0,0 +1,90 @@
+"""Columnar (Parquet) copies of the ETL history snapshots.
+
+With ``DATA_WRITE_HISTORY_PARQUET=1`` every history CSV written by
+``BaseETL.guardar_csv`` gets a sibling ``.parquet`` file in the same hive
+partition (``datos/history/<dataset>/year=/month=/day=``). Column dtypes
+come from ``CSV_SCHEMA_CONTRACT`` so readers get typed columns without
+re-parsing text. Readers go through ``read_snapshot``, which prefers the
+Parquet copy and falls back to the CSV when it is missing, older than the
+CSV or pyarrow is not installed. The CSV stays the source of truth for the
+history index and the published paths.
+"""
+
+from __future__ import annotations
+
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+from config.csv_contract import get_column_types
+
+try:
+    import pyarrow  # noqa: F401  pylint: disable=unused-import
+except ImportError:  # pragma: no cover - depends on the installed extras
+    pyarrow = None
+
+
+def parquet_available():
+    """True when pyarrow is installed and Parquet can be read or written."""
+    return pyarrow is not None
+
+
+def parquet_path_for(csv_path):
+    """Returns the Parquet sibling of a history CSV path."""
+    return Path(csv_path).with_suffix(".parquet")
+
+
+# Text columns use the NaN-backed string dtype that ``read_csv`` produces, so
+# missing cells read back as NaN (not ``pd.NA``) and ``str(x or "")`` works.
+_TEXT_DTYPE = pd.StringDtype(na_value=np.nan)
+
+
+def _coerce_column(series, column_type):
+    """Casts a column to the plain dtype ``read_csv`` would infer for its contract type."""
+    if column_type == "integer":
+        numeric = pd.to_numeric(series, errors="coerce")
+        if numeric.isna().any() or (numeric.dropna() % 1 != 0).any():
+            return numeric.astype("float64")
+        return numeric.astype("int64")
+    if column_type == "number":
+        return pd.to_numeric(series, errors="coerce").astype("float64")
+    # Datetimes stay ISO-8601 text so readers see the same values as in the CSV.
+    if column_type in {"string", "datetime"}:
+        return series.astype(_TEXT_DTYPE)
+    return series
+
+
+def contract_frame(df, nombre_archivo):
+    """Returns a copy of ``df`` with the dtypes declared in the CSV contract."""
+    working = df.copy()
+    for column, column_type in get_column_types(nombre_archivo).items():
+        if column in working.columns:
+            working[column] = _coerce_column(working[column], column_type)
+    return working
+
+
+def write_parquet(df, nombre_archivo, csv_path, compression="zstd"):
+    """Writes the typed Parquet copy next to ``csv_path`` and returns its path."""
+    if pyarrow is None:
+        raise RuntimeError("pyarrow no esta instalado; no se puede escribir Parquet")
+    ruta = parquet_path_for(csv_path)
+    ruta.parent.mkdir(parents=True, exist_ok=True)
+    contract_frame(df, nombre_archivo).to_parquet(
+        ruta, engine="pyarrow", compression=compression, index=False
+    )
+    return ruta
+
+
+def read_snapshot(csv_path):
+    """Reads a snapshot, preferring its up-to-date Parquet copy over the CSV."""
+    csv_path = Path(csv_path)
+    ruta_parquet = parquet_path_for(csv_path)
+    if pyarrow is not None and ruta_parquet.exists():
+        csv_mtime = csv_path.stat().st_mtime if csv_path.exists() else None
+        if csv_mtime is None or ruta_parquet.stat().st_mtime >= csv_mtime:
+            try:
+                return pd.read_parquet(ruta_parquet, engine="pyarrow")
+            except Exception:  # pylint: disable=broad-exception-caught
+                pass
+    return pd.read_csv(csv_path)
@@ -0,0 +1,199 @@
+"""Persistent conditional-request cache for ETL HTTP responses.
+
+Responses that carry validators (``ETag``/``Last-Modified``) are stored on
+disk keyed by the full request URL (including query params). The next GET
+for the same URL sends ``If-None-Match``/``If-Modified-Since``; a ``304``
+is answered with the stored body and does not count against the GitHub
+rate limit. Entries still fresh per ``Cache-Control: max-age`` are served
+without touching the network. The cache is size-capped with LRU eviction.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import re
+import threading
+import time
+from pathlib import Path
+
+import requests
+from requests.structures import CaseInsensitiveDict
+
+
+CACHED_HEADERS = (
+    "Content-Type",
+    "ETag",
+    "Last-Modified",
+    "Cache-Control",
+    "Link",
+)
+
+_MAX_AGE_PATTERN = re.compile(r"max-age=(\d+)")
+
+
+def _max_age_seconds(cache_control):
+    match = _MAX_AGE_PATTERN.search(str(cache_control or ""))
+    return int(match.group(1)) if match else 0
+
+
+class HttpResponseCache:
+    """Size-capped on-disk cache of validated GET responses.
+
+    Args:
+        cache_dir: Directory holding ``<key>.json`` metadata and
+            ``<key>.body`` payload files.
+        max_bytes: Total payload budget; least recently used entries are
+            evicted once it is exceeded.
+    """
+
+    def __init__(self, cache_dir, max_bytes, clock=time.time):
+        self.cache_dir = Path(cache_dir)
+        self.max_bytes = max(0, int(max_bytes))
+        self._clock = clock
+        self._lock = threading.Lock()
+        self.stats = {"hits": 0, "misses": 0, "not_modified": 0}
+        self._sizes = None
+
+    @staticmethod
+    def key_for(url, params=None):
+        """Returns the cache key for a GET request URL and its params."""
+        prepared = requests.Request("GET", url, params=params).prepare()
+        return hashlib.sha256(prepared.url.encode("utf-8")).hexdigest()
+
+    def _meta_path(self, key):
+        return self.cache_dir / f"{key}.json"
+
+    def _body_path(self, key):
+        return self.cache_dir / f"{key}.body"
+
+    def _load_sizes(self):
+        if self._sizes is not None:
+            return
+        self._sizes = {}
+        if not self.cache_dir.exists():
+            return
+        for body_path in self.cache_dir.glob("*.body"):
+            try:
+                self._sizes[body_path.stem] = body_path.stat().st_size
+            except OSError:
+                continue
+
+    def _touch(self, path):
+        now = self._clock()
+        try:
+            os.utime(path, (now, now))
+        except OSError:
+            pass
+
+    def lookup(self, key):
+        """Returns the stored entry for ``key`` or None, marking it as recently used."""
+        with self._lock:
+            meta_path = self._meta_path(key)
+            body_path = self._body_path(key)
+            try:
+                meta = json.loads(meta_path.read_text(encoding="utf-8"))
+                body = body_path.read_bytes()
+            except (OSError, ValueError):
+                return None
+            self._touch(meta_path)
+            meta["body"] = body
+            return meta
+
+    def is_fresh(self, entry):
+        """Returns True while the entry is within its ``max-age`` window."""
+        max_age = _max_age_seconds(entry.get("headers", {}).get("Cache-Control"))
+        return max_age > 0 and (self._clock() - float(entry.get("stored_at", 0))) < max_age
+
+    @staticmethod
+    def conditional_headers(entry):
+        """Builds the revalidation headers for a stored entry."""
+        headers = {}
+        stored = entry.get("headers", {})
+        if stored.get("ETag"):
+            headers["If-None-Match"] = stored["ETag"]
+        if stored.get("Last-Modified"):
+            headers["If-Modified-Since"] = stored["Last-Modified"]
+        return headers
+
+    def store(self, key, response):
+        """Persists a 200 response when it carries validators."""
+        headers = getattr(response, "headers", {}) or {}
+        if response.status_code != 200 or not (headers.get("ETag") or headers.get("Last-Modified")):
+            return False
+
+        body = response.content
+        meta = {
+            "url": response.url,
+            "stored_at": self._clock(),
+            "headers": {name: headers[name] for name in CACHED_HEADERS if headers.get(name)},
+        }
+        with self._lock:
+            self._load_sizes()
+            self.cache_dir.mkdir(parents=True, exist_ok=True)
+            self._body_path(key).write_bytes(body)
+            self._meta_path(key).write_text(json.dumps(meta), encoding="utf-8")
+            self._touch(self._meta_path(key))
+            self._sizes[key] = len(body)
+            self._evict()
+        return True
+
+    def refresh(self, key, entry, response):
+        """Updates validators and timestamp of an entry revalidated with a 304."""
+        headers = getattr(response, "headers", {}) or {}
+        meta = {key_: value for key_, value in entry.items() if key_ != "body"}
+        meta["stored_at"] = self._clock()
+        for name in CACHED_HEADERS:
+            if headers.get(name):
+                meta["headers"][name] = headers[name]
+        with self._lock:
+            try:
+                self._meta_path(key).write_text(json.dumps(meta), encoding="utf-8")
+            except OSError:
+                return
+            self._touch(self._meta_path(key))
+
+    def _evict(self):
+        total = sum(self._sizes.values())
+        if total <= self.max_bytes:
+            return
+
+        def _last_used(key):
+            try:
+                return self._meta_path(key).stat().st_mtime
+            except OSError:
+                return 0.0
+
+        for key in sorted(self._sizes, key=_last_used):
+            if total <= self.max_bytes:
+                break
+            total -= self._sizes.pop(key)
+            for path in (self._meta_path(key), self._body_path(key)):
+                try:
+                    path.unlink()
+                except OSError:
+                    pass
+
+    @staticmethod
+    def build_response(entry, network_response=None):
+        """Returns a ``requests.Response`` rebuilt from a stored entry.
+
+        Headers of the 304 (e.g. current rate-limit budget) are layered on
+        top of the stored ones so callers see an ordinary 200 response.
+        """
+        response = requests.Response()
+        response.status_code = 200
+        response._content = entry["body"]  # pylint: disable=protected-access
+        response.url = entry.get("url", "")
+        response.encoding = "utf-8"
+        headers = CaseInsensitiveDict(entry.get("headers", {}))
+        if network_response is not None:
+            headers.update(getattr(network_response, "headers", {}) or {})
+        response.headers = headers
+        return response
+
+    def record(self, outcome):
+        """Increments one of the ``hits``/``misses``/``not_modified`` counters."""
+        with self._lock:
+            self.stats[outcome] += 1
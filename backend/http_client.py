@@ -0,0 +1,172 @@
+"""Shared HTTP client layer for the ETL sources.
+
+Every source (GitHub, StackOverflow, Reddit) gets one pooled
+``requests.Session`` so repeated calls reuse keep-alive connections per host
+instead of paying a new TCP+TLS handshake on every request. Transient
+transport failures share one retry/backoff policy mounted on the adapter.
+An optional ``rate_limit`` scheduler paces requests from the budget the
+API reports instead of fixed sleeps; 403/429 semantics stay in the ETLs.
+An optional ``http_cache`` store turns repeated GETs into conditional
+requests answered from disk.
+"""
+
+from __future__ import annotations
+
+import threading
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+from config.settings import (
+    REQUEST_TIMEOUT_SECONDS,
+    HTTP_MAX_RETRIES,
+    HTTP_RETRY_BACKOFF_SECONDS,
+    HTTP_POOL_CONNECTIONS,
+    HTTP_POOL_MAXSIZE,
+    HTTP_CACHE_ENABLED,
+    HTTP_CACHE_DIR,
+    HTTP_CACHE_MAX_BYTES,
+)
+from http_cache import HttpResponseCache
+
+
+RETRY_STATUS_CODES = (502, 503, 504)
+
+
+def build_retry_policy(retries=HTTP_MAX_RETRIES):
+    """Returns the transport retry policy shared by all sources.
+
+    Sources that keep their own retry loop pass ``retries=0`` so a failing
+    call is not retried by both layers.
+    """
+    return Retry(
+        total=retries,
+        connect=retries,
+        read=retries,
+        status=retries,
+        backoff_factor=HTTP_RETRY_BACKOFF_SECONDS / 2,
+        status_forcelist=RETRY_STATUS_CODES,
+        respect_retry_after_header=True,
+        raise_on_status=False,
+    )
+
+
+class SourceHttpClient:
+    """Pooled HTTP client bound to one data source.
+
+    Args:
+        source: Logical source name (e.g. 'github').
+        default_headers: Headers sent with every request of this source.
+        scheduler: Optional ``rate_limit.RateLimitScheduler`` for the API.
+        cache: Optional ``http_cache.HttpResponseCache`` for GET requests.
+        retries: Adapter retries for transport errors and 502/503/504.
+    """
+
+    def __init__(self, source, default_headers=None, scheduler=None, cache=None,
+                 retries=HTTP_MAX_RETRIES):
+        self.source = source
+        self.scheduler = scheduler
+        self.cache = cache
+        self.session = requests.Session()
+        adapter = HTTPAdapter(
+            pool_connections=HTTP_POOL_CONNECTIONS,
+            pool_maxsize=HTTP_POOL_MAXSIZE,
+            max_retries=build_retry_policy(retries),
+        )
+        self.session.mount("https://", adapter)
+        self.session.mount("http://", adapter)
+        self.set_default_headers(default_headers)
+
+    def set_default_headers(self, headers):
+        """Replaces the source default headers (e.g. after an OAuth exchange)."""
+        self.session.headers.clear()
+        self.session.headers.update(requests.utils.default_headers())
+        self.session.headers.update(dict(headers or {}))
+
+    def request(self, method, url, **kwargs):
+        """Sends a request through the pooled session with the shared timeout."""
+        kwargs.setdefault("timeout", REQUEST_TIMEOUT_SECONDS)
+        if self.scheduler is not None:
+            self.scheduler.acquire(url)
+        response = self.session.request(method, url, **kwargs)
+        if self.scheduler is not None:
+            self.scheduler.observe(url, response)
+        return response
+
+    def get(self, url, **kwargs):
+        """Sends a GET request, revalidating against the cache when enabled.
+
+        Streaming requests bypass the cache.
+        """
+        if self.cache is None or kwargs.get("stream"):
+            return self.request("GET", url, **kwargs)
+
+        key = self.cache.key_for(url, kwargs.get("params"))
+        entry = self.cache.lookup(key)
+        if entry is not None and self.cache.is_fresh(entry):
+            self.cache.record("hits")
+            return self.cache.build_response(entry)
+
+        if entry is not None:
+            kwargs["headers"] = {
+                **self.cache.conditional_headers(entry),
+                **(kwargs.get("headers") or {}),
+            }
+
+        response = self.request("GET", url, **kwargs)
+        if response.status_code == 304 and entry is not None:
+            self.cache.record("not_modified")
+            self.cache.refresh(key, entry, response)
+            return self.cache.build_response(entry, response)
+
+        self.cache.record("misses")
+        if response.status_code == 200:
+            self.cache.store(key, response)
+        return response
+
+    def post(self, url, **kwargs):
+        """Sends a POST request through the pooled session."""
+        return self.request("POST", url, **kwargs)
+
+    def close(self):
+        """Releases pooled connections."""
+        self.session.close()
+
+
+_CLIENTS = {}
+_CLIENTS_LOCK = threading.Lock()
+
+
+def build_response_cache(source):
+    """Returns the on-disk response cache for a source, or None when disabled."""
+    if not HTTP_CACHE_ENABLED:
+        return None
+    return HttpResponseCache(HTTP_CACHE_DIR / source, HTTP_CACHE_MAX_BYTES)
+
+
+def get_http_client(source, default_headers=None, scheduler=None, cache=None,
+                    retries=HTTP_MAX_RETRIES):
+    """Returns the process-wide client for a source, creating it on first use.
+
+    When ``default_headers`` is given for an existing client its headers are
+    refreshed, so the pool is reused while credentials can still change.
+    ``scheduler``, ``cache`` and ``retries`` are only applied when the client
+    is created.
+    """
+    with _CLIENTS_LOCK:
+        client = _CLIENTS.get(source)
+        if client is None:
+            client = SourceHttpClient(source, default_headers, scheduler, cache, retries)
+            _CLIENTS[source] = client
+        elif default_headers is not None:
+            client.set_default_headers(default_headers)
+        return client
+
+
+def close_http_clients():
+    """Closes and forgets every registered client."""
+    with _CLIENTS_LOCK:
+        for client in _CLIENTS.values():
+            client.close()
+        _CLIENTS.clear()
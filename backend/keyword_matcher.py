@@ -0,0 +1,91 @@
+"""Single-pass multi-keyword matching for Reddit topics and frameworks.
+
+All keywords of a matcher are compiled into one case-insensitive
+alternation wrapped in a lookahead, so one ``finditer`` scan reports every
+keyword occurrence, overlapping ones included. Word boundaries follow the
+per-keyword rule the ETL always used: plain ``[a-z0-9_]`` keywords must not
+touch another ``[a-z0-9_]`` character, any other keyword must not touch a
+``\\w`` character.
+"""
+
+from __future__ import annotations
+
+import re
+from functools import lru_cache
+
+import pandas as pd
+
+
+_PLAIN_KEYWORD = re.compile(r"[a-z0-9_]+")
+
+
+def _normalize(keyword):
+    return str(keyword).strip().lower()
+
+
+def bounded_pattern(keyword):
+    """Returns the boundary-wrapped pattern of one normalized keyword."""
+    if _PLAIN_KEYWORD.fullmatch(keyword):
+        return rf"(?<![a-z0-9_]){re.escape(keyword)}(?![a-z0-9_])"
+    return rf"(?<!\w){re.escape(keyword)}(?!\w)"
+
+
+@lru_cache(maxsize=1024)
+def compile_keyword(keyword):
+    """Returns the compiled single-keyword pattern (None for blank keywords)."""
+    keyword = _normalize(keyword)
+    if not keyword:
+        return None
+    return re.compile(bounded_pattern(keyword), flags=re.IGNORECASE)
+
+
+class KeywordMatcher:
+    """Maps texts to the labels whose keywords they mention.
+
+    Args:
+        groups: ``{label: [keywords]}``; label order is kept in the output.
+    """
+
+    def __init__(self, groups):
+        self.labels = list(groups)
+        self._labels_by_keyword = {}
+        for label, keywords in groups.items():
+            for keyword in keywords:
+                keyword = _normalize(keyword)
+                if keyword:
+                    self._labels_by_keyword.setdefault(keyword, []).append(label)
+
+        # Longest first so the alternation reports the longest keyword at a
+        # position; shorter keywords starting there are checked via _prefixes.
+        keywords = sorted(self._labels_by_keyword, key=lambda kw: (-len(kw), kw))
+        self._pattern = re.compile(
+            "(?=(" + "|".join(bounded_pattern(keyword) for keyword in keywords) + "))",
+            flags=re.IGNORECASE,
+        ) if keywords else None
+        self._prefixes = {
+            keyword: [other for other in keywords if other != keyword and keyword.startswith(other)]
+            for keyword in keywords
+        }
+
+    def labels_in(self, text):
+        """Returns the set of labels mentioned in ``text`` (one scan)."""
+        if self._pattern is None or not text:
+            return set()
+        text = str(text).lower()
+        labels = set()
+        for match in self._pattern.finditer(text):
+            keyword = match.group(1)
+            labels.update(self._labels_by_keyword.get(keyword, ()))
+            for prefix in self._prefixes.get(keyword, ()):
+                if compile_keyword(prefix).match(text, match.start()):
+                    labels.update(self._labels_by_keyword[prefix])
+        return labels
+
+    def match_frame(self, texts):
+        """Returns a boolean ``texts x labels`` frame for a whole text column."""
+        texts = pd.Series(texts, dtype="object").fillna("").astype(str)
+        hits = texts.map(self.labels_in)
+        return pd.DataFrame(
+            {label: hits.map(lambda found, label=label: label in found) for label in self.labels},
+            index=texts.index,
+        )
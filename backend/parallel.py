@@ -0,0 +1,60 @@
+"""Bounded parallel execution for I/O-bound ETL fetches.
+
+Workers share the pooled HTTP clients and their rate-limit schedulers, so
+concurrency only overlaps network latency; the API budget is still enforced
+by the scheduler buckets.
+"""
+
+from __future__ import annotations
+
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+
+def map_bounded(func, items, max_workers):
+    """Applies ``func`` to every item with at most ``max_workers`` threads.
+
+    Results keep the input order, so callers merge them deterministically.
+    With ``max_workers <= 1`` the items are processed serially in the
+    calling thread.
+    """
+    items = list(items)
+    if max_workers <= 1 or len(items) <= 1:
+        return [func(item) for item in items]
+    with ThreadPoolExecutor(max_workers=min(max_workers, len(items))) as executor:
+        return list(executor.map(func, items))
+
+
+class ConsecutiveFailureCircuit:
+    """Thread-safe breaker that opens after ``threshold`` failures in a row.
+
+    Any success resets the streak. Once open it stays open, so workers that
+    have not started yet can skip their remaining requests.
+    """
+
+    def __init__(self, threshold):
+        self.threshold = max(1, int(threshold))
+        self.failures = 0
+        self._open = False
+        self._lock = threading.Lock()
+
+    @property
+    def is_open(self):
+        with self._lock:
+            return self._open
+
+    def record_success(self):
+        with self._lock:
+            if not self._open:
+                self.failures = 0
+
+    def record_failure(self):
+        """Registers a failure and returns True when the circuit just opened."""
+        with self._lock:
+            if self._open:
+                return False
+            self.failures += 1
+            if self.failures >= self.threshold:
+                self._open = True
+                return True
+            return False
@@ -0,0 +1,280 @@
+"""Rate-limit-aware request scheduling for the ETL sources.
+
+Each API exposes its quota differently (GitHub ``X-RateLimit-*`` headers,
+StackExchange ``quota_remaining``/``backoff`` in the JSON body, Reddit
+``X-Ratelimit-*`` headers with a relative reset). A scheduler keeps one
+bucket per API resource, lets requests through immediately while the
+server-reported budget allows it and only waits when the budget is spent
+or the server explicitly asks for a backoff.
+"""
+
+from __future__ import annotations
+
+import re
+import threading
+import time
+from urllib.parse import urlparse
+
+from config.settings import RATE_LIMIT_MAX_WAIT_SECONDS
+
+
+def _to_float(value):
+    try:
+        return float(value)
+    except (TypeError, ValueError):
+        return None
+
+
+class RateLimitBucket:
+    """Thread-safe token bucket refilled when the quota window resets.
+
+    Args:
+        limit: Requests allowed per window before any server feedback.
+        window_seconds: Length of the quota window.
+        clock: Monotonic clock, injectable for tests.
+        sleep: Sleep function, injectable for tests.
+    """
+
+    def __init__(self, limit, window_seconds, clock=time.monotonic, sleep=time.sleep):
+        self.limit = max(1, int(limit))
+        self.window_seconds = max(0.001, float(window_seconds))
+        self._clock = clock
+        self._sleep = sleep
+        self._lock = threading.Lock()
+        self.tokens = float(self.limit)
+        self.reset_at = clock() + self.window_seconds
+        self.blocked_until = 0.0
+        self.waited_seconds = 0.0
+
+    def _refill(self, now):
+        if now >= self.reset_at:
+            self.tokens = float(self.limit)
+            self.reset_at = now + self.window_seconds
+
+    def acquire(self, max_wait_seconds=RATE_LIMIT_MAX_WAIT_SECONDS):
+        """Takes one token, sleeping until the budget allows it.
+
+        Returns:
+            float: Seconds spent waiting. When the required wait exceeds
+            ``max_wait_seconds`` the request is let through without a token
+            so the caller's own 403/429 handling can decide what to do.
+        """
+        waited = 0.0
+        while True:
+            with self._lock:
+                now = self._clock()
+                self._refill(now)
+                if now < self.blocked_until:
+                    wait = self.blocked_until - now
+                elif self.tokens >= 1:
+                    self.tokens -= 1
+                    self.waited_seconds += waited
+                    return waited
+                else:
+                    wait = self.reset_at - now
+                if waited + wait > max_wait_seconds:
+                    self.waited_seconds += waited
+                    return waited
+            self._sleep(wait)
+            waited += wait
+
+    def update_budget(self, remaining, reset_in_seconds=None, limit=None):
+        """Synchronizes the bucket with the budget reported by the server."""
+        with self._lock:
+            now = self._clock()
+            if limit is not None and limit > 0:
+                self.limit = int(limit)
+            if reset_in_seconds is not None and reset_in_seconds >= 0:
+                self.reset_at = now + reset_in_seconds
+            if remaining is not None:
+                self.tokens = max(0.0, float(remaining))
+
+    def block_for(self, seconds):
+        """Blocks the bucket for a server-mandated backoff."""
+        if seconds is None or seconds <= 0:
+            return
+        with self._lock:
+            self.blocked_until = max(self.blocked_until, self._clock() + seconds)
+
+
+class RateLimitScheduler:
+    """Base scheduler keeping one bucket per API resource.
+
+    Subclasses define the default quotas in ``BUCKETS`` as
+    ``{name: (limit, window_seconds)}`` and how to read the server budget.
+    """
+
+    BUCKETS = {"default": (60, 60.0)}
+
+    def __init__(self, buckets=None, clock=time.monotonic, sleep=time.sleep):
+        self._clock = clock
+        self._sleep = sleep
+        self.buckets = {
+            name: RateLimitBucket(limit, window, clock=clock, sleep=sleep)
+            for name, (limit, window) in (buckets or self.BUCKETS).items()
+        }
+
+    def bucket_for(self, url):
+        """Returns the bucket name a request URL draws from."""
+        return next(iter(self.buckets))
+
+    def acquire(self, url):
+        """Waits for budget on the bucket matching ``url``."""
+        return self.buckets[self.bucket_for(url)].acquire()
+
+    def observe(self, url, response):
+        """Updates the matching bucket from a response."""
+        bucket = self.buckets.get(self._response_bucket(url, response))
+        if bucket is None:
+            return
+        remaining, reset_in, limit = self._read_budget(response)
+        bucket.update_budget(remaining, reset_in, limit)
+        bucket.block_for(self._read_backoff(response))
+
+    @property
+    def waited_seconds(self):
+        """Total seconds spent waiting across buckets."""
+        return sum(bucket.waited_seconds for bucket in self.buckets.values())
+
+    def _response_bucket(self, url, _response):
+        return self.bucket_for(url)
+
+    def _read_budget(self, _response):
+        return None, None, None
+
+    def _read_backoff(self, response):
+        if getattr(response, "status_code", None) in (403, 429):
+            return _to_float(getattr(response, "headers", {}).get("Retry-After"))
+        return None
+
+
+class GitHubRateLimitScheduler(RateLimitScheduler):
+    """Scheduler for GitHub quotas (core, search and GraphQL are separate)."""
+
+    AUTHENTICATED_BUCKETS = {"core": (5000, 3600.0), "search": (30, 60.0), "graphql": (5000, 3600.0)}
+    ANONYMOUS_BUCKETS = {"core": (60, 3600.0), "search": (10, 60.0)}
+
+    def __init__(self, authenticated=True, **kwargs):
+        buckets = self.AUTHENTICATED_BUCKETS if authenticated else self.ANONYMOUS_BUCKETS
+        super().__init__(buckets=buckets, **kwargs)
+
+    def bucket_for(self, url):
+        if "/search/" in str(url):
+            return "search"
+        if str(url).endswith("/graphql") and "graphql" in self.buckets:
+            return "graphql"
+        return "core"
+
+    def _response_bucket(self, url, response):
+        resource = str(getattr(response, "headers", {}).get("X-RateLimit-Resource", "")).strip()
+        return resource if resource in self.buckets else self.bucket_for(url)
+
+    def _read_budget(self, response):
+        headers = getattr(response, "headers", {}) or {}
+        remaining = _to_float(headers.get("X-RateLimit-Remaining"))
+        reset_epoch = _to_float(headers.get("X-RateLimit-Reset"))
+        limit = _to_float(headers.get("X-RateLimit-Limit"))
+        reset_in = max(0.0, reset_epoch - time.time()) if reset_epoch else None
+        return remaining, reset_in, limit
+
+
+class RedditRateLimitScheduler(RateLimitScheduler):
+    """Scheduler for Reddit (600 req/10 min with OAuth, stricter without)."""
+
+    OAUTH_BUCKETS = {"api": (600, 600.0)}
+    PUBLIC_BUCKETS = {"api": (100, 600.0)}
+
+    def __init__(self, oauth=False, **kwargs):
+        super().__init__(buckets=self.OAUTH_BUCKETS if oauth else self.PUBLIC_BUCKETS, **kwargs)
+
+    def _read_budget(self, response):
+        headers = getattr(response, "headers", {}) or {}
+        remaining = _to_float(headers.get("X-Ratelimit-Remaining"))
+        reset_in = _to_float(headers.get("X-Ratelimit-Reset"))
+        used = _to_float(headers.get("X-Ratelimit-Used"))
+        limit = used + remaining if used is not None and remaining is not None else None
+        return remaining, reset_in, limit
+
+
+class StackExchangeRateLimitScheduler(RateLimitScheduler):
+    """Scheduler for the StackExchange API (30 req/s per IP plus daily quota).
+
+    The budget lives in the JSON body: ``backoff`` is a mandatory pause
+    before the next call to the same method (URL path) and
+    ``quota_remaining`` the daily quota left. A ``throttle_violation``
+    error (``error_id`` 502) blocks every method for the advertised time.
+    """
+
+    BUCKETS = {"api": (30, 1.0)}
+    THROTTLE_ERROR_ID = 502
+    _THROTTLE_SECONDS = re.compile(r"available in (\d+) seconds")
+
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        self.quota_remaining = None
+        self.quota_max = None
+        self._quota_start = None
+        self._method_lock = threading.Lock()
+        self._method_blocked_until = {}
+        self._method_waited = 0.0
+
+    @staticmethod
+    def method_for(url):
+        """Returns the API method a URL calls (its path, e.g. /2.3/search/advanced)."""
+        return urlparse(str(url)).path
+
+    @property
+    def quota_used(self):
+        """Daily quota consumed since the first observed response (None if unknown)."""
+        if self._quota_start is None or self.quota_remaining is None:
+            return None
+        return max(0, self._quota_start - self.quota_remaining)
+
+    @property
+    def waited_seconds(self):
+        return super().waited_seconds + self._method_waited
+
+    def acquire(self, url):
+        waited = 0.0
+        with self._method_lock:
+            blocked_until = self._method_blocked_until.get(self.method_for(url), 0.0)
+        wait = blocked_until - self._clock()
+        if 0 < wait <= RATE_LIMIT_MAX_WAIT_SECONDS:
+            self._sleep(wait)
+            waited = wait
+            with self._method_lock:
+                self._method_waited += wait
+        return waited + super().acquire(url)
+
+    def observe(self, url, response):
+        try:
+            payload = response.json()
+        except Exception:  # pylint: disable=broad-exception-caught
+            payload = {}
+        if not isinstance(payload, dict):
+            payload = {}
+
+        quota = _to_float(payload.get("quota_remaining"))
+        if quota is not None:
+            self.quota_remaining = int(quota)
+            if self._quota_start is None:
+                # The response that reports the quota already consumed one call.
+                self._quota_start = int(quota) + 1
+        quota_max = _to_float(payload.get("quota_max"))
+        if quota_max is not None:
+            self.quota_max = int(quota_max)
+
+        backoff = _to_float(payload.get("backoff"))
+        if backoff is not None and backoff > 0:
+            with self._method_lock:
+                method = self.method_for(url)
+                self._method_blocked_until[method] = max(
+                    self._method_blocked_until.get(method, 0.0),
+                    self._clock() + backoff,
+                )
+
+        bucket = self.buckets[self.bucket_for(url)]
+        if _to_float(payload.get("error_id")) == self.THROTTLE_ERROR_ID:
+            match = self._THROTTLE_SECONDS.search(str(payload.get("error_message", "")))
+            bucket.block_for(float(match.group(1)) if match else 1.0)
+        bucket.block_for(self._read_backoff(response))
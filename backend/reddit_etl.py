@@ -8,29 +8,42 @@ cross-platform con datos de GitHub.
 Autor: Mateo Mayorga
 """
 import pandas as pd
-from datetime import datetime
+from datetime import datetime, timedelta
 import os
 import requests
+import urllib3
 import warnings
 import time
 import re
 import html
 from defusedxml import ElementTree as ET
-from vaderSentiment.vaderSentiment import SentimentIntensityAnalyzer
 
 from config.settings import (
-    ARCHIVOS_SALIDA, REDDIT_SUBREDDIT, REDDIT_LIMIT,
+    ARCHIVOS_SALIDA, REDDIT_SUBREDDIT, REDDIT_LIMIT, REDDIT_MAX_CONCURRENCY,
     REDDIT_HEADERS, REDDIT_CLIENT_ID, REDDIT_CLIENT_SECRET,
     REDDIT_USER_AGENT,
-    REQUEST_TIMEOUT_SECONDS, HTTP_RETRY_BACKOFF_SECONDS,
-    REQUEST_PAGE_DELAY_SECONDS
+    REDDIT_POST_STORE_ENABLED, REDDIT_POST_STORE_PATH, REDDIT_ANALYSIS_WINDOW_DAYS,
+    REDDIT_SENTIMENT_CACHE_PATH, REDDIT_SENTIMENT_WORKERS,
+    INTERSECCION_TOP_GITHUB, INTERSECCION_TOP_REDDIT,
+    HTTP_RETRY_BACKOFF_SECONDS,
 )
 from exceptions import ETLExtractionError, ETLValidationError
 from base_etl import BaseETL
-from tech_normalization import normalize_for_match
+from http_client import build_response_cache
+from parallel import map_bounded
+from rate_limit import RedditRateLimitScheduler
+from keyword_matcher import KeywordMatcher, compile_keyword
+from reddit_store import RedditPostStore
+from sentiment_scoring import SentimentCache, score_texts, text_key
+from tech_normalization import TechMatchIndex
 
 warnings.filterwarnings("ignore")
 
+ATOM_NS = "http://www.w3.org/2005/Atom"
+ATOM_ENTRY_TAG = f"{{{ATOM_NS}}}entry"
+# Comments, tags and whitespace runs stripped in a single pass.
+_HTML_NOISE_PATTERN = re.compile(r"<!--.*?-->|<[^>]+>|\s+", re.DOTALL)
+
 
 def _env_float(name, default):
     """Read a positive float from the environment with a safe fallback."""
@@ -70,39 +83,64 @@ def _split_subreddit_targets(subreddit_name):
     return unique_targets or [subreddit_name]
 
 
+FRAMEWORKS_BACKEND = {
+    "Django": ["django", "python web"],
+    "FastAPI": ["fastapi"],
+    "Express": ["express", "node.js", "nodejs"],
+    "Spring": ["spring", "springboot", "spring boot", "java spring"],
+    "Laravel": ["laravel", "php"]
+}
+
+TEMAS_CLAVE = {
+    "IA/Machine Learning": ["ai", "artificial intelligence", "machine learning", "ml", "chatgpt", "llm", "neural", "gpt", "openai"],
+    "Cloud": ["cloud", "aws", "azure", "gcp", "google cloud", "kubernetes", "docker", "containerization"],
+    "Web3/Blockchain": ["web3", "blockchain", "cryptocurrency", "crypto", "ethereum", "bitcoin", "nft", "smart contract"],
+    "DevOps": ["devops", "ci/cd", "github actions", "gitlab", "jenkins", "deployment", "infrastructure"],
+    "Microservicios": ["microservices", "microservice", "rest api", "graphql"],
+    "Testing": ["testing", "unit test", "integration test", "e2e", "jest", "pytest"],
+    "Performance": ["performance", "optimization", "caching", "cdn", "latency", "speed"],
+    "Seguridad": ["security", "encryption", "authentication", "oauth", "jwt"],
+    "TypeScript": ["typescript"],
+    "Python": ["python", "django", "fastapi", "flask"]
+}
+
+
 class RedditETL(BaseETL):
     """Extractor ETL para datos de posts de Reddit."""
 
+    FRAMEWORK_MATCHER = KeywordMatcher(FRAMEWORKS_BACKEND)
+    TOPIC_MATCHER = KeywordMatcher(TEMAS_CLAVE)
+
     def __init__(self):
         super().__init__("reddit")
         self.df_posts = None
         self.df_temas = None
         self.access_token = None
         self.api_base = "https://www.reddit.com"  # fallback: API publica
-        self.headers = dict(REDDIT_HEADERS)
+        self.http = self._get_http_client(
+            "reddit",
+            REDDIT_HEADERS,
+            scheduler=RedditRateLimitScheduler(oauth=False),
+            cache=build_response_cache("reddit"),
+        )
+        self.api_http = self.http
+        self.post_store = (
+            RedditPostStore(REDDIT_POST_STORE_PATH) if REDDIT_POST_STORE_ENABLED else None
+        )
 
     @staticmethod
     def _coincide_keyword(texto, keyword):
         """Verifica presencia de keyword usando regex segura por limites."""
-        kw = keyword.strip().lower()
-        if not kw:
-            return False
-
-        if re.fullmatch(r"[a-z0-9_]+", kw):
-            patron = rf"(?<![a-z0-9_]){re.escape(kw)}(?![a-z0-9_])"
-        else:
-            patron = rf"(?<!\w){re.escape(kw)}(?!\w)"
-        return re.search(patron, texto, flags=re.IGNORECASE) is not None
+        patron = compile_keyword(keyword)
+        return patron is not None and patron.search(texto) is not None
 
     @staticmethod
     def _html_to_text(value):
         """Convierte contenido HTML básico de RSS a texto plano."""
         if not value:
             return ""
-        without_tags = re.sub(r"<[^>]+>", " ", value)
-        without_comments = re.sub(r"<!--.*?-->", " ", without_tags, flags=re.DOTALL)
-        normalized = html.unescape(without_comments)
-        return re.sub(r"\s+", " ", normalized).strip()
+        normalized = html.unescape(_HTML_NOISE_PATTERN.sub(" ", value))
+        return " ".join(normalized.split())
 
     @staticmethod
     def _parse_atom_datetime(value):
@@ -136,22 +174,25 @@ class RedditETL(BaseETL):
             data = {
                 "grant_type": "client_credentials",
             }
-            resp = requests.post(
+            resp = self.http.post(
                 "https://www.reddit.com/api/v1/access_token",
                 auth=auth,
                 data=data,
-                headers={"User-Agent": REDDIT_USER_AGENT},
-                timeout=REQUEST_TIMEOUT_SECONDS,
             )
             if resp.status_code == 200:
                 token_data = resp.json()
                 self.access_token = token_data.get("access_token")
                 if self.access_token:
                     self.api_base = "https://oauth.reddit.com"
-                    self.headers = {
-                        "Authorization": f"Bearer {self.access_token}",
-                        "User-Agent": REDDIT_USER_AGENT,
-                    }
+                    self.api_http = self._get_http_client(
+                        "reddit_oauth",
+                        {
+                            "Authorization": f"Bearer {self.access_token}",
+                            "User-Agent": REDDIT_USER_AGENT,
+                        },
+                        scheduler=RedditRateLimitScheduler(oauth=True),
+                        cache=build_response_cache("reddit_oauth"),
+                    )
                     self.logger.info(
                         "OAuth autenticado — usando oauth.reddit.com"
                     )
@@ -171,6 +212,7 @@ class RedditETL(BaseETL):
         return [
             ("Autenticacion OAuth", self._obtener_token_oauth),
             ("Extraccion de posts", self.extraer_posts),
+            ("Puntuacion de sentimiento", self.puntuar_sentimiento),
             ("Sentimiento de frameworks", self.analizar_sentimiento_frameworks),
             ("Temas emergentes", self.detectar_temas_emergentes),
             ("Interseccion GitHub-Reddit", self.interseccion_tecnologias),
@@ -195,29 +237,32 @@ class RedditETL(BaseETL):
                 "Se ejecutara en modo degradado (API publica)."
             )
 
-    def _extraer_posts_json(self, subreddit_name, limit):
-        """Extrae posts usando JSON API/OAuth de Reddit."""
+    def _extraer_posts_json(self, subreddit_name, limit, listing="hot", is_known=None):
+        """Extrae posts usando JSON API/OAuth de Reddit.
+
+        With ``is_known`` (used on the chronological ``new`` listing), paging
+        stops at the first post already present in the post store.
+        """
         posts_data = []
-        url = f"{self.api_base}/r/{subreddit_name}/hot.json"
+        url = f"{self.api_base}/r/{subreddit_name}/{listing}.json"
 
         after = None
         posts_obtenidos = 0
+        reached_known = False
 
-        while posts_obtenidos < limit:
+        while posts_obtenidos < limit and not reached_known:
             params = {
                 "limit": 100,
                 "after": after
             }
 
-            self.logger.info(f"  Descargando posts {posts_obtenidos + 1}-{min(posts_obtenidos + 100, limit)}...")
+            self.logger.info(
+                f"  r/{subreddit_name}: descargando posts "
+                f"{posts_obtenidos + 1}-{min(posts_obtenidos + 100, limit)}..."
+            )
 
             try:
-                response = requests.get(
-                    url,
-                    headers=self.headers,
-                    params=params,
-                    timeout=REQUEST_TIMEOUT_SECONDS,
-                )
+                response = self.api_http.get(url, params=params)
             except requests.exceptions.RequestException as e:
                 self.logger.error(f"  Error de red: {e}")
                 time.sleep(HTTP_RETRY_BACKOFF_SECONDS)
@@ -239,6 +284,11 @@ class RedditETL(BaseETL):
 
                 post_data = post.get("data", {})
 
+                if is_known is not None and is_known(post_data.get("id")):
+                    self.logger.info(f"  r/{subreddit_name}: alcanzados posts ya almacenados")
+                    reached_known = True
+                    break
+
                 if post_data.get("is_self"):
                     posts_data.append({
                         "post_id": post_data.get("id"),
@@ -256,10 +306,66 @@ class RedditETL(BaseETL):
             if not after:
                 break
 
-            time.sleep(REQUEST_PAGE_DELAY_SECONDS)
-
         return posts_data
 
+    def _parse_atom_entry(self, entry):
+        """Returns ``(key, post)`` for one Atom entry, or None if it is empty."""
+        namespace = {"atom": ATOM_NS}
+        post_id = (entry.findtext("atom:id", default="", namespaces=namespace) or "").strip()
+        title = (entry.findtext("atom:title", default="", namespaces=namespace) or "").strip()
+        content_html = entry.findtext("atom:content", default="", namespaces=namespace) or ""
+        published = (
+            entry.findtext("atom:published", default="", namespaces=namespace)
+            or entry.findtext("atom:updated", default="", namespaces=namespace)
+            or ""
+        )
+        author_name = "RSS"
+        author = entry.find("atom:author", namespace)
+        if author is not None:
+            author_name = (
+                author.findtext("atom:name", default="", namespaces=namespace)
+                or "RSS"
+            ).strip()
+
+        if not post_id:
+            link = entry.find("atom:link", namespace)
+            post_id = link.attrib.get("href", title) if link is not None else title
+
+        content = self._html_to_text(content_html)
+        if not title and not content:
+            return None
+
+        return post_id, {
+            "post_id": post_id.replace("t3_", ""),
+            "titulo": title,
+            "contenido": content,
+            "upvotes": 0,
+            "comentarios": 0,
+            "created_at": self._parse_atom_datetime(published),
+            "autor": author_name or "RSS",
+        }
+
+    def _iter_atom_posts(self, response):
+        """Streams the posts of an Atom feed response entry by entry.
+
+        Parsed entries are cleared from the tree right away, so memory stays
+        flat regardless of the feed size; the caller may stop at any point.
+        """
+        raw = response.raw
+        if hasattr(raw, "decode_content"):
+            raw.decode_content = True
+
+        root = None
+        for event, element in ET.iterparse(raw, events=("start", "end")):
+            if root is None:
+                root = element
+            if event != "end" or element.tag != ATOM_ENTRY_TAG:
+                continue
+            parsed = self._parse_atom_entry(element)
+            root.clear()
+            if parsed is not None:
+                yield parsed
+
     def _extraer_posts_rss(self, subreddit_name, limit):
         """Extrae posts publicos desde feeds Atom/RSS de Reddit como fallback."""
         feed_urls = [
@@ -278,19 +384,18 @@ class RedditETL(BaseETL):
             f"https://www.reddit.com/r/{subreddit_name}/controversial/.rss?t=year&limit=100",
             f"https://www.reddit.com/r/{subreddit_name}/controversial/.rss?t=all&limit=100",
         ]
-        namespace = {"atom": "http://www.w3.org/2005/Atom"}
         posts_by_id = {}
         max_attempts = _env_int("REDDIT_RSS_MAX_ATTEMPTS", 3)
+        # Public RSS feeds report no quota headers, so they keep a fixed pause.
         feed_delay_seconds = _env_float(
             "REDDIT_RSS_FEED_DELAY_SECONDS",
-            REQUEST_PAGE_DELAY_SECONDS,
+            2.0,
         )
         rate_limit_backoff_seconds = _env_float(
             "REDDIT_RSS_429_BACKOFF_SECONDS",
             90.0,
         )
         rss_headers = {
-            "User-Agent": REDDIT_USER_AGENT,
             "Accept": "application/atom+xml,application/xml;q=0.9,*/*;q=0.8",
         }
 
@@ -318,19 +423,17 @@ class RedditETL(BaseETL):
                     feed_url,
                 )
                 try:
-                    response = requests.get(
-                        feed_url,
-                        headers=rss_headers,
-                        timeout=REQUEST_TIMEOUT_SECONDS,
-                    )
+                    response = self.http.get(feed_url, headers=rss_headers, stream=True)
                 except requests.exceptions.RequestException as e:
+                    # Transport failures were already retried by the client adapter.
                     self.logger.error("  Error RSS: %s", e)
-                    time.sleep(HTTP_RETRY_BACKOFF_SECONDS * attempt)
-                    continue
+                    response = None
+                    break
 
                 if response.status_code == 200:
                     break
 
+                response.close()
                 if response.status_code == 429 and attempt < max_attempts:
                     retry_after = response.headers.get("Retry-After")
                     try:
@@ -351,50 +454,18 @@ class RedditETL(BaseETL):
                 continue
 
             try:
-                root = ET.fromstring(response.text)
+                for post_key, post in self._iter_atom_posts(response):
+                    posts_by_id[post_key] = post
+                    if len(posts_by_id) >= limit:
+                        break
             except ET.ParseError as e:
                 self.logger.error("  RSS invalido: %s", e)
-                continue
-
-            for entry in root.findall("atom:entry", namespace):
-                if len(posts_by_id) >= limit:
-                    break
-
-                post_id = (entry.findtext("atom:id", default="", namespaces=namespace) or "").strip()
-                title = (entry.findtext("atom:title", default="", namespaces=namespace) or "").strip()
-                content_html = entry.findtext("atom:content", default="", namespaces=namespace) or ""
-                content = self._html_to_text(content_html)
-                published = (
-                    entry.findtext("atom:published", default="", namespaces=namespace)
-                    or entry.findtext("atom:updated", default="", namespaces=namespace)
-                    or ""
-                )
-                author_name = "RSS"
-                author = entry.find("atom:author", namespace)
-                if author is not None:
-                    author_name = (
-                        author.findtext("atom:name", default="", namespaces=namespace)
-                        or "RSS"
-                    ).strip()
-
-                if not post_id:
-                    link = entry.find("atom:link", namespace)
-                    post_id = link.attrib.get("href", title) if link is not None else title
-
-                if not title and not content:
-                    continue
-
-                posts_by_id[post_id] = {
-                    "post_id": post_id.replace("t3_", ""),
-                    "titulo": title,
-                    "contenido": content,
-                    "upvotes": 0,
-                    "comentarios": 0,
-                    "created_at": self._parse_atom_datetime(published),
-                    "autor": author_name or "RSS",
-                }
-
-            time.sleep(REQUEST_PAGE_DELAY_SECONDS)
+            except (requests.exceptions.RequestException, urllib3.exceptions.HTTPError) as e:
+                # Reading response.raw surfaces urllib3 errors (ProtocolError,
+                # ReadTimeoutError) unwrapped; entries merged so far are kept.
+                self.logger.error("  Error RSS durante la descarga: %s", e)
+            finally:
+                response.close()
 
         posts_data = list(posts_by_id.values())[:limit]
         self.logger.info("Fallback RSS obtuvo %d posts", len(posts_data))
@@ -414,63 +485,86 @@ class RedditETL(BaseETL):
                 "REDDIT_PER_SUBREDDIT_LIMIT",
                 max(100, min(500, limit)),
             )
-            subreddit_delay_seconds = _env_float(
-                "REDDIT_SUBREDDIT_DELAY_SECONDS",
-                REQUEST_PAGE_DELAY_SECONDS,
-            )
             self.logger.info(
-                "Obteniendo hasta %d posts desde %d subreddits individuales...",
+                "Obteniendo hasta %d posts desde %d subreddits individuales (concurrencia %d)...",
                 limit,
                 len(targets),
+                REDDIT_MAX_CONCURRENCY,
             )
 
-            for target_index, target in enumerate(targets, start=1):
-                if len(posts_by_id) >= limit:
-                    break
-                if target_index > 1 and subreddit_delay_seconds > 0:
-                    self.logger.info(
-                        "Esperando %.1fs antes del siguiente subreddit...",
-                        subreddit_delay_seconds,
-                    )
-                    time.sleep(subreddit_delay_seconds)
-
+            # Waves of REDDIT_MAX_CONCURRENCY targets split the remaining budget,
+            # so the crawl stops near ``limit`` instead of asking every
+            # subreddit for ``per_target_limit`` posts.
+            posts_by_target = {}
+            for wave_start in range(0, len(targets), REDDIT_MAX_CONCURRENCY):
                 remaining = limit - len(posts_by_id)
-                target_limit = min(per_target_limit, remaining)
+                if remaining <= 0:
+                    break
+                wave = targets[wave_start:wave_start + REDDIT_MAX_CONCURRENCY]
+                target_limit = min(per_target_limit, -(-remaining // len(wave)))
                 self.logger.info(
-                    "Obteniendo posts de r/%s (%d/%d, limite %d)...",
-                    target,
-                    target_index,
-                    len(targets),
+                    "Obteniendo posts de %s (limite %d por subreddit)...",
+                    ", ".join(f"r/{target}" for target in wave),
                     target_limit,
                 )
+                posts_by_target.update(zip(
+                    wave,
+                    map_bounded(
+                        lambda target, cap=target_limit: self._extraer_posts_json(
+                            target, cap, **self._json_listing_options()
+                        ),
+                        wave,
+                        REDDIT_MAX_CONCURRENCY,
+                    ),
+                ))
+                fallback_targets = [target for target in wave if not posts_by_target[target]]
+                if fallback_targets:
+                    self.logger.info(
+                        "Fallback RSS para %d subreddits: %s",
+                        len(fallback_targets),
+                        ", ".join(f"r/{target}" for target in fallback_targets),
+                    )
+                    rss_posts = map_bounded(
+                        lambda target, cap=target_limit: self._extraer_posts_rss(target, cap),
+                        fallback_targets,
+                        REDDIT_MAX_CONCURRENCY,
+                    )
+                    posts_by_target.update(zip(fallback_targets, rss_posts))
 
-                target_posts = self._extraer_posts_json(target, target_limit)
-                if not target_posts:
-                    target_posts = self._extraer_posts_rss(target, target_limit)
-
-                for post in target_posts:
-                    post_id = str(post.get("post_id") or "").strip()
-                    if not post_id:
-                        post_id = f"{target}:{post.get('titulo', '')}"
-                    posts_by_id.setdefault(post_id, post)
+                # Merge in configured order so the result does not depend on timing.
+                for target in wave:
+                    for post in posts_by_target[target]:
+                        post_id = str(post.get("post_id") or "").strip()
+                        if not post_id:
+                            post_id = f"{target}:{post.get('titulo', '')}"
+                        posts_by_id.setdefault(post_id, post)
 
-                self.logger.info(
-                    "Acumulado Reddit: %d posts unicos",
-                    len(posts_by_id),
-                )
+                    self.logger.info(
+                        "Acumulado Reddit tras r/%s: %d posts unicos",
+                        target,
+                        len(posts_by_id),
+                    )
 
             posts_data = list(posts_by_id.values())[:limit]
         else:
             subreddit_name = targets[0]
             self.logger.info(f"Obteniendo posts de r/{subreddit_name}...")
 
-            posts_data = self._extraer_posts_json(subreddit_name, limit)
+            posts_data = self._extraer_posts_json(
+                subreddit_name, limit, **self._json_listing_options()
+            )
 
             if not posts_data:
                 posts_data = self._extraer_posts_rss(subreddit_name, limit)
+            posts_by_target = {subreddit_name: posts_data}
 
         self.logger.info(f"Obtenidos {len(posts_data)} posts")
 
+        if self.post_store is not None:
+            self.df_posts = self._sincronizar_post_store(posts_by_target)
+            if not self.df_posts.empty:
+                return
+
         if not posts_data:
             # Intentar cargar datos previos si existen
             ruta_anterior = ARCHIVOS_SALIDA.get("reddit_sentimiento")
@@ -489,6 +583,54 @@ class RedditETL(BaseETL):
 
         self.df_posts = pd.DataFrame(posts_data)
 
+    def _json_listing_options(self):
+        """Store mode pages the chronological listing and stops at known posts."""
+        if self.post_store is None:
+            return {}
+        return {"listing": "new", "is_known": self.post_store.contains}
+
+    def _sincronizar_post_store(self, posts_by_target):
+        """Adds the fetched posts to the store and returns the analysis window."""
+        nuevos = sum(
+            self.post_store.add_posts(posts, subreddit)
+            for subreddit, posts in posts_by_target.items()
+        )
+        since = datetime.now() - timedelta(days=REDDIT_ANALYSIS_WINDOW_DAYS)
+        df_window = self.post_store.posts_since(since)
+        self.logger.info(
+            "Post store: %d posts nuevos, %d posts en ventana de %d dias",
+            nuevos,
+            len(df_window),
+            REDDIT_ANALYSIS_WINDOW_DAYS,
+        )
+        return df_window
+
+    @staticmethod
+    def _textos_posts(df_posts):
+        return (df_posts["titulo"].astype(str) + " " + df_posts["contenido"].astype(str)).tolist()
+
+    def puntuar_sentimiento(self):
+        """Calcula el sentimiento VADER una vez por post (con cache persistente)."""
+        if self.df_posts is None or self.df_posts.empty:
+            raise ETLValidationError("DataFrame de posts vacio, no se puede puntuar sentimiento")
+
+        textos = self._textos_posts(self.df_posts)
+        cache = SentimentCache(REDDIT_SENTIMENT_CACHE_PATH)
+        scores = score_texts(textos, cache, workers=REDDIT_SENTIMENT_WORKERS)
+        cache.save(keep_keys=[text_key(texto) for texto in textos])
+
+        self.df_posts = self.df_posts.drop(columns=list(scores.columns), errors="ignore")
+        self.df_posts = pd.concat(
+            [self.df_posts.reset_index(drop=True), scores],
+            axis=1,
+        )
+        self.logger.info(
+            "Sentimiento puntuado: %d posts (cache hits=%d, nuevos=%d)",
+            len(textos),
+            cache.hits,
+            cache.misses,
+        )
+
     def analizar_sentimiento_frameworks(self):
         """Analiza sentimiento para frameworks backend mencionados en posts."""
         self.logger.info("PREGUNTA 1: Analizando sentimiento de frameworks backend...")
@@ -496,46 +638,23 @@ class RedditETL(BaseETL):
         if self.df_posts is None or self.df_posts.empty:
             raise ETLValidationError("DataFrame de posts vacio, no se puede analizar sentimiento")
 
-        sia = SentimentIntensityAnalyzer()
-
-        frameworks_backend = {
-            "Django": ["django", "python web"],
-            "FastAPI": ["fastapi"],
-            "Express": ["express", "node.js", "nodejs"],
-            "Spring": ["spring", "springboot", "spring boot", "java spring"],
-            "Laravel": ["laravel", "php"]
-        }
+        if "compound" not in self.df_posts.columns:
+            self.puntuar_sentimiento()
 
+        menciones = self.FRAMEWORK_MATCHER.match_frame(self._textos_posts(self.df_posts))
+        compounds = self.df_posts["compound"].reset_index(drop=True)
         sentimientos_framework = {}
 
-        todos_textos = []
-        for _, post in self.df_posts.iterrows():
-            todos_textos.append({
-                "texto": f"{post['titulo']} {post['contenido']}",
-                "tipo": "post"
-            })
-
         self.logger.info("Analizando sentimientos...")
 
-        for framework, keywords in frameworks_backend.items():
-            sentimientos = {"positivo": 0, "neutro": 0, "negativo": 0}
-            total_menciones = 0
-
-            for item in todos_textos:
-                texto = item["texto"].lower()
-
-                if any(self._coincide_keyword(texto, keyword) for keyword in keywords):
-                    total_menciones += 1
-
-                    scores = sia.polarity_scores(item["texto"])
-                    compound = scores['compound']
-
-                    if compound >= 0.05:
-                        sentimientos["positivo"] += 1
-                    elif compound <= -0.05:
-                        sentimientos["negativo"] += 1
-                    else:
-                        sentimientos["neutro"] += 1
+        for framework in FRAMEWORKS_BACKEND:
+            compound = compounds[menciones[framework].to_numpy()]
+            total_menciones = len(compound)
+            sentimientos = {
+                "positivo": int((compound >= 0.05).sum()),
+                "neutro": int(((compound > -0.05) & (compound < 0.05)).sum()),
+                "negativo": int((compound <= -0.05).sum()),
+            }
 
             if total_menciones > 0:
                 sentimientos_framework[framework] = {
@@ -575,29 +694,8 @@ class RedditETL(BaseETL):
         if self.df_posts is None or self.df_posts.empty:
             raise ETLValidationError("DataFrame de posts vacio, no se puede detectar temas")
 
-        temas_clave = {
-            "IA/Machine Learning": ["ai", "artificial intelligence", "machine learning", "ml", "chatgpt", "llm", "neural", "gpt", "openai"],
-            "Cloud": ["cloud", "aws", "azure", "gcp", "google cloud", "kubernetes", "docker", "containerization"],
-            "Web3/Blockchain": ["web3", "blockchain", "cryptocurrency", "crypto", "ethereum", "bitcoin", "nft", "smart contract"],
-            "DevOps": ["devops", "ci/cd", "github actions", "gitlab", "jenkins", "deployment", "infrastructure"],
-            "Microservicios": ["microservices", "microservice", "rest api", "graphql"],
-            "Testing": ["testing", "unit test", "integration test", "e2e", "jest", "pytest"],
-            "Performance": ["performance", "optimization", "caching", "cdn", "latency", "speed"],
-            "Seguridad": ["security", "encryption", "authentication", "oauth", "jwt"],
-            "TypeScript": ["typescript"],
-            "Python": ["python", "django", "fastapi", "flask"]
-        }
-
-        menciones_temas = {tema: 0 for tema in temas_clave.keys()}
-
-        for _, post in self.df_posts.iterrows():
-            texto = f"{post['titulo']} {post['contenido']}".lower()
-
-            for tema, keywords in temas_clave.items():
-                for keyword in keywords:
-                    if self._coincide_keyword(texto, keyword):
-                        menciones_temas[tema] += 1
-                        break
+        menciones = self.TOPIC_MATCHER.match_frame(self._textos_posts(self.df_posts))
+        menciones_temas = {tema: int(menciones[tema].sum()) for tema in TEMAS_CLAVE}
 
         self.df_temas = pd.DataFrame([
             {"tema": tema, "menciones": menciones_temas[tema]}
@@ -625,7 +723,7 @@ class RedditETL(BaseETL):
             self.logger.warning("Ejecuta primero github_etl.py")
             return
 
-        github_langs = df_repos["language"].value_counts().head(5).reset_index()
+        github_langs = df_repos["language"].value_counts().head(INTERSECCION_TOP_GITHUB).reset_index()
         github_langs.columns = ["tecnologia", "frecuencia"]
         github_langs["ranking_github"] = range(1, len(github_langs) + 1)
         github_langs["tipo"] = "Lenguaje"
@@ -644,7 +742,7 @@ class RedditETL(BaseETL):
                         }
                     )
                     .sort_values("ranking_github", ascending=True)
-                    .head(5)
+                    .head(INTERSECCION_TOP_GITHUB)
                 )
                 frameworks_frontend["tipo"] = "Framework Frontend"
         except FileNotFoundError:
@@ -667,54 +765,35 @@ class RedditETL(BaseETL):
         reddit_temas = (
             self.df_temas.copy()
             .sort_values(["menciones", "tema"], ascending=[False, True])
-            .head(10)
+            .head(INTERSECCION_TOP_REDDIT)
             .reset_index(drop=True)
         )
         reddit_temas["ranking_reddit"] = range(1, len(reddit_temas) + 1)
         reddit_temas = reddit_temas.rename(columns={"tema": "tecnologia"})
 
         coincidencias = []
-        used_reddit_indexes = set()
+        match_index = TechMatchIndex(reddit_temas["tecnologia"].tolist())
+        rankings_reddit = reddit_temas["ranking_reddit"].tolist()
 
-        for _, row_gh in github_data.iterrows():
-            gh_norm = normalize_for_match(row_gh["tecnologia"])
-            encontrado = None
-            found_score = 999
-
-            for rd_idx, row_rd in reddit_temas.iterrows():
-                if rd_idx in used_reddit_indexes:
-                    continue
-                rd_norm = normalize_for_match(row_rd["tecnologia"])
-                is_exact = gh_norm == rd_norm
-                is_contains = (
-                    gh_norm and rd_norm and (gh_norm in rd_norm or rd_norm in gh_norm)
-                )
-                if not is_exact and not is_contains:
-                    continue
-                match_score = 0 if is_exact else 1
-                if encontrado is None or match_score < found_score:
-                    encontrado = (rd_idx, row_rd)
-                    found_score = match_score
-                    if match_score == 0:
-                        break
+        for row_gh in github_data.itertuples(index=False):
+            rd_pos = match_index.claim(row_gh.tecnologia)
 
-            if encontrado is None:
+            if rd_pos is None:
                 coincidencias.append({
-                    "tecnologia": row_gh["tecnologia"],
-                    "tipo": row_gh["tipo"],
-                    "ranking_github": row_gh["ranking_github"],
+                    "tecnologia": row_gh.tecnologia,
+                    "tipo": row_gh.tipo,
+                    "ranking_github": row_gh.ranking_github,
                     "ranking_reddit": "No encontrado",
                     "diferencia": "-"
                 })
             else:
-                rd_idx, row_rd = encontrado
-                used_reddit_indexes.add(rd_idx)
+                ranking_reddit = rankings_reddit[rd_pos]
                 coincidencias.append({
-                    "tecnologia": row_gh["tecnologia"],
-                    "tipo": row_gh["tipo"],
-                    "ranking_github": row_gh["ranking_github"],
-                    "ranking_reddit": row_rd["ranking_reddit"],
-                    "diferencia": abs(row_gh["ranking_github"] - row_rd["ranking_reddit"])
+                    "tecnologia": row_gh.tecnologia,
+                    "tipo": row_gh.tipo,
+                    "ranking_github": row_gh.ranking_github,
+                    "ranking_reddit": ranking_reddit,
+                    "diferencia": abs(row_gh.ranking_github - ranking_reddit)
                 })
 
         df_coincidencias = pd.DataFrame(coincidencias).reset_index(drop=True)
@@ -0,0 +1,116 @@
+"""Append-only local store of Reddit posts keyed by ``post_id``.
+
+Posts from every run are kept in a SQLite file so the analysis can cover a
+configurable time window instead of the single listing fetched in a run.
+Known ids let the crawler stop paging ``new.json`` as soon as it reaches
+posts it already has. Scores and comment counts of known posts are
+refreshed when they are seen again; text and creation time never change.
+"""
+
+from __future__ import annotations
+
+import sqlite3
+import threading
+from datetime import datetime
+from pathlib import Path
+
+import pandas as pd
+
+
+POST_COLUMNS = ("post_id", "titulo", "contenido", "upvotes", "comentarios", "created_at", "autor")
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS posts (
+    post_id TEXT PRIMARY KEY,
+    subreddit TEXT NOT NULL,
+    titulo TEXT NOT NULL,
+    contenido TEXT NOT NULL,
+    upvotes INTEGER NOT NULL,
+    comentarios INTEGER NOT NULL,
+    created_at TEXT NOT NULL,
+    autor TEXT NOT NULL,
+    fetched_at TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_posts_created_at ON posts (created_at);
+"""
+
+
+def _iso(value):
+    if isinstance(value, datetime):
+        return value.replace(microsecond=0).isoformat()
+    return pd.to_datetime(value).to_pydatetime().replace(microsecond=0).isoformat()
+
+
+class RedditPostStore:
+    """Thread-safe SQLite post store.
+
+    Args:
+        path: SQLite database file (created on first use).
+    """
+
+    def __init__(self, path):
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(str(self.path), check_same_thread=False)
+        self._conn.executescript(_SCHEMA)
+
+    def contains(self, post_id):
+        """Returns True when ``post_id`` is already stored."""
+        if not post_id:
+            return False
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT 1 FROM posts WHERE post_id = ?", (str(post_id),)
+            ).fetchone()
+        return row is not None
+
+    def add_posts(self, posts, subreddit):
+        """Inserts new posts and refreshes score/comments of known ones.
+
+        Returns:
+            int: Posts that were not stored before.
+        """
+        now = datetime.now().replace(microsecond=0).isoformat()
+        rows = [
+            (
+                str(post["post_id"]),
+                subreddit,
+                post.get("titulo") or "",
+                post.get("contenido") or "",
+                int(post.get("upvotes") or 0),
+                int(post.get("comentarios") or 0),
+                _iso(post["created_at"]),
+                post.get("autor") or "",
+                now,
+            )
+            for post in posts
+            if post.get("post_id")
+        ]
+        with self._lock, self._conn:
+            before = self._conn.total_changes
+            self._conn.executemany(
+                "INSERT OR IGNORE INTO posts VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)", rows
+            )
+            inserted = self._conn.total_changes - before
+            self._conn.executemany(
+                "UPDATE posts SET upvotes = ?, comentarios = ?, fetched_at = ? WHERE post_id = ?",
+                [(row[4], row[5], now, row[0]) for row in rows],
+            )
+        return inserted
+
+    def posts_since(self, since):
+        """Returns the posts created at or after ``since`` as a DataFrame."""
+        with self._lock:
+            frame = pd.read_sql_query(
+                f"SELECT {', '.join(POST_COLUMNS)} FROM posts "
+                "WHERE created_at >= ? ORDER BY created_at DESC, post_id",
+                self._conn,
+                params=(_iso(since),),
+            )
+        frame["created_at"] = pd.to_datetime(frame["created_at"])
+        return frame
+
+    def close(self):
+        with self._lock:
+            self._conn.close()
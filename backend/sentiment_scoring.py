@@ -0,0 +1,163 @@
+"""VADER sentiment scoring with a persistent per-text cache.
+
+Posts are scored once per run in a dedicated stage; the framework
+aggregation only reads the resulting columns. Scores are cached on disk by
+the SHA-256 of the text and invalidated as a whole when the VADER lexicon
+version changes, so unchanged posts are never re-scored across runs.
+VADER is pure Python, so large batches of uncached texts can be sharded
+across a process pool; each worker builds its own analyzer once.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import threading
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache
+from importlib import metadata
+from pathlib import Path
+
+import pandas as pd
+from vaderSentiment.vaderSentiment import SentimentIntensityAnalyzer
+
+
+SCORE_COLUMNS = ("compound", "pos", "neu", "neg")
+
+
+@lru_cache(maxsize=1)
+def get_analyzer():
+    """Returns the process-wide ``SentimentIntensityAnalyzer``."""
+    return SentimentIntensityAnalyzer()
+
+
+@lru_cache(maxsize=1)
+def lexicon_version():
+    """Identifies the VADER release plus the exact lexicon/emoji files in use."""
+    try:
+        package_version = metadata.version("vaderSentiment")
+    except metadata.PackageNotFoundError:
+        package_version = "unknown"
+    analyzer = get_analyzer()
+    digest = hashlib.sha256()
+    for path in (analyzer.lexicon_full_filepath, analyzer.emoji_full_filepath):
+        try:
+            digest.update(Path(path).read_bytes())
+        except OSError:
+            continue
+    return f"{package_version}:{digest.hexdigest()[:12]}"
+
+
+def text_key(text):
+    return hashlib.sha256(str(text).encode("utf-8")).hexdigest()
+
+
+def polarity(text):
+    """Returns ``(compound, pos, neu, neg)`` for one text."""
+    scores = get_analyzer().polarity_scores(str(text))
+    return tuple(scores[column] for column in SCORE_COLUMNS)
+
+
+class SentimentCache:
+    """JSON cache of VADER scores keyed by text hash.
+
+    Args:
+        path: JSON file holding the cache.
+        version: Lexicon version the stored scores must match.
+    """
+
+    def __init__(self, path, version=None):
+        self.path = Path(path)
+        self.version = version or lexicon_version()
+        self._lock = threading.Lock()
+        self._scores = self._load()
+        self.hits = 0
+        self.misses = 0
+
+    def _load(self):
+        try:
+            data = json.loads(self.path.read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            return {}
+        if not isinstance(data, dict) or data.get("lexicon_version") != self.version:
+            return {}
+        return data.get("scores", {})
+
+    def get(self, key):
+        with self._lock:
+            scores = self._scores.get(key)
+        return tuple(scores) if scores is not None else None
+
+    def put(self, key, scores):
+        with self._lock:
+            self._scores[key] = list(scores)
+
+    def save(self, keep_keys=None):
+        """Persists the cache, keeping only ``keep_keys`` when given."""
+        with self._lock:
+            if keep_keys is not None:
+                keep_keys = set(keep_keys)
+                self._scores = {key: value for key, value in self._scores.items() if key in keep_keys}
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path = self.path.with_suffix(".tmp")
+            tmp_path.write_text(
+                json.dumps({"lexicon_version": self.version, "scores": self._scores}),
+                encoding="utf-8",
+            )
+            os.replace(tmp_path, self.path)
+
+
+def _score_shard(texts):
+    return [polarity(text) for text in texts]
+
+
+def _shards(items, count):
+    size = max(1, -(-len(items) // count))
+    return [items[start:start + size] for start in range(0, len(items), size)]
+
+
+def polarity_batch(texts, workers=1):
+    """Scores ``texts`` in order, sharded across ``workers`` processes.
+
+    With ``workers <= 1`` (or a single text) scoring runs in the calling
+    process, which gives the same scores as the pool.
+    """
+    texts = list(texts)
+    if workers <= 1 or len(texts) <= 1:
+        return _score_shard(texts)
+    shards = _shards(texts, workers)
+    with ProcessPoolExecutor(max_workers=len(shards)) as executor:
+        return [scores for shard in executor.map(_score_shard, shards) for scores in shard]
+
+
+def score_texts(texts, cache=None, workers=1):
+    """Scores every text once and returns the ``SCORE_COLUMNS`` frame in input order.
+
+    Duplicate texts and texts already in ``cache`` are not re-scored; the
+    remaining ones go through ``polarity_batch`` with ``workers`` processes.
+    """
+    texts = [str(text) for text in texts]
+    keys = [text_key(text) for text in texts]
+    scores_by_key = {}
+    pending = {}
+    for key, text in zip(keys, texts):
+        if key in scores_by_key or key in pending:
+            continue
+        cached = cache.get(key) if cache is not None else None
+        if cached is not None:
+            cache.hits += 1
+            scores_by_key[key] = cached
+        else:
+            pending[key] = text
+
+    for key, scores in zip(pending, polarity_batch(list(pending.values()), workers)):
+        scores_by_key[key] = scores
+        if cache is not None:
+            cache.misses += 1
+            cache.put(key, scores)
+
+    return pd.DataFrame(
+        [scores_by_key[key] for key in keys],
+        columns=list(SCORE_COLUMNS),
+    )
@@ -0,0 +1,90 @@
+"""Persistent StackOverflow question counts keyed by tag, period and acceptance.
+
+Every ``filter=total`` answer is stored as a bucket ``(tag, period,
+accepted)`` where the period is a calendar month (``YYYY-MM``) or a day
+range (``YYYY-MM-DD..YYYY-MM-DD``) for the partial month at the start of
+the analysis window. A bucket is closed once it was fetched more than the
+settle period after its window ended (late edits and retags included), so
+a run only queries open or missing buckets and derives volume, acceptance
+and monthly trends from the stored counts. A cube that starts empty is
+``cold``: callers then count whole-window totals with one date-range query
+instead of filling every month bucket.
+"""
+
+from __future__ import annotations
+
+import json
+import os
+import threading
+import time
+from pathlib import Path
+
+
+class StackOverflowCountCube:
+    """JSON-backed count buckets.
+
+    Args:
+        path: JSON file holding the cube.
+        settle_seconds: Time after a window ends before its count is final.
+    """
+
+    def __init__(self, path, settle_seconds):
+        self.path = Path(path)
+        self.settle_seconds = float(settle_seconds)
+        self._lock = threading.Lock()
+        self._buckets = self._load()
+        self.cold = not self._buckets
+
+    def _load(self):
+        try:
+            data = json.loads(self.path.read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            return {}
+        return data.get("buckets", {}) if isinstance(data, dict) else {}
+
+    @staticmethod
+    def key(tag, period, accepted=False):
+        return f"{tag}|{period}|{int(bool(accepted))}"
+
+    def get(self, tag, period, accepted=False):
+        """Returns the stored count or None if the bucket was never fetched."""
+        with self._lock:
+            bucket = self._buckets.get(self.key(tag, period, accepted))
+            return None if bucket is None else int(bucket["count"])
+
+    def needs_refresh(self, tag, period, accepted, window_end_ts):
+        """True when the bucket is missing or was fetched before it settled."""
+        with self._lock:
+            bucket = self._buckets.get(self.key(tag, period, accepted))
+        if bucket is None:
+            return True
+        settled_at = float(window_end_ts) + self.settle_seconds
+        return float(bucket.get("fetched_at", 0)) < settled_at
+
+    def put(self, tag, period, accepted, count, fetched_at=None):
+        with self._lock:
+            self._buckets[self.key(tag, period, accepted)] = {
+                "count": int(count),
+                "fetched_at": time.time() if fetched_at is None else float(fetched_at),
+            }
+
+    def prune(self, active_periods):
+        """Drops buckets whose period is no longer part of the analysis window."""
+        active_periods = set(active_periods)
+        with self._lock:
+            self._buckets = {
+                key: bucket
+                for key, bucket in self._buckets.items()
+                if key.split("|")[1] in active_periods
+            }
+
+    def save(self):
+        """Atomically persists the cube."""
+        with self._lock:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path = self.path.with_suffix(".tmp")
+            tmp_path.write_text(
+                json.dumps({"buckets": self._buckets}, sort_keys=True),
+                encoding="utf-8",
+            )
+            os.replace(tmp_path, self.path)
@@ -15,15 +15,18 @@ from datetime import datetime, timezone
 import calendar
 
 from config.settings import (
-    SO_API_URL, SO_API_KEY,
+    SO_API_URL, SO_API_KEY, SO_FILTER_CREATE_URL,
     SO_TOP_LANGUAGES,
     SO_TRENDS_METADATA_PATH,
+    SO_COUNT_CUBE_PATH, SO_COUNT_CUBE_SETTLE_DAYS, SO_MAX_CONCURRENCY,
     FECHA_INICIO, FECHA_INICIO_TIMESTAMP,
-    REQUEST_TIMEOUT_SECONDS, HTTP_MAX_RETRIES, HTTP_RETRY_BACKOFF_SECONDS,
-    REQUEST_MEDIUM_DELAY_SECONDS, REQUEST_SHORT_DELAY_SECONDS
+    HTTP_MAX_RETRIES, HTTP_RETRY_BACKOFF_SECONDS,
 )
 from exceptions import ETLExtractionError
 from base_etl import BaseETL
+from parallel import map_bounded
+from rate_limit import StackExchangeRateLimitScheduler
+from so_count_cube import StackOverflowCountCube
 
 
 class StackOverflowETL(BaseETL):
@@ -31,13 +34,35 @@ class StackOverflowETL(BaseETL):
 
     LEGACY_TREND_LANGUAGES = ("python", "javascript", "typescript")
     TRENDS_BRIDGE_TOP_N = 5
+    ACCEPTANCE_FRAMEWORKS = ('reactjs', 'vue.js', 'angular', 'next.js', 'svelte')
+    # The built-in "total" filter strips backoff/quota_* from the wrapper.
+    COUNT_FILTER_FIELDS = (
+        ".wrapper.total",
+        ".wrapper.backoff",
+        ".wrapper.quota_remaining",
+        ".wrapper.quota_max",
+    )
+    THROTTLE_ERROR_ID = StackExchangeRateLimitScheduler.THROTTLE_ERROR_ID
 
     def __init__(self):
         super().__init__("stackoverflow")
+        self.scheduler = StackExchangeRateLimitScheduler()
+        # get_total_count owns the retries (throttle, 5xx, network errors).
+        self.http = self._get_http_client("stackoverflow", scheduler=self.scheduler, retries=0)
+        self._count_filter = None
+        self._attempted_buckets = set()
+        self._range_totals = {}
+        self._attempted_ranges = set()
+        self.count_cube = StackOverflowCountCube(
+            SO_COUNT_CUBE_PATH,
+            settle_seconds=SO_COUNT_CUBE_SETTLE_DAYS * 86400,
+        )
 
     def definir_pasos(self):
         """Define los pasos del ETL de StackOverflow."""
         return [
+            ("Verificar cuota", self.verificar_cuota),
+            ("Consultar conteos", self.consultar_conteos),
             ("Volumen de preguntas", self.extraer_volumen_preguntas),
             ("Tasa de aceptacion", self.calcular_tasa_aceptacion),
             ("Tendencias mensuales", self.generar_tendencias_mensuales),
@@ -51,55 +76,290 @@ class StackOverflowETL(BaseETL):
                 "con cuota anonima y posible rate-limit."
             )
 
+    def _summary_extra_fields(self):
+        return [
+            ("so_quota_used", self.scheduler.quota_used),
+            ("so_quota_remaining", self.scheduler.quota_remaining),
+        ]
+
+    def _volume_languages(self):
+        return SO_TOP_LANGUAGES or ['python', 'javascript', 'typescript', 'java', 'go']
+
+    def _total_series(self):
+        """Lists the ``(tag, accepted)`` series summed over the volume windows."""
+        series = [(lang, False) for lang in self._volume_languages()]
+        series += [(fw, accepted) for fw in self.ACCEPTANCE_FRAMEWORKS for accepted in (False, True)]
+        return series
+
+    def _cube_plan(self):
+        """Lists the ``(tag, accepted, windows)`` series every step reads from the cube.
+
+        With a cold cube the volume and acceptance totals are range queries
+        (see ``_resolve_total``), so only the monthly trends use buckets.
+        """
+        trend_windows = [month for month in self._trend_months() if not month["future"]]
+        plan = []
+        if not self.count_cube.cold:
+            volume_windows = self._volume_windows()
+            plan += [(tag, accepted, volume_windows) for tag, accepted in self._total_series()]
+        plan += [(lang, False, trend_windows) for lang in self._trend_collection_languages()]
+        return plan
+
+    def _pending_buckets(self, plan):
+        """Maps each distinct missing or still-open bucket key to ``(tag, accepted, window)``."""
+        pending = {}
+        for tag, accepted, windows in plan:
+            for window in windows:
+                key = self.count_cube.key(tag, window["period"], accepted)
+                if key in pending:
+                    continue
+                if self.count_cube.needs_refresh(tag, window["period"], accepted, window["ts_end"]):
+                    pending[key] = (tag, accepted, window)
+        return pending
+
+    def _pending_ranges(self):
+        """Lists the ``(tag, accepted)`` range totals still to query while the cube is cold."""
+        if not self.count_cube.cold:
+            return []
+        return [
+            series
+            for series in self._total_series()
+            if series not in self._range_totals and series not in self._attempted_ranges
+        ]
+
+    def _planned_calls(self):
+        """Counts the open or missing cube buckets plus the pending range totals."""
+        return len(self._pending_buckets(self._cube_plan())) + len(self._pending_ranges())
+
+    def _create_count_filter(self):
+        """Creates a filter returning only total, backoff and quota fields.
+
+        Returns:
+            str | None: Filter id, or None when the API rejected the request.
+        """
+        params = {
+            'include': ';'.join(self.COUNT_FILTER_FIELDS),
+            'base': 'none',
+            'unsafe': 'false',
+        }
+        if SO_API_KEY:
+            params['key'] = SO_API_KEY
+        try:
+            response = self.http.get(SO_FILTER_CREATE_URL, params=params)
+        except requests.exceptions.RequestException:
+            self.logger.warning("Error de conexion al crear el filtro de StackOverflow")
+            return None
+        if response.status_code != 200:
+            self.logger.warning("No se pudo crear el filtro de StackOverflow (status=%s)", response.status_code)
+            return None
+        try:
+            items = response.json().get('items') or []
+        except ValueError:
+            return None
+        return items[0].get('filter') if items else None
+
+    def verificar_cuota(self):
+        """Comprueba que la cuota diaria cubra las llamadas planificadas.
+
+        Raises:
+            ETLExtractionError: Critico si la cuota restante no alcanza.
+        """
+        self.logger.info("[0/3] Verificando cuota diaria de StackExchange...")
+        self.count_cube.prune(
+            window["period"] for _, _, windows in self._cube_plan() for window in windows
+        )
+        self._count_filter = self._create_count_filter()
+        if self._count_filter is None:
+            self.logger.warning("Se usara el filtro 'total' sin informacion de cuota")
+
+        planned = self._planned_calls()
+        remaining = self.scheduler.quota_remaining
+        if remaining is None:
+            self.logger.warning(
+                "Cuota de StackExchange desconocida; llamadas planificadas=%d", planned
+            )
+            return
+        self.logger.info(
+            "   Cuota restante=%d/%s llamadas planificadas=%d",
+            remaining,
+            self.scheduler.quota_max if self.scheduler.quota_max is not None else "?",
+            planned,
+        )
+        if remaining < planned:
+            raise ETLExtractionError(
+                f"Cuota diaria de StackExchange insuficiente: quedan {remaining} "
+                f"llamadas y se necesitan {planned}",
+                critical=True,
+            )
+
     def get_total_count(self, params):
         """Consulta la API devolviendo solo el conteo total de resultados.
 
+        The scheduler enforces ``backoff`` and throttle waits, so throttled
+        calls are retried without extra sleeps; other 4xx errors fail fast.
+
         Raises:
             ETLExtractionError: Si falla la llamada a la API.
         """
         request_params = dict(params)
-        request_params['filter'] = 'total'
+        request_params['filter'] = self._count_filter or 'total'
         if SO_API_KEY:
             request_params['key'] = SO_API_KEY
 
         for intento in range(HTTP_MAX_RETRIES):
+            throttled = False
             try:
-                response = requests.get(
-                    SO_API_URL,
-                    params=request_params,
-                    timeout=REQUEST_TIMEOUT_SECONDS,
-                )
+                response = self.http.get(SO_API_URL, params=request_params)
                 if response.status_code == 200:
                     return response.json().get('total', 0)
 
                 self.logger.error(f"Error API {response.status_code}: {response.text}")
+                error_id = self._error_id(response)
+                if error_id == self.THROTTLE_ERROR_ID:
+                    throttled = True
+                elif 400 <= response.status_code < 500:
+                    raise ETLExtractionError(
+                        f"StackOverflow API rechazo la consulta (error_id={error_id})"
+                    )
             except requests.exceptions.RequestException:
                 self.logger.error("Error de conexion al consultar la API de StackOverflow")
 
-            if intento < HTTP_MAX_RETRIES - 1:
+            if intento < HTTP_MAX_RETRIES - 1 and not throttled:
                 time.sleep(HTTP_RETRY_BACKOFF_SECONDS * (intento + 1))
 
         raise ETLExtractionError("StackOverflow API no disponible tras reintentos")
 
+    @staticmethod
+    def _error_id(response):
+        try:
+            payload = response.json()
+        except ValueError:
+            return None
+        if not isinstance(payload, dict):
+            return None
+        return payload.get('error_id')
+
+    def _fetch_bucket(self, bucket):
+        """Queries one cube bucket; returns None when the API call failed."""
+        tag, accepted, window = bucket
+        params = {
+            'site': 'stackoverflow',
+            'tagged': tag,
+            'fromdate': window["ts_start"],
+            'todate': window["ts_end"],
+        }
+        if accepted:
+            params['accepted'] = True
+        try:
+            return self.get_total_count(params)
+        except ETLExtractionError as e:
+            stored = self.count_cube.get(tag, window["period"], accepted)
+            self.logger.warning(
+                f"   Error en {tag}/{window['period']}: {e}"
+                + (" (se usa el conteo guardado)" if stored is not None else "")
+            )
+            return None
+
+    def _prefetch_counts(self, plan):
+        """Fetches every pending bucket of ``plan`` concurrently.
+
+        Buckets shared by several series (or already attempted in this run)
+        are queried once; the scheduler keeps the pool inside the
+        StackExchange throttle.
+
+        Returns:
+            int: Buckets queried.
+        """
+        pending = {
+            key: bucket
+            for key, bucket in self._pending_buckets(plan).items()
+            if key not in self._attempted_buckets
+        }
+        if not pending:
+            return 0
+
+        self._attempted_buckets.update(pending)
+        counts = map_bounded(self._fetch_bucket, list(pending.values()), SO_MAX_CONCURRENCY)
+        for (tag, accepted, window), count in zip(pending.values(), counts):
+            if count is not None:
+                self.count_cube.put(tag, window["period"], accepted, count)
+        self.count_cube.save()
+        return len(pending)
+
+    @staticmethod
+    def _range_window(windows):
+        """Merges consecutive windows into one date-range window."""
+        return {
+            "period": f"{windows[0]['period']}..{windows[-1]['period']}",
+            "ts_start": windows[0]["ts_start"],
+            "ts_end": windows[-1]["ts_end"],
+        }
+
+    def _prefetch_ranges(self, series):
+        """Queries the range total of every pending ``(tag, accepted)`` series concurrently.
+
+        Returns:
+            int: Range queries issued.
+        """
+        pending = [item for item in series if item not in self._attempted_ranges]
+        if not pending:
+            return 0
+
+        self._attempted_ranges.update(pending)
+        window = self._range_window(self._volume_windows())
+        counts = map_bounded(
+            self._fetch_bucket,
+            [(tag, accepted, window) for tag, accepted in pending],
+            SO_MAX_CONCURRENCY,
+        )
+        for item, count in zip(pending, counts):
+            if count is not None:
+                self._range_totals[item] = count
+        return len(pending)
+
+    def _resolve_total(self, tag, accepted, windows):
+        """Returns the total count over ``windows``, or None if a count is missing.
+
+        A cold cube has no month buckets to reuse, so the total comes from a
+        single date-range query instead of one query per window; a warm cube
+        sums its buckets and only refreshes the open ones.
+        """
+        if self.count_cube.cold:
+            self._prefetch_ranges([(tag, accepted)])
+            return self._range_totals.get((tag, accepted))
+        counts = self._resolve_counts(tag, accepted, windows)
+        return None if None in counts else sum(counts)
+
+    def _resolve_counts(self, tag, accepted, windows):
+        """Returns the count of every window, querying only open or missing buckets.
+
+        A bucket whose refresh fails keeps its previous count; without one
+        the entry is None.
+        """
+        self._prefetch_counts([(tag, accepted, windows)])
+        return [self.count_cube.get(tag, window["period"], accepted) for window in windows]
+
+    def consultar_conteos(self):
+        """Consulta en paralelo todos los buckets pendientes de la corrida."""
+        queried = self._prefetch_ranges(self._pending_ranges())
+        queried += self._prefetch_counts(self._cube_plan())
+        self.logger.info(
+            "   Buckets consultados=%d concurrencia=%d", queried, SO_MAX_CONCURRENCY
+        )
+
     def extraer_volumen_preguntas(self):
         """Extrae el volumen anual de preguntas por lenguaje desde StackOverflow."""
         self.logger.info("[1/3] Obteniendo volumen TOTAL de preguntas...")
-        languages = SO_TOP_LANGUAGES or ['python', 'javascript', 'typescript', 'java', 'go']
+        languages = self._volume_languages()
+        windows = self._volume_windows()
         data_volumen = []
         errores = 0
 
         for lang in languages:
             self.logger.info(f"   Consultando StackOverflow para: [{lang}]...")
-            params = {
-                'site': 'stackoverflow',
-                'tagged': lang,
-                'fromdate': FECHA_INICIO_TIMESTAMP
-            }
-
-            try:
-                total = self.get_total_count(params)
-            except ETLExtractionError as e:
-                self.logger.warning(f"   No se pudo obtener datos para {lang}: {e}")
+            total = self._resolve_total(lang, False, windows)
+            if total is None:
+                self.logger.warning(f"   No se pudo obtener datos para {lang}")
                 total = 0
                 errores += 1
 
@@ -107,7 +367,6 @@ class StackOverflowETL(BaseETL):
                 'lenguaje': lang,
                 'preguntas_nuevas_2025': total
             })
-            time.sleep(REQUEST_MEDIUM_DELAY_SECONDS)
 
         if errores == len(languages):
             raise ETLExtractionError("No se pudo consultar ningun lenguaje en StackOverflow")
@@ -118,32 +377,18 @@ class StackOverflowETL(BaseETL):
     def calcular_tasa_aceptacion(self):
         """Calcula tasas de respuestas aceptadas por framework como métrica de madurez."""
         self.logger.info("[2/3] Calculando metricas de madurez...")
-        frameworks = ['reactjs', 'vue.js', 'angular', 'next.js', 'svelte']
+        frameworks = list(self.ACCEPTANCE_FRAMEWORKS)
+        windows = self._volume_windows()
         data_madurez = []
         errores = 0
 
         for fw in frameworks:
             self.logger.info(f"   Analizando [{fw}]...")
+            total_questions = self._resolve_total(fw, False, windows)
+            accepted_questions = self._resolve_total(fw, True, windows)
 
-            try:
-                params_total = {
-                    'site': 'stackoverflow',
-                    'tagged': fw,
-                    'fromdate': FECHA_INICIO_TIMESTAMP
-                }
-                total_questions = self.get_total_count(params_total)
-                time.sleep(REQUEST_SHORT_DELAY_SECONDS)
-
-                params_accepted = {
-                    'site': 'stackoverflow',
-                    'tagged': fw,
-                    'fromdate': FECHA_INICIO_TIMESTAMP,
-                    'accepted': True
-                }
-                accepted_questions = self.get_total_count(params_accepted)
-                time.sleep(REQUEST_SHORT_DELAY_SECONDS)
-            except ETLExtractionError as e:
-                self.logger.warning(f"   No se pudo obtener datos para {fw}: {e}")
+            if total_questions is None or accepted_questions is None:
+                self.logger.warning(f"   No se pudo obtener datos para {fw}")
                 total_questions = 0
                 accepted_questions = 0
                 errores += 1
@@ -169,57 +414,28 @@ class StackOverflowETL(BaseETL):
         """Genera tendencias mensuales de preguntas para los lenguajes principales."""
         self.logger.info("[3/3] Generando historico mensual...")
         target_langs = self._trend_collection_languages()
+        months = self._trend_months()
+        active_months = [month for month in months if not month["future"]]
+
+        counts_by_language = {}
+        for lang in target_langs:
+            self.logger.info(f"   Consultando serie mensual de [{lang}]...")
+            counts = self._resolve_counts(lang, False, active_months)
+            counts_by_language[lang] = {
+                month["period"]: int(count or 0)
+                for month, count in zip(active_months, counts)
+            }
+
         data_trends = []
         trends_by_language = {lang: [] for lang in target_langs}
-
-        inicio_year = FECHA_INICIO.year
-        inicio_month = FECHA_INICIO.month
-
-        for i in range(12):
-            mes_idx = (inicio_month + i - 1) % 12 + 1
-            year = inicio_year + (inicio_month + i - 1) // 12
-            nombre_mes = calendar.month_abbr[mes_idx]
-            mes_label = f"{year}-{mes_idx:02d}"
-
-            start_date = datetime(year, mes_idx, 1)
-            last_day = calendar.monthrange(year, mes_idx)[1]
-            end_date = datetime(year, mes_idx, last_day, 23, 59, 59)
-
-            ts_start = int(start_date.timestamp())
-            ts_end = int(end_date.timestamp())
-
-            if start_date > datetime.now():
-                self.logger.info(f"   Saltando {nombre_mes} {year} (futuro)...")
-                row = {'mes': mes_label}
-                for legacy_lang in self.LEGACY_TREND_LANGUAGES:
-                    row[legacy_lang] = 0
-                for lang in target_langs:
-                    trends_by_language.setdefault(lang, []).append(0)
-                data_trends.append(row)
-                continue
-
-            self.logger.info(f"   Consultando {nombre_mes} {year}...")
-            row = {'mes': mes_label}
-            monthly_counts = {}
-
+        for month in months:
+            if month["future"]:
+                self.logger.info(f"   Saltando {month['nombre']} {month['year']} (futuro)...")
+            row = {'mes': month["period"]}
             for lang in target_langs:
-                params = {
-                    'site': 'stackoverflow',
-                    'tagged': lang,
-                    'fromdate': ts_start,
-                    'todate': ts_end
-                }
-                try:
-                    count = self.get_total_count(params)
-                except ETLExtractionError as e:
-                    self.logger.warning(f"   Error en {nombre_mes}/{lang}: {e}")
-                    count = 0
-                monthly_counts[lang] = count
-                trends_by_language.setdefault(lang, []).append(count)
-                time.sleep(REQUEST_SHORT_DELAY_SECONDS)
-
+                trends_by_language[lang].append(counts_by_language[lang].get(month["period"], 0))
             for legacy_lang in self.LEGACY_TREND_LANGUAGES:
-                row[legacy_lang] = monthly_counts.get(legacy_lang, 0)
+                row[legacy_lang] = counts_by_language.get(legacy_lang, {}).get(month["period"], 0)
             data_trends.append(row)
 
         df_trends = pd.DataFrame(data_trends)
@@ -229,6 +445,55 @@ class StackOverflowETL(BaseETL):
             trends_by_language=trends_by_language,
         )
 
+    @staticmethod
+    def _month_window(year, month):
+        start_date = datetime(year, month, 1)
+        last_day = calendar.monthrange(year, month)[1]
+        end_date = datetime(year, month, last_day, 23, 59, 59)
+        return {
+            "nombre": calendar.month_abbr[month],
+            "year": year,
+            "period": f"{year}-{month:02d}",
+            "ts_start": int(start_date.timestamp()),
+            "ts_end": int(end_date.timestamp()),
+            "future": start_date > datetime.now(),
+        }
+
+    @classmethod
+    def _trend_months(cls):
+        """Returns the 12 monthly windows starting at the month of FECHA_INICIO."""
+        months = []
+        for i in range(12):
+            mes_idx = (FECHA_INICIO.month + i - 1) % 12 + 1
+            year = FECHA_INICIO.year + (FECHA_INICIO.month + i - 1) // 12
+            months.append(cls._month_window(year, mes_idx))
+        return months
+
+    @classmethod
+    def _volume_windows(cls):
+        """Returns the windows covering FECHA_INICIO until today.
+
+        The partial first month is a day-range bucket so totals start exactly
+        at FECHA_INICIO; the following months are regular month buckets.
+        """
+        first = cls._month_window(FECHA_INICIO.year, FECHA_INICIO.month)
+        if FECHA_INICIO_TIMESTAMP > first["ts_start"]:
+            last_day = calendar.monthrange(FECHA_INICIO.year, FECHA_INICIO.month)[1]
+            first = {
+                **first,
+                "period": f"{FECHA_INICIO:%Y-%m-%d}..{FECHA_INICIO:%Y-%m}-{last_day:02d}",
+                "ts_start": FECHA_INICIO_TIMESTAMP,
+            }
+        windows = [first]
+        year, month = FECHA_INICIO.year, FECHA_INICIO.month
+        while True:
+            year, month = (year + 1, 1) if month == 12 else (year, month + 1)
+            window = cls._month_window(year, month)
+            if window["future"]:
+                break
+            windows.append(window)
+        return windows
+
     def _trend_collection_languages(self):
         """Builds the language list collected for monthly trends."""
         configured = SO_TOP_LANGUAGES or list(self.LEGACY_TREND_LANGUAGES)
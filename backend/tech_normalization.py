@@ -1,10 +1,20 @@
 """Utilidades compartidas para normalizar nombres de tecnologías.
 
-Centraliza mappings usados por ETLs para evitar drift entre módulos.
+Centraliza mappings usados por ETLs, trend score y el exportador del bridge
+para evitar drift entre módulos. Los mappings se compilan una vez en
+lookups por alias; las funciones de nombre individual están memoizadas y
+``normalize_series`` normaliza una columna entera evaluando cada valor
+distinto una sola vez.
 """
 
 from __future__ import annotations
 
+import re
+from functools import lru_cache
+
+import numpy as np
+import pandas as pd
+
 
 TECH_DISPLAY_MAP = {
     "python": "Python",
@@ -32,6 +42,7 @@ TECH_DISPLAY_MAP = {
     "spring": "Spring",
     "laravel": "Laravel",
     "ia/machine learning": "AI/ML",
+    "ai/ml": "AI/ML",
     "cloud": "Cloud",
     "devops": "DevOps",
     "microservicios": "Microservices",
@@ -56,36 +67,198 @@ MATCH_ALIASES = {
 }
 
 
+# Slugs que no salen de reemplazar simbolos por guiones.
+TECH_SLUG_OVERRIDES = {
+    "ai/ml": "ai-ml",
+    "c#": "c-sharp",
+    "c++": "c-plus-plus",
+}
+
+
+# Tags de StackOverflow con nombre distinto al canonico.
+SO_TAG_ALIASES = {
+    "csharp": "c#",
+    "cpp": "c++",
+}
+
+
+# Series de tendencias de StackOverflow: tags sin punto y "ReactJS", la
+# etiqueta que el frontend muestra para el tag reactjs (el trend score lo
+# publica como "React" via TECH_DISPLAY_MAP).
+SO_TREND_DISPLAY_OVERRIDES = {
+    "reactjs": "ReactJS",
+    "react.js": "ReactJS",
+    "nextjs": "Next.js",
+    "vuejs": "Vue.js",
+    "nodejs": "Node.js",
+    "node.js": "Node.js",
+}
+
+
+def _compile_match_aliases(aliases_by_canonical):
+    exact = {}
+    short_aliases = []
+    long_aliases = []
+    for canonical, aliases in aliases_by_canonical.items():
+        exact.setdefault(canonical, canonical)
+        for alias in aliases:
+            exact.setdefault(alias, canonical)
+            if len(alias) <= 2:
+                short_aliases.append((alias, canonical))
+            else:
+                long_aliases.append((alias, canonical))
+    return exact, tuple(short_aliases), tuple(long_aliases)
+
+
+_MATCH_EXACT, _MATCH_SHORT_ALIASES, _MATCH_LONG_ALIASES = _compile_match_aliases(MATCH_ALIASES)
+
+
 def normalize_technology_name(name: str) -> str:
     """Normaliza un nombre hacia una etiqueta de display consistente."""
-    text = str(name or "").strip()
+    return _display_name(str(name or "").strip())
+
+
+@lru_cache(maxsize=4096)
+def _display_name(text: str) -> str:
     if not text:
         return ""
     return TECH_DISPLAY_MAP.get(text.lower(), text.title())
 
 
+def technology_slug(name: str) -> str:
+    """Devuelve el slug canonico (URL/ids del frontend) de una tecnologia."""
+    return _slug(normalize_technology_name(name))
+
+
+@lru_cache(maxsize=4096)
+def _slug(display_name: str) -> str:
+    lowered = display_name.strip().lower()
+    if not lowered:
+        return ""
+    if lowered in TECH_SLUG_OVERRIDES:
+        return TECH_SLUG_OVERRIDES[lowered]
+    return re.sub(r"[^a-z0-9]+", "-", lowered).strip("-")
+
+
+def normalize_so_tag(tag: str) -> str:
+    """Normaliza un tag de StackOverflow a su forma canonica en minusculas."""
+    normalized = str(tag or "").strip().lower()
+    return SO_TAG_ALIASES.get(normalized, normalized)
+
+
+def so_trend_display_name(label: str) -> str:
+    """Etiqueta de display de una serie de tendencias de StackOverflow.
+
+    Usa los overrides de tendencias y luego la dimension compartida; los
+    tags desconocidos conservan su capitalizacion si ya la traen.
+    """
+    return _so_trend_display_name(str(label or "").strip())
+
+
+@lru_cache(maxsize=1024)
+def _so_trend_display_name(raw: str) -> str:
+    if not raw:
+        return ""
+    normalized = raw.lower()
+    if normalized in SO_TREND_DISPLAY_OVERRIDES:
+        return SO_TREND_DISPLAY_OVERRIDES[normalized]
+    tag = SO_TAG_ALIASES.get(normalized, normalized)
+    if tag in TECH_DISPLAY_MAP:
+        return TECH_DISPLAY_MAP[tag]
+    if raw != normalized:
+        return raw
+    return raw.title()
+
+
 def normalize_for_match(name: str) -> str:
     """Normaliza un nombre para matching flexible entre fuentes."""
-    raw = str(name or "").strip().lower()
+    return _match_key(str(name or "").strip().lower())
+
+
+@lru_cache(maxsize=4096)
+def _match_key(raw: str) -> str:
     if not raw:
         return ""
 
-    whitespace_tokens = [token.strip(".,:;!?()[]{}\"'") for token in raw.split()]
-
     # Pass 1: exact canonical / exact alias only.
-    for canonical, aliases in MATCH_ALIASES.items():
-        if raw == canonical or any(raw == alias for alias in aliases):
-            return canonical
+    if raw in _MATCH_EXACT:
+        return _MATCH_EXACT[raw]
 
     # Pass 2: token-aware match for short aliases like "js", while still
     # avoiding false positives such as "next.js" -> "javascript".
-    for canonical, aliases in MATCH_ALIASES.items():
-        for alias in aliases:
-            if len(alias) <= 2 and alias in whitespace_tokens:
-                return canonical
+    whitespace_tokens = {token.strip(".,:;!?()[]{}\"'") for token in raw.split()}
+    for alias, canonical in _MATCH_SHORT_ALIASES:
+        if alias in whitespace_tokens:
+            return canonical
 
     # Pass 3: contains match for longer aliases only.
-    for canonical, aliases in MATCH_ALIASES.items():
-        if any(len(alias) >= 3 and alias in raw for alias in aliases):
+    for alias, canonical in _MATCH_LONG_ALIASES:
+        if alias in raw:
             return canonical
     return raw
+
+
+def normalize_series(values: pd.Series, normalizer=normalize_technology_name) -> pd.Series:
+    """Aplica ``normalizer`` una vez por valor distinto de ``values``.
+
+    Devuelve una serie con el mismo indice; los nulos se normalizan uno a
+    uno para respetar lo que ``normalizer`` hace con ``None`` y ``NaN``.
+    """
+    codes, uniques = pd.factorize(values)
+    # Trailing slot so the -1 code of nulls indexes something.
+    lookup = np.array([normalizer(value) for value in uniques] + [None], dtype=object)
+    normalized = lookup[codes]
+    missing = codes < 0
+    if missing.any():
+        normalized[missing] = [normalizer(value) for value in values.to_numpy()[missing]]
+    return pd.Series(normalized, index=values.index, name=values.name, dtype="object")
+
+
+def _substrings(text: str) -> set[str]:
+    return {text[start:end] for start in range(len(text)) for end in range(start + 1, len(text) + 1)}
+
+
+class TechMatchIndex:
+    """Indice para emparejar tecnologias entre fuentes uno a uno.
+
+    Cada candidato se normaliza una sola vez al construir el indice. La
+    coincidencia exacta se resuelve por hash y la de contencion con un
+    indice de subcadenas, sin recorrer todos los candidatos por consulta.
+    Reglas: se prefiere la coincidencia exacta; si no hay, gana el primer
+    candidato (en orden) que contiene o esta contenido en el nombre
+    buscado. Cada candidato se asigna como maximo una vez.
+    """
+
+    def __init__(self, names):
+        self._positions: dict[str, list[int]] = {}
+        for position, name in enumerate(names):
+            self._positions.setdefault(normalize_for_match(name), []).append(position)
+        self._containing: dict[str, set[str]] = {}
+        for norm in self._positions:
+            for sub in _substrings(norm):
+                self._containing.setdefault(sub, set()).add(norm)
+        self._cursor = dict.fromkeys(self._positions, 0)
+        self._used: set[int] = set()
+
+    def _first_free(self, norm: str) -> int | None:
+        positions = self._positions.get(norm)
+        if not positions:
+            return None
+        cursor = self._cursor[norm]
+        while cursor < len(positions) and positions[cursor] in self._used:
+            cursor += 1
+        self._cursor[norm] = cursor
+        return positions[cursor] if cursor < len(positions) else None
+
+    def claim(self, name: str) -> int | None:
+        """Asigna el mejor candidato libre para ``name`` y devuelve su posicion."""
+        norm = normalize_for_match(name)
+        position = self._first_free(norm)
+        if position is None and norm:
+            candidates = set(self._containing.get(norm, ()))
+            candidates.update(sub for sub in _substrings(norm) if sub in self._positions)
+            free = (self._first_free(candidate) for candidate in candidates)
+            position = min((pos for pos in free if pos is not None), default=None)
+        if position is not None:
+            self._used.add(position)
+        return position
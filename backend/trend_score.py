@@ -9,7 +9,7 @@ import pandas as pd
 from base_etl import BaseETL
 from config.settings import ARCHIVOS_SALIDA
 from exceptions import ETLExtractionError
-from tech_normalization import normalize_technology_name
+from tech_normalization import normalize_series, normalize_technology_name
 from trend_score_duckdb import calcular_trend_score_duckdb
 from validador import validar_dataframe
 
@@ -60,7 +60,7 @@ def cargar_github():
 
         langs = df_repos["language"].value_counts().head(15).reset_index()
         langs.columns = ["tecnologia", "repos_count"]
-        langs["tecnologia"] = langs["tecnologia"].apply(normalizar_nombre)
+        langs["tecnologia"] = normalize_series(langs["tecnologia"])
         langs["github_score"] = normalizar_scores(langs["repos_count"])
         logger.info("GitHub: %d technologies loaded", len(langs))
         return langs[["tecnologia", "github_score"]]
@@ -76,7 +76,7 @@ def cargar_stackoverflow():
     """Carga y procesa datos de StackOverflow para scoring."""
     try:
         df_vol = pd.read_csv(ARCHIVOS_SALIDA["so_volumen"])
-        df_vol["tecnologia"] = df_vol["lenguaje"].apply(normalizar_nombre)
+        df_vol["tecnologia"] = normalize_series(df_vol["lenguaje"])
         df_vol["so_score"] = normalizar_scores(df_vol["preguntas_nuevas_2025"])
         logger.info("StackOverflow: %d technologies loaded", len(df_vol))
         return df_vol[["tecnologia", "so_score"]]
@@ -92,7 +92,7 @@ def cargar_reddit():
     """Carga y procesa datos de Reddit para scoring."""
     try:
         df_temas = pd.read_csv(ARCHIVOS_SALIDA["reddit_temas"])
-        df_temas["tecnologia"] = df_temas["tema"].apply(normalizar_nombre)
+        df_temas["tecnologia"] = normalize_series(df_temas["tema"])
         df_temas["reddit_score"] = normalizar_scores(df_temas["menciones"])
         logger.info("Reddit: %d technologies loaded", len(df_temas))
         return df_temas[["tecnologia", "reddit_score"]]
@@ -191,3 +191,67 @@ def test_guardar_csv_writes_history_only_when_enabled(tmp_path, monkeypatch):
     assert history_destino.exists()
     assert etl._run_summary["rows_written"] == 1
     assert len(etl._run_summary["files_written"]) == 1
+
+
+def test_resumen_incluye_contadores_de_cache_http(monkeypatch, caplog, tmp_path):
+    from http_cache import HttpResponseCache
+    from http_client import SourceHttpClient
+
+    cache = HttpResponseCache(tmp_path / "cache", max_bytes=1024)
+    cache.stats.update({"hits": 2, "misses": 3, "not_modified": 4})
+    client = SourceHttpClient("dummy", cache=cache)
+    monkeypatch.setattr(base_etl, "get_http_client", lambda *_args, **_kwargs: client)
+
+    etl = DummyETL([])
+    monkeypatch.setattr(etl, "configurar_logging", lambda: None)
+    assert etl._get_http_client("dummy") is client
+    assert etl._get_http_client("dummy") is client
+
+    with caplog.at_level("INFO", logger="dummy"):
+        etl.ejecutar()
+
+    assert "cache_hits=2 cache_misses=3 cache_304=4" in caplog.text
+
+
+def _history_parquet_setup(tmp_path, monkeypatch):
+    history_destino = (
+        tmp_path / "history" / "github_lenguajes" / "year=2026" / "month=03" / "day=01" / "out.csv"
+    )
+    monkeypatch.setattr(base_etl, "ARCHIVOS_SALIDA", {"github_lenguajes": tmp_path / "legacy.csv"})
+    _configure_write_flags(monkeypatch, legacy=False, latest=False, history=True)
+    monkeypatch.setattr(base_etl, "WRITE_HISTORY_PARQUET", True)
+    monkeypatch.setattr(
+        base_etl,
+        "get_history_output_path",
+        lambda _nombre, fecha=None: history_destino,
+    )
+    df = pd.DataFrame({"lenguaje": ["Python"], "repos_count": [1], "porcentaje": [100.0]})
+    return history_destino, df
+
+
+def test_guardar_csv_history_parquet_sin_pyarrow_solo_avisa(tmp_path, monkeypatch, caplog):
+    history_destino, df = _history_parquet_setup(tmp_path, monkeypatch)
+    monkeypatch.setattr(base_etl, "parquet_available", lambda: False)
+
+    etl = DummyETL([])
+    etl.guardar_csv(df, "github_lenguajes")
+
+    assert history_destino.exists()
+    assert not history_destino.with_suffix(".parquet").exists()
+    assert "pyarrow no esta instalado" in caplog.text
+    assert len(etl._run_summary["files_written"]) == 1
+
+
+def test_guardar_csv_history_parquet_junto_al_csv(tmp_path, monkeypatch):
+    pytest.importorskip("pyarrow")
+    history_destino, df = _history_parquet_setup(tmp_path, monkeypatch)
+
+    etl = DummyETL([])
+    etl.guardar_csv(df, "github_lenguajes")
+
+    parquet_destino = history_destino.with_suffix(".parquet")
+    assert history_destino.exists()
+    assert parquet_destino.exists()
+    assert pd.read_parquet(parquet_destino)["repos_count"].tolist() == [1]
+    assert etl._run_summary["rows_written"] == 1
+    assert len(etl._run_summary["files_written"]) == 2
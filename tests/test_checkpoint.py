@@ -0,0 +1,48 @@
+"""
+Tests para checkpoint.py - checkpoints de extraccion por particion.
+"""
+from checkpoint import ExtractionCheckpoint
+
+
+QUERIES = [
+    {"q": "created:2025-01-01..2025-01-31", "pages": 2, "label": "jan"},
+    {"q": "created:2025-02-01..2025-02-28", "pages": 2, "label": "feb"},
+]
+
+
+def test_persists_pages_and_reloads_state(tmp_path):
+    path = tmp_path / "checkpoint.json"
+    checkpoint = ExtractionCheckpoint(path, QUERIES, metadata={"window": "2025"})
+    checkpoint.record_page("jan", 1, [{"repo_name": "a/b"}])
+    checkpoint.mark_complete("jan")
+    checkpoint.record_page("feb", 1, [{"repo_name": "c/d"}])
+
+    state = ExtractionCheckpoint.load(path)
+    resumed = ExtractionCheckpoint(path, state["queries"], state=state)
+
+    assert state["window"] == "2025"
+    assert resumed.is_complete("jan") is True
+    assert resumed.is_complete("feb") is False
+    assert resumed.pages_done("feb") == {1}
+    assert resumed.repos("jan") == [{"repo_name": "a/b"}]
+    assert resumed.completed_count() == 1
+
+
+def test_ignores_state_from_a_different_plan(tmp_path):
+    path = tmp_path / "checkpoint.json"
+    ExtractionCheckpoint(path, QUERIES).record_page("jan", 1, [{"repo_name": "a/b"}])
+
+    other_plan = [dict(QUERIES[0], pages=5)]
+    resumed = ExtractionCheckpoint(path, other_plan, state=ExtractionCheckpoint.load(path))
+
+    assert resumed.pages_done("jan") == set()
+
+
+def test_clear_removes_file_and_load_tolerates_missing(tmp_path):
+    path = tmp_path / "checkpoint.json"
+    checkpoint = ExtractionCheckpoint(path, QUERIES)
+    checkpoint.record_page("jan", 1, [])
+    checkpoint.clear()
+
+    assert not path.exists()
+    assert ExtractionCheckpoint.load(path) is None
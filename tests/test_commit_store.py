@@ -0,0 +1,76 @@
+"""
+Tests para commit_store.py - historial incremental de commits por repo.
+"""
+from commit_store import CommitHistoryStore
+
+
+def _commit(sha, date, contributor="login:a"):
+    return {"sha": sha, "date": date, "day": date[:10], "month": date[:7], "contributor": contributor}
+
+
+def test_merge_tracks_checkpoint_and_skips_boundary(tmp_path):
+    store = CommitHistoryStore(tmp_path / "store.json")
+    store.merge("org/repo", [
+        _commit("c3", "2025-03-10T00:00:00Z", "login:b"),
+        _commit("c2", "2025-03-10T00:00:00Z"),
+        _commit("c1", "2025-02-01T00:00:00Z"),
+    ])
+
+    assert store.checkpoint("org/repo") == ("2025-03-10T00:00:00Z", {"c2", "c3"})
+
+    store.merge("org/repo", [
+        _commit("c4", "2025-04-01T00:00:00Z", "login:c"),
+        _commit("c3", "2025-03-10T00:00:00Z", "login:b"),
+    ])
+
+    total, monthly, contributors = store.totals("org/repo", "2025-01-01", "2025-12-31")
+    assert total == 4
+    assert monthly == {"2025-02": 1, "2025-03": 2, "2025-04": 1}
+    assert contributors == 3
+    assert store.checkpoint("org/repo") == ("2025-04-01T00:00:00Z", {"c4"})
+
+
+def test_prune_drops_days_outside_window(tmp_path):
+    store = CommitHistoryStore(tmp_path / "store.json")
+    store.merge("org/repo", [
+        _commit("old", "2025-01-02T00:00:00Z", "login:old"),
+        _commit("new", "2025-01-03T00:00:00Z"),
+    ])
+
+    store.prune("2025-01-03")
+
+    assert store.totals("org/repo", "2000-01-01", "2099-12-31") == (1, {"2025-01": 1}, 1)
+
+
+def test_totals_clip_the_first_month_to_the_start_day(tmp_path):
+    store = CommitHistoryStore(tmp_path / "store.json")
+    store.merge("org/repo", [
+        _commit("before", "2025-01-02T23:00:00Z", "login:early"),
+        _commit("start", "2025-01-03T08:00:00Z"),
+        _commit("later", "2025-02-10T08:00:00Z"),
+    ])
+
+    assert store.totals("org/repo", "2025-01-03", "2025-12-31") == (2, {"2025-01": 1, "2025-02": 1}, 1)
+
+
+def test_save_and_reload_keeps_runs(tmp_path):
+    path = tmp_path / "metadata" / "store.json"
+    store = CommitHistoryStore(path)
+    store.merge("org/repo", [_commit("c1", "2025-05-01T00:00:00Z")])
+    store.record_run({"React": 10}, "2025-05-02")
+    store.save()
+
+    reloaded = CommitHistoryStore(path)
+
+    assert reloaded.previous_commits() == ({"React": 10}, "2025-05-02")
+    assert reloaded.checkpoint("org/repo")[0] == "2025-05-01T00:00:00Z"
+
+
+def test_missing_or_corrupt_file_starts_empty(tmp_path):
+    path = tmp_path / "store.json"
+    path.write_text("{no json", encoding="utf-8")
+
+    store = CommitHistoryStore(path)
+
+    assert store.checkpoint("org/repo") == (None, set())
+    assert store.previous_commits() == ({}, None)
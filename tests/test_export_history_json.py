@@ -1049,3 +1049,26 @@ def test_build_home_highlights_payload_selects_three_unique_highlights():
     assert "Next.js" in entities
     assert "IA/Machine Learning" in entities
     assert "python" in entities or "Python" in entities
+
+
+def test_build_so_trends_history_uses_shared_display_labels(tmp_path):
+    history_day = (
+        tmp_path / "datos" / "history" / "so_tendencias" / "year=2026" / "month=03" / "day=07"
+    )
+    history_day.mkdir(parents=True, exist_ok=True)
+    (history_day / "so_tendencias_mensuales.csv").write_text(
+        (
+            "mes,ai/ml,vue 3,fastapi,devops\n"
+            "2025-03,40,30,20,10\n"
+            "2025-04,45,25,22,12\n"
+        ),
+        encoding="utf-8",
+    )
+
+    history_index = export_history_json.build_history_index(tmp_path)
+    payload = export_history_json.build_so_trends_history(tmp_path, history_index)
+
+    # Etiquetas de la dimension compartida; antes se exportaban como
+    # "Ai/Ml", "Vue 3", "Fastapi" y "Devops".
+    labels = [item["tecnologia"] for item in payload["series"]]
+    assert labels == ["AI/ML", "Vue.js", "FastAPI", "DevOps"]
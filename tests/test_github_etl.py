@@ -6,10 +6,15 @@ Los tests cubren:
 - Validación: sin nulos en columnas críticas
 - Mock de respuestas de API (sin llamadas reales a la API)
 """
+import threading
+import time
+
 import pytest
 import pandas as pd
+import requests
 from unittest.mock import patch, MagicMock
 from github_etl import GitHubETL
+from commit_store import CommitHistoryStore
 
 
 @pytest.fixture
@@ -20,6 +25,14 @@ def etl():
     return instance
 
 
+@pytest.fixture(autouse=True)
+def _checkpoint_path(tmp_path):
+    """Redirige el checkpoint de extraccion a un directorio temporal."""
+    path = tmp_path / "metadata" / "github_repos_checkpoint.json"
+    with patch("github_etl.GITHUB_CHECKPOINT_PATH", path):
+        yield path
+
+
 @pytest.fixture
 def sample_repos_df():
     """Crea un DataFrame de repos de ejemplo para pruebas."""
@@ -114,6 +127,39 @@ class TestAnalizarLenguajes:
         assert "AI/ML" not in df["lenguaje"].tolist()
 
 
+class TestReintentosHttp:
+    """Los errores de red y 5xx los reintenta solo el adapter del cliente."""
+
+    def test_count_search_items_no_reintenta_error_de_red(self, etl):
+        with patch.object(etl.http, "get", side_effect=requests.exceptions.ConnectionError("down")) as mocked, \
+                patch("github_etl.time.sleep") as sleep:
+            assert etl._count_search_items("repo:a/b is:pr") is None
+
+        assert mocked.call_count == 1
+        sleep.assert_not_called()
+
+    def test_count_search_items_no_reintenta_5xx(self, etl):
+        response = MagicMock(status_code=502)
+        with patch.object(etl.http, "get", return_value=response) as mocked, \
+                patch("github_etl.time.sleep"):
+            assert etl._count_search_items("repo:a/b is:pr") is None
+
+        assert mocked.call_count == 1
+
+    def test_search_failure_leaves_the_count_unknown(self, etl):
+        """Un fallo de search deja merged_prs vacio en lugar de reportar 0."""
+        etl._framework_activity = {}
+        with patch("github_etl.GITHUB_COMMITS_MODE", "paging"), \
+                patch.object(etl.http, "get", return_value=MagicMock(status_code=502)), \
+                patch.object(etl, "_count_releases_since", return_value=2), \
+                patch.object(etl, "_page_commit_history", return_value=(5, {}, 1)):
+            metrics = etl._collect_framework_metrics("React", "facebook/react")
+
+        assert metrics["merged_prs"] is None
+        assert metrics["closed_issues"] is None
+        assert metrics["releases_count"] == 2
+
+
 class TestInsightsIA:
     """Tests para la generación de insights de AI/LLM."""
 
@@ -135,6 +181,49 @@ class TestInsightsIA:
         assert int(df.iloc[0]["repos_ai_detectados"]) >= 1
         assert float(df.iloc[0]["porcentaje_ai"]) > 0
 
+    def _repos_ai(self):
+        return pd.DataFrame({
+            "repo_name": ["acme/openai-proxy", "acme/raggedy", "acme/llm-kit", "acme/web"],
+            "language": ["Go", "Rust", "Python", "AI/ML"],
+            "description": ["proxy for openai", "cloth physics", "llm llm toolkit", None],
+        })
+
+    def test_mascara_vectorizada_coincide_con_es_repo_ai(self, etl):
+        """La máscara vectorizada reproduce _es_repo_ai fila a fila."""
+        df = self._repos_ai()
+        esperado = [
+            etl._es_repo_ai(row.repo_name, row.description, row.language)
+            for row in df.itertuples()
+        ]
+
+        assert etl._mask_repos_ai(df).tolist() == esperado
+
+    def test_modo_substring_conserva_conteo_historico(self, etl):
+        """En modo substring 'ai' cuenta dentro de 'openai' y 'rag' dentro de 'raggedy'."""
+        df = self._repos_ai()
+        with patch("github_etl.GITHUB_AI_KEYWORD_MATCH", "substring"):
+            mask = etl._mask_repos_ai(df)
+            conteos = etl._contar_keywords_ai(etl._texto_repos(df))
+
+        assert mask.tolist() == [True, True, True, True]
+        assert conteos["ai"] == 2
+        assert conteos["openai"] == 2
+        assert conteos["rag"] == 1
+        assert conteos["llm"] == 3
+
+    def test_modo_word_exige_limites_de_palabra(self, etl):
+        """En modo word solo cuentan keywords completas."""
+        df = self._repos_ai()
+        with patch("github_etl.GITHUB_AI_KEYWORD_MATCH", "word"):
+            mask = etl._mask_repos_ai(df)
+            conteos = etl._contar_keywords_ai(etl._texto_repos(df))
+
+        assert mask.tolist() == [True, False, True, True]
+        assert "ai" not in conteos
+        assert "rag" not in conteos
+        assert conteos["openai"] == 2
+        assert conteos["llm"] == 3
+
 
 class TestExtraerRepos:
     """Tests para extraer_repos con API mockeada."""
@@ -164,7 +253,7 @@ class TestExtraerRepos:
         }
         mock_response.headers = {"X-RateLimit-Remaining": "100"}
 
-        with patch("github_etl.requests.get", return_value=mock_response):
+        with patch.object(etl.http, "get", return_value=mock_response):
             with patch("base_etl.ARCHIVOS_SALIDA", {"github_repos": tmp_path / "repos.csv"}):
                 etl.extraer_repos(max_repos=1)
 
@@ -205,26 +294,261 @@ class TestExtraerRepos:
                 {"q": "created:2025-07-01..2025-07-31", "pages": 1, "label": "jul"},
             ],
         ):
-            with patch("github_etl.requests.get", side_effect=[
-                _response([repo_low, repo_high]),
-                _response([repo_high]),
-            ]):
+            responses = {
+                "created:2025-06-01..2025-06-30": _response([repo_low, repo_high]),
+                "created:2025-07-01..2025-07-31": _response([repo_high]),
+            }
+            with patch.object(
+                etl.http,
+                "get",
+                side_effect=lambda url, params: responses[params["q"]],
+            ):
                 with patch("base_etl.ARCHIVOS_SALIDA", {"github_repos": tmp_path / "repos.csv"}):
                     etl.extraer_repos(max_repos=2)
 
         assert etl.df_repos["repo_name"].tolist() == ["test/high", "test/low"]
 
+    def test_extraer_repos_stops_after_consecutive_failures(self, etl):
+        """Verifica que el circuito de fallos detenga todas las particiones."""
+        error_response = MagicMock()
+        error_response.status_code = 500
+        queries = [
+            {"q": f"created:2025-{month:02d}-01..2025-{month:02d}-28", "pages": 3, "label": str(month)}
+            for month in range(1, 7)
+        ]
+
+        with patch.object(etl, "_build_repo_search_queries", return_value=queries):
+            with patch("github_etl.GITHUB_SEARCH_MAX_CONCURRENCY", 1):
+                with patch.object(etl.http, "get", return_value=error_response) as mocked:
+                    with pytest.raises(Exception):
+                        etl.extraer_repos(max_repos=1)
+
+        assert mocked.call_count == 5
+
     def test_extraer_repos_handles_empty_response(self, etl):
         """Test que verifica que una respuesta vacía de API lance ETLExtractionError."""
         mock_response = MagicMock()
         mock_response.status_code = 200
         mock_response.json.return_value = {"items": []}
 
-        with patch("github_etl.requests.get", return_value=mock_response):
+        with patch.object(etl.http, "get", return_value=mock_response):
             with pytest.raises(Exception):
                 etl.extraer_repos(max_repos=1)
 
 
+class TestAdaptivePartitioner:
+    """Tests del particionado adaptativo por densidad de resultados."""
+
+    @staticmethod
+    def _fake_probe(repos_per_day, stars_cutoff):
+        """Simula total_count: ``repos_per_day`` repos por dia con stars >= cutoff."""
+        def _probe(q):
+            created = q.split("created:")[1].split()[0]
+            start, end = (pd.Timestamp(value) for value in created.split(".."))
+            days = (end - start).days + 1
+            threshold = int(q.split("stars:>=")[1]) if "stars:>=" in q else 0
+            return days * repos_per_day if threshold <= stars_cutoff else 0
+        return _probe
+
+    def test_find_star_threshold_keeps_target_coverage(self, etl):
+        stars = list(range(1, 5001))
+
+        def _probe(q):
+            threshold = int(q.split("stars:>=")[1])
+            return sum(1 for value in stars if value >= threshold)
+
+        with patch.object(etl, "_probe_search_total", side_effect=_probe):
+            threshold = etl._find_star_threshold("created:2025-01-01..2025-12-31", 1000)
+
+        covered = sum(1 for value in stars if value >= threshold)
+        assert covered >= 1000
+        assert covered <= 1000 * 1.05 + 1
+
+    def test_adaptive_partitions_stay_under_search_cap(self, etl):
+        with patch("github_etl.GITHUB_SEARCH_PARTITION_MODE", "adaptive"), \
+                patch("github_etl.FECHA_INICIO_STR", "2025-01-01"), \
+                patch("github_etl.FECHA_FIN_STR", "2025-01-31"), \
+                patch.object(etl, "_find_star_threshold", return_value=50), \
+                patch.object(etl, "_probe_search_total", side_effect=self._fake_probe(120, 50)):
+            queries = etl._build_repo_search_queries(max_repos=3000)
+
+        assert len(queries) > 1
+        assert all("stars:>=50" in query["q"] for query in queries)
+        assert all(query["pages"] <= 10 for query in queries)
+
+        days = []
+        for query in queries:
+            start, end = (pd.Timestamp(value) for value in query["label"].split(".."))
+            days.extend(pd.date_range(start, end, freq="D"))
+            assert ((end - start).days + 1) * 120 <= 1000
+        assert days == list(pd.date_range("2025-01-01", "2025-01-31", freq="D"))
+
+    def test_adaptive_falls_back_to_monthly_when_probe_fails(self, etl):
+        with patch("github_etl.GITHUB_SEARCH_PARTITION_MODE", "adaptive"), \
+                patch.object(etl, "_probe_search_total", return_value=None):
+            queries = etl._build_repo_search_queries(max_repos=3000)
+
+        assert len(queries) >= 12
+        assert all("stars:" not in query["q"] for query in queries)
+
+
+class TestExtraerReposCheckpoint:
+    """Tests del checkpoint y la reanudacion de extraer_repos."""
+
+    QUERIES = [
+        {"q": "created:2025-01-01..2025-01-31", "pages": 1, "label": "jan"},
+        {"q": "created:2025-02-01..2025-02-28", "pages": 1, "label": "feb"},
+    ]
+
+    @staticmethod
+    def _item(name, stars):
+        return {
+            "full_name": name,
+            "language": "Python",
+            "stargazers_count": stars,
+            "forks_count": 1,
+            "created_at": "2025-01-15",
+            "description": "",
+        }
+
+    def _fake_get(self, searched, fail_feb):
+        def _get(url, params=None):
+            searched.append(params["q"])
+            response = MagicMock()
+            response.headers = {}
+            if "2025-02" in params["q"] and fail_feb:
+                response.status_code = 500
+                return response
+            response.status_code = 200
+            name = "jan/repo" if "2025-01" in params["q"] else "feb/repo"
+            response.json.return_value = {"items": [self._item(name, 10)]}
+            return response
+        return _get
+
+    def test_resume_skips_completed_partitions(self, tmp_path, _checkpoint_path):
+        first = GitHubETL()
+        first.configurar_logging()
+        searched = []
+        with patch.object(first, "_build_repo_search_queries", return_value=self.QUERIES), \
+                patch("github_etl.GITHUB_SEARCH_MAX_CONCURRENCY", 1), \
+                patch.object(first.http, "get", side_effect=self._fake_get(searched, fail_feb=True)), \
+                patch.object(first, "_validate_repo_coverage", return_value=None), \
+                patch("base_etl.ARCHIVOS_SALIDA", {"github_repos": tmp_path / "repos.csv"}):
+            first.extraer_repos(max_repos=10)
+
+        assert _checkpoint_path.exists()
+
+        resumed = GitHubETL(resume=True)
+        searched.clear()
+        with patch.object(resumed, "_build_repo_search_queries", side_effect=AssertionError("sin re-plan")), \
+                patch.object(resumed.http, "get", side_effect=self._fake_get(searched, fail_feb=False)), \
+                patch.object(resumed, "_validate_repo_coverage", return_value=None), \
+                patch("base_etl.ARCHIVOS_SALIDA", {"github_repos": tmp_path / "repos.csv"}):
+            resumed.extraer_repos(max_repos=10)
+
+        assert searched == ["created:2025-02-01..2025-02-28"]
+        assert sorted(resumed.df_repos["repo_name"]) == ["feb/repo", "jan/repo"]
+        assert not _checkpoint_path.exists()
+
+    def test_main_parses_resume_flag(self):
+        with patch("github_etl.GitHubETL") as etl_class:
+            from github_etl import main
+            main(["--resume"])
+
+        etl_class.assert_called_once_with(resume=True)
+        etl_class.return_value.ejecutar.assert_called_once()
+
+
+class TestExtraerReposIncremental:
+    """Tests del modo incremental sobre el snapshot previo de repos."""
+
+    QUERIES = [
+        {"q": "created:2025-01-01..2025-01-31", "pages": 1, "label": "2025-01-01..2025-01-31"},
+        {"q": "created:2025-12-01..2025-12-31", "pages": 1, "label": "2025-12-01..2025-12-31"},
+    ]
+
+    @staticmethod
+    def _write_snapshot(history_dir):
+        snapshot_dir = history_dir / "github_repos" / "year=2026" / "month=01" / "day=05"
+        snapshot_dir.mkdir(parents=True)
+        pd.DataFrame({
+            "repo_name": ["old/repo", "gone/repo", "new/stale"],
+            "language": ["Python", "Go", "Rust"],
+            "stars": [100, 50, 10],
+            "forks": [10, 5, 1],
+            "created_at": ["2025-01-10T00:00:00Z", "2025-01-12T00:00:00Z", "2025-12-10T00:00:00Z"],
+            "description": ["old", "", "stale"],
+        }).to_csv(snapshot_dir / "github_repos_2025.csv", index=False)
+
+    @staticmethod
+    def _fake_get(old_stars, searched):
+        def _get(url, params=None):
+            response = MagicMock()
+            response.status_code = 200
+            response.headers = {}
+            if url.endswith("/search/repositories"):
+                searched.append(params["q"])
+                response.json.return_value = {"items": [{
+                    "full_name": "new/repo",
+                    "language": "Rust",
+                    "stargazers_count": 80,
+                    "forks_count": 3,
+                    "created_at": "2025-12-15T00:00:00Z",
+                    "description": "new",
+                }] if "2025-12" in params["q"] else []}
+            elif url.endswith("/repos/gone/repo"):
+                response.status_code = 404
+            else:
+                response.json.return_value = {"stargazers_count": old_stars, "forks_count": 11}
+            return response
+        return _get
+
+    def _run(self, etl, tmp_path, old_stars, window_start="2025-01-01"):
+        self._write_snapshot(tmp_path / "history")
+        searched = []
+        with patch("github_etl.GITHUB_INCREMENTAL_MODE", True), \
+                patch("github_etl.DATOS_HISTORY_DIR", tmp_path / "history"), \
+                patch("github_etl.FECHA_INICIO_STR", window_start), \
+                patch("github_etl.FECHA_FIN_STR", "2025-12-31"), \
+                patch.object(etl, "_build_repo_search_queries", return_value=self.QUERIES), \
+                patch.object(etl, "_validate_repo_coverage", return_value=None), \
+                patch.object(etl.http, "get", side_effect=self._fake_get(old_stars, searched)), \
+                patch("base_etl.ARCHIVOS_SALIDA", {"github_repos": tmp_path / "repos.csv"}):
+            etl.extraer_repos(max_repos=10)
+        return searched
+
+    def test_recrawls_only_recent_partitions(self, etl, tmp_path):
+        searched = self._run(etl, tmp_path, old_stars=105)
+
+        assert searched == ["created:2025-12-01..2025-12-31"]
+        stars = dict(zip(etl.df_repos["repo_name"], etl.df_repos["stars"]))
+        assert stars == {"old/repo": 105, "new/repo": 80}
+
+    def test_drops_retained_repos_created_before_window_start(self, etl, tmp_path):
+        """La ventana movil avanza: repos previos a FECHA_INICIO no se retienen."""
+        self._run(etl, tmp_path, old_stars=105, window_start="2025-01-11")
+
+        assert "old/repo" not in etl.df_repos["repo_name"].tolist()
+
+    def test_logs_retained_repos_kept_stale(self, etl, tmp_path, caplog):
+        """Los repos fuera de la muestra conservan valores del snapshot y se reportan."""
+        with patch("github_etl.GITHUB_INCREMENTAL_SAMPLE_SIZE", 0):
+            refreshed, drift = etl._refresh_retained_repos([
+                {"repo_name": "a/b", "stars": 10, "forks": 1},
+                {"repo_name": "c/d", "stars": 5, "forks": 0},
+            ])
+
+        assert drift is None
+        assert set(refreshed) == {"a/b", "c/d"}
+        assert "2 repos retenidos conservan stars/forks del snapshot" in caplog.text
+
+    def test_falls_back_to_full_crawl_when_drift_exceeds_tolerance(self, etl, tmp_path):
+        searched = self._run(etl, tmp_path, old_stars=500)
+
+        assert sorted(searched) == ["created:2025-01-01..2025-01-31", "created:2025-12-01..2025-12-31"]
+        assert etl.df_repos["repo_name"].tolist() == ["new/repo"]
+
+
 class TestAnalizarCorrelacion:
     """Tests para analizar_correlacion."""
 
@@ -250,11 +574,13 @@ class TestAnalizarCorrelacion:
             response.headers = {}
             return response
 
-        with patch("github_etl.requests.get", side_effect=[
-            _contributors_response(304),
-            _contributors_response(274),
-            _contributors_response(90),
-        ]):
+        totals = {"vercel/next.js": 304, "angular/angular": 274, "facebook/react": 90}
+
+        def _fake_get(url, **kwargs):
+            repo_name = url.split("/repos/")[1].rsplit("/contributors", 1)[0]
+            return _contributors_response(totals[repo_name])
+
+        with patch.object(etl.http, "get", side_effect=_fake_get):
             with patch("github_etl.time.sleep", return_value=None):
                 with patch("base_etl.WRITE_LEGACY_CSV", True):
                     with patch("base_etl.WRITE_LATEST_CSV", False):
@@ -267,6 +593,8 @@ class TestAnalizarCorrelacion:
 
         df = pd.read_csv(tmp_path / "github_correlacion.csv")
 
+        assert dict(zip(df["repo_name"], df["contributors"])) == totals
+
         assert "engagement_ratio" in df.columns
         assert "contributors_per_1k_stars" in df.columns
         assert "expected_contributors" in df.columns
@@ -284,9 +612,208 @@ class TestAnalizarCorrelacion:
         assert str(next_row["snapshot_date_utc"]).strip()
 
 
+class TestCommitStats:
+    """Tests de metricas de commits via /stats con paginacion de respaldo."""
+
+    WEEK_ZERO = int(pd.Timestamp("2025-01-05", tz="UTC").timestamp())
+
+    def _weeks(self):
+        return [
+            {"week": self.WEEK_ZERO + index * 7 * 86400, "total": 1, "days": [1, 0, 0, 0, 0, 0, 0]}
+            for index in range(52)
+        ]
+
+    def _contributors(self, total):
+        return [
+            {"author": {"login": f"dev{index}"}, "weeks": [{"w": self.WEEK_ZERO, "c": 1}]}
+            for index in range(total)
+        ] + [{"author": {"login": "inactive"}, "weeks": [{"w": self.WEEK_ZERO - 400 * 86400, "c": 5}]}]
+
+    @staticmethod
+    def _commit(date, login):
+        return {"sha": f"{login}-{date}", "author": {"login": login}, "commit": {"author": {"date": date}}}
+
+    def _fake_get(self, contributors_total, pending_first=False, gap_commits=(), paged_commits=()):
+        state = {"pending": pending_first}
+
+        def _get(url, params=None):
+            response = MagicMock()
+            response.status_code = 200
+            if url.endswith("/stats/commit_activity"):
+                if state["pending"]:
+                    state["pending"] = False
+                    response.status_code = 202
+                response.json.return_value = self._weeks()
+            elif url.endswith("/stats/contributors"):
+                response.json.return_value = self._contributors(contributors_total)
+            elif url.endswith("/commits") and params.get("page") == 1:
+                response.json.return_value = list(gap_commits if "until" in params else paged_commits)
+            else:
+                response.json.return_value = []
+            return response
+        return _get
+
+    def _collect(self, etl, fake_get):
+        with patch("github_etl.FECHA_INICIO_STR", "2025-01-03"), \
+                patch("github_etl.FECHA_FIN_STR", "2026-01-03"), \
+                patch("github_etl.time.sleep", return_value=None) as sleep_mock, \
+                patch.object(etl.http, "get", side_effect=fake_get) as mocked, \
+                patch.object(etl, "_count_search_items", return_value=0), \
+                patch.object(etl, "_count_releases_since", return_value=0):
+            metrics = etl._collect_framework_metrics("React", "facebook/react")
+        urls = [call.args[0] for call in mocked.call_args_list]
+        return metrics, urls, sleep_mock
+
+    def test_builds_monthly_counts_from_commit_activity(self, etl):
+        metrics, urls, sleep_mock = self._collect(etl, self._fake_get(3, pending_first=True))
+
+        assert metrics["commits_2025"] == 52
+        assert metrics["monthly_commits"]["2025-01"] == 4
+        assert sum(metrics["monthly_commits"].values()) == 52
+        assert metrics["active_contributors"] == 3
+        assert sleep_mock.call_count == 1
+
+    def test_counts_days_before_first_stats_week(self, etl):
+        """Los dias entre FECHA_INICIO y la primera semana de stats se paginan aparte."""
+        gap = [self._commit("2025-01-04T10:00:00Z", "ana"), self._commit("2025-01-03T09:00:00Z", "bob")]
+        with patch.object(etl, "_page_commit_history") as full_paging:
+            metrics, _, _ = self._collect(etl, self._fake_get(3, gap_commits=gap))
+
+        assert metrics["commits_2025"] == 54
+        assert metrics["monthly_commits"]["2025-01"] == 6
+        full_paging.assert_not_called()
+
+    def test_completes_capped_contributors_without_repaging_commit_totals(self, etl):
+        """Con la lista de stats llena solo se pagina para contributors, acotado por paginas."""
+        paged = [self._commit("2025-02-01T00:00:00Z", "dev0"), self._commit("2025-02-02T00:00:00Z", "newcomer")]
+        with patch("github_etl.GITHUB_STATS_CONTRIBUTORS_MAX_PAGES", 3), \
+                patch.object(etl, "_page_commit_history") as full_paging:
+            metrics, _, _ = self._collect(etl, self._fake_get(100, paged_commits=paged))
+
+        assert metrics["commits_2025"] == 52
+        assert metrics["active_contributors"] == 101
+        full_paging.assert_not_called()
+
+
+    def test_fallback_paging_logs_the_framework_name(self, etl, caplog):
+        """Los errores de la paginacion de respaldo se registran con el nombre del framework."""
+        base_get = self._fake_get(100)
+
+        def _get(url, params=None):
+            if url.endswith("/commits"):
+                return MagicMock(status_code=500)
+            return base_get(url, params)
+
+        with caplog.at_level("ERROR"):
+            self._collect(etl, _get)
+
+        errors = [record.getMessage() for record in caplog.records if "Error obteniendo commits" in record.getMessage()]
+        assert errors
+        assert all("React" in message and "facebook/react" not in message for message in errors)
+
+
+class TestCommitStore:
+    """Tests del modo store (historial incremental de commits)."""
+
+    @staticmethod
+    def _commit(sha, date, login):
+        return {
+            "sha": sha,
+            "author": {"login": login},
+            "commit": {"author": {"date": date}, "committer": {"date": date}},
+        }
+
+    def _run(self, etl, store_path, commits, calls):
+        def _get(url, params=None):
+            calls.append(dict(params or {}))
+            response = MagicMock()
+            response.status_code = 200
+            response.json.return_value = commits if params and params.get("page") == 1 else []
+            return response
+
+        with patch("github_etl.GITHUB_COMMITS_MODE", "store"), \
+                patch("github_etl.GITHUB_COMMIT_STORE_PATH", store_path), \
+                patch("github_etl.FECHA_INICIO_STR", "2025-01-01"), \
+                patch("github_etl.FECHA_FIN_STR", "2025-12-31"), \
+                patch("github_etl.FECHA_INICIO_ISO", "2025-01-01T00:00:00Z"), \
+                patch.object(etl.http, "get", side_effect=_get):
+            etl.commit_store = CommitHistoryStore(store_path)
+            return etl._collect_framework_metrics("React", "facebook/react")
+
+    def test_second_run_only_fetches_since_checkpoint(self, etl, tmp_path):
+        store_path = tmp_path / "store.json"
+        calls = []
+        with patch.object(etl, "_count_search_items", return_value=0), \
+                patch.object(etl, "_count_releases_since", return_value=0):
+            first = self._run(etl, store_path, [
+                self._commit("b", "2025-03-02T00:00:00Z", "bob"),
+                self._commit("a", "2025-02-01T00:00:00Z", "ana"),
+            ], calls)
+            etl.commit_store.save()
+            calls.clear()
+            second = self._run(etl, store_path, [
+                self._commit("c", "2025-04-01T00:00:00Z", "carl"),
+                self._commit("b", "2025-03-02T00:00:00Z", "bob"),
+            ], calls)
+
+        assert first["commits_2025"] == 2
+        assert calls[0]["since"] == "2025-03-02T00:00:00Z"
+        assert second["commits_2025"] == 3
+        assert second["active_contributors"] == 3
+        assert second["monthly_commits"] == {"2025-02": 1, "2025-03": 1, "2025-04": 1}
+
+    def test_previous_commits_map_prefers_store_runs(self, etl, tmp_path):
+        etl.commit_store = CommitHistoryStore(tmp_path / "store.json")
+        etl.commit_store.record_run({"React": 42}, "2026-01-01")
+
+        assert etl._load_previous_commits_map() == ({"React": 42}, "2026-01-01")
+
+
 class TestAnalizarCommitsFrameworks:
     """Tests para actividad de frameworks con métricas extendidas."""
 
+    def test_collect_metrics_reuses_graphql_counts(self, etl):
+        """Verifica que los conteos de GraphQL eviten las llamadas REST equivalentes."""
+        etl._framework_activity = {
+            "facebook/react": {"merged_prs": 12, "closed_issues": 30, "releases_count": None},
+        }
+        commits_response = MagicMock()
+        commits_response.status_code = 200
+        commits_response.json.return_value = []
+
+        with patch.object(etl.http, "get", return_value=commits_response) as mocked:
+            metrics = etl._collect_framework_metrics("React", "facebook/react")
+
+        urls = [call.args[0] for call in mocked.call_args_list]
+        assert not any("/search/issues" in url for url in urls)
+        assert any(url.endswith("/releases") for url in urls)
+        assert metrics["merged_prs"] == 12
+        assert metrics["closed_issues"] == 30
+
+    def test_collect_metrics_bounds_sub_query_concurrency(self, etl):
+        """Verifica que las sub-consultas de un framework respeten su limite de hilos."""
+        state = {"active": 0, "peak": 0}
+        lock = threading.Lock()
+
+        def _slow_count(*_args):
+            with lock:
+                state["active"] += 1
+                state["peak"] = max(state["peak"], state["active"])
+            time.sleep(0.02)
+            with lock:
+                state["active"] -= 1
+            return 0
+
+        with patch("github_etl.GITHUB_COMMITS_MODE", "paging"), \
+                patch("github_etl.GITHUB_FRAMEWORK_TASK_CONCURRENCY", 2), \
+                patch.object(etl, "_count_search_items", side_effect=_slow_count), \
+                patch.object(etl, "_count_releases_since", side_effect=_slow_count), \
+                patch.object(etl, "_page_commit_history", return_value=(0, {}, 0)):
+            metrics = etl._collect_framework_metrics("React", "facebook/react")
+
+        assert state["peak"] == 2
+        assert metrics["releases_count"] == 0
+
     def test_commits_schema_extendido_y_delta(self, etl, tmp_path):
         previous_map = {
             "React": 100,
@@ -388,3 +915,35 @@ class TestAnalizarCommitsFrameworks:
             set(monthly_df.columns)
         )
         assert (monthly_df["framework"] == "React").any()
+
+    def test_parallel_collection_keeps_deterministic_ranking(self, etl, tmp_path):
+        """Verifica que los empates respeten el orden de FRAMEWORK_REPOS aunque terminen desordenados."""
+        frameworks = {f"FW{index}": f"org/fw{index}" for index in range(6)}
+
+        def _fake_collect(framework, repo_path):
+            index = int(framework[2:])
+            time.sleep(0.005 * (6 - index))
+            return {
+                "framework": framework,
+                "repo": repo_path,
+                "commits_2025": 10 if index % 2 else 20,
+                "active_contributors": 1,
+                "merged_prs": 0,
+                "closed_issues": 0,
+                "releases_count": 0,
+                "monthly_commits": {},
+            }
+
+        with patch("github_etl.FRAMEWORK_REPOS", frameworks), \
+                patch("github_etl.GITHUB_FRAMEWORK_MAX_CONCURRENCY", 6), \
+                patch.object(etl, "_load_previous_commits_map", return_value=({}, None)), \
+                patch.object(etl, "_collect_framework_metrics", side_effect=_fake_collect), \
+                patch("base_etl.ARCHIVOS_SALIDA", {
+                    "github_commits": tmp_path / "commits.csv",
+                    "github_commits_monthly": tmp_path / "monthly.csv",
+                }):
+            etl.analizar_commits_frameworks()
+
+        commits_df = pd.read_csv(tmp_path / "commits.csv")
+        assert commits_df["framework"].tolist() == ["FW0", "FW2", "FW4", "FW1", "FW3", "FW5"]
+        assert commits_df["ranking"].tolist() == [1, 2, 3, 4, 5, 6]
@@ -0,0 +1,95 @@
+"""
+Tests para github_graphql.py - lotes GraphQL para metricas por repo.
+"""
+import logging
+from unittest.mock import MagicMock
+
+from github_graphql import GitHubGraphQLBackend
+
+
+def _response(data, errors=None, status_code=200):
+    response = MagicMock()
+    response.status_code = status_code
+    response.json.return_value = {"data": data, "errors": errors or []}
+    return response
+
+
+def _backend(responses, batch_size=25):
+    http = MagicMock()
+    http.post.side_effect = responses
+    return GitHubGraphQLBackend(http, logging.getLogger("test"), batch_size=batch_size), http
+
+
+class TestFetchRepoCounts:
+    """Tests del refresco de stars/forks por lotes."""
+
+    def test_batches_with_aliases_and_marks_missing_repos(self):
+        backend, http = _backend([
+            _response(
+                {"r0": {"stargazerCount": 10, "forkCount": 1}, "r1": None},
+                errors=[{"type": "NOT_FOUND", "path": ["r1"], "message": "not found"}],
+            ),
+            _response({"r0": {"stargazerCount": 7, "forkCount": 2}}),
+        ], batch_size=2)
+
+        counts = backend.fetch_repo_counts(["a/one", "b/gone", "c/three"])
+
+        assert http.post.call_count == 2
+        first_query = http.post.call_args_list[0].kwargs["json"]["query"]
+        assert 'r0: repository(owner: "a", name: "one")' in first_query
+        assert 'r1: repository(owner: "b", name: "gone")' in first_query
+        assert counts == {
+            "a/one": {"stars": 10, "forks": 1},
+            "b/gone": {},
+            "c/three": {"stars": 7, "forks": 2},
+        }
+        assert backend.queries_sent == 2
+
+    def test_other_partial_errors_leave_repos_unknown(self):
+        """Un alias nulo por FORBIDDEN/TIMEOUT no se confunde con un repo eliminado."""
+        backend, _ = _backend([_response(
+            {"r0": None, "r1": None, "r2": {"stargazerCount": 3, "forkCount": 0}},
+            errors=[
+                {"type": "FORBIDDEN", "path": ["r0"], "message": "forbidden"},
+                {"type": "NOT_FOUND", "path": ["r1"], "message": "not found"},
+            ],
+        )])
+
+        counts = backend.fetch_repo_counts(["a/private", "b/gone", "c/ok"])
+
+        assert counts == {"b/gone": {}, "c/ok": {"stars": 3, "forks": 0}}
+
+    def test_failed_batch_leaves_repos_unknown(self):
+        backend, _ = _backend([_response(None, status_code=502)])
+
+        assert backend.fetch_repo_counts(["a/one"]) == {}
+
+
+class TestFetchFrameworkActivity:
+    """Tests de PRs, issues y releases en una sola query."""
+
+    def test_parses_counts_and_flags_release_overflow(self):
+        backend, http = _backend([_response({
+            "r0": {"releases": {
+                "pageInfo": {"hasNextPage": True},
+                "nodes": [{"publishedAt": "2025-06-01T00:00:00Z"}, {"publishedAt": "2024-01-01T00:00:00Z"}],
+            }},
+            "p0": {"issueCount": 12},
+            "i0": {"issueCount": 30},
+            "r1": {"releases": {
+                "pageInfo": {"hasNextPage": True},
+                "nodes": [{"publishedAt": "2025-06-01T00:00:00Z"}],
+            }},
+            "p1": None,
+            "i1": {"issueCount": 4},
+        })])
+
+        activity = backend.fetch_framework_activity(
+            ["facebook/react", "vuejs/core"], "2025-01-01", "2025-12-31", "2025-01-01T00:00:00Z"
+        )
+
+        assert http.post.call_count == 1
+        query = http.post.call_args.kwargs["json"]["query"]
+        assert 'repo:facebook/react is:pr is:merged merged:2025-01-01..2025-12-31' in query
+        assert activity["facebook/react"] == {"merged_prs": 12, "closed_issues": 30, "releases_count": 1}
+        assert activity["vuejs/core"] == {"merged_prs": None, "closed_issues": 4, "releases_count": None}
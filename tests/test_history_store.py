@@ -0,0 +1,94 @@
+"""Tests para history_store.py - copias Parquet de snapshots historicos."""
+import os
+
+import pandas as pd
+import pytest
+
+import history_store
+from history_store import contract_frame, parquet_path_for, read_snapshot
+
+
+def _lenguajes_df():
+    return pd.DataFrame({
+        "lenguaje": ["Python", "Go"],
+        "repos_count": ["10", "4"],
+        "porcentaje": ["71.4", "28.6"],
+    })
+
+
+def test_contract_frame_aplica_tipos_del_contrato():
+    """Las columnas toman los dtypes declarados en CSV_SCHEMA_CONTRACT."""
+    df = contract_frame(_lenguajes_df(), "github_lenguajes")
+
+    assert df["repos_count"].dtype == "int64"
+    assert df["porcentaje"].dtype == "float64"
+    assert df["repos_count"].tolist() == [10, 4]
+
+
+def test_contract_frame_conserva_fechas_como_texto():
+    """Las columnas datetime se guardan como texto ISO igual que en el CSV."""
+    df = pd.DataFrame({
+        "repo_name": ["a/b"],
+        "language": ["Python"],
+        "stars": [1.0],
+        "forks": [0],
+        "created_at": ["2025-02-15T00:00:00Z"],
+        "description": ["x"],
+    })
+
+    typed = contract_frame(df, "github_repos")
+
+    assert typed["created_at"].tolist() == ["2025-02-15T00:00:00Z"]
+    assert typed["stars"].dtype == "int64"
+    assert typed["description"].tolist() == ["x"]
+
+
+def test_read_snapshot_usa_csv_sin_pyarrow(tmp_path, monkeypatch):
+    """Sin pyarrow se lee el CSV aunque exista un Parquet al lado."""
+    csv_path = tmp_path / "out.csv"
+    _lenguajes_df().to_csv(csv_path, index=False)
+    parquet_path_for(csv_path).write_bytes(b"no es parquet")
+    monkeypatch.setattr(history_store, "pyarrow", None)
+
+    df = read_snapshot(csv_path)
+
+    assert df["lenguaje"].tolist() == ["Python", "Go"]
+
+
+def test_read_snapshot_prefiere_parquet_vigente(tmp_path):
+    """Con pyarrow se lee el Parquet salvo que el CSV sea mas reciente."""
+    pytest.importorskip("pyarrow")
+    csv_path = tmp_path / "out.csv"
+    _lenguajes_df().to_csv(csv_path, index=False)
+    parquet_df = _lenguajes_df().assign(lenguaje=["Rust", "Go"])
+    history_store.write_parquet(parquet_df, "github_lenguajes", csv_path)
+
+    assert read_snapshot(csv_path)["lenguaje"].tolist() == ["Rust", "Go"]
+
+    stale = os.path.getmtime(parquet_path_for(csv_path)) - 10
+    os.utime(parquet_path_for(csv_path), (stale, stale))
+    assert read_snapshot(csv_path)["lenguaje"].tolist() == ["Python", "Go"]
+
+
+def test_read_snapshot_devuelve_nan_como_el_csv(tmp_path):
+    """Las celdas vacias vuelven como NaN (no pd.NA) y el export las procesa."""
+    pytest.importorskip("pyarrow")
+    from export_history_json import _prepare_trend_snapshot_df
+
+    csv_path = tmp_path / "trend_score.csv"
+    df = pd.DataFrame({
+        "ranking": [1, 2],
+        "tecnologia": ["Python", None],
+        "trend_score": [80.0, 20.0],
+        "fuentes": [3, None],
+    })
+    df.to_csv(csv_path, index=False)
+    history_store.write_parquet(df, "trend_score", csv_path)
+
+    desde_parquet = read_snapshot(csv_path)
+    desde_csv = pd.read_csv(csv_path)
+
+    assert desde_parquet.dtypes.to_dict() == desde_csv.dtypes.to_dict()
+    assert pd.isna(desde_parquet.loc[1, "tecnologia"]) and desde_parquet.loc[1, "tecnologia"] is not pd.NA
+    _prepare_trend_snapshot_df(desde_parquet)
+
@@ -0,0 +1,121 @@
+"""
+Tests para http_cache.py - cache condicional persistente de respuestas HTTP.
+"""
+from unittest.mock import patch
+
+import pytest
+import requests
+
+from http_cache import HttpResponseCache
+from http_client import SourceHttpClient
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 1_000_000.0
+
+    def __call__(self):
+        return self.now
+
+
+def _response(status_code=200, body=b"[]", headers=None, url="https://api.github.com/x"):
+    response = requests.Response()
+    response.status_code = status_code
+    response._content = body
+    response.headers.update(headers or {})
+    response.url = url
+    return response
+
+
+@pytest.fixture
+def clock():
+    return FakeClock()
+
+
+@pytest.fixture
+def cache(tmp_path, clock):
+    return HttpResponseCache(tmp_path / "cache", max_bytes=1024, clock=clock)
+
+
+class TestHttpResponseCache:
+    """Tests del almacenamiento en disco."""
+
+    def test_key_includes_params(self):
+        base = "https://api.github.com/repos/a/b/contributors"
+        assert HttpResponseCache.key_for(base, {"page": 1}) != HttpResponseCache.key_for(base, {"page": 2})
+        assert HttpResponseCache.key_for(base, {"page": 1}) == HttpResponseCache.key_for(f"{base}?page=1")
+
+    def test_stores_only_responses_with_validators(self, cache):
+        assert cache.store("a", _response(headers={"ETag": '"v1"'})) is True
+        assert cache.store("b", _response()) is False
+        assert cache.lookup("b") is None
+
+        entry = cache.lookup("a")
+        assert entry["body"] == b"[]"
+        assert cache.conditional_headers(entry) == {"If-None-Match": '"v1"'}
+
+    def test_evicts_least_recently_used_entries(self, cache, clock):
+        cache.store("old", _response(body=b"x" * 600, headers={"ETag": '"1"'}))
+        clock.now += 10
+        cache.store("recent", _response(body=b"y" * 300, headers={"ETag": '"2"'}))
+        clock.now += 10
+        cache.lookup("old")
+        clock.now += 10
+        cache.store("new", _response(body=b"z" * 300, headers={"ETag": '"3"'}))
+
+        assert cache.lookup("recent") is None
+        assert cache.lookup("old") is not None
+        assert cache.lookup("new") is not None
+
+    def test_freshness_follows_max_age(self, cache, clock):
+        cache.store("k", _response(headers={"ETag": '"1"', "Cache-Control": "private, max-age=60"}))
+        entry = cache.lookup("k")
+        assert cache.is_fresh(entry) is True
+
+        clock.now += 61
+        assert cache.is_fresh(entry) is False
+
+
+class TestClientWithCache:
+    """Tests del flujo condicional dentro del cliente HTTP."""
+
+    def test_revalidates_and_serves_body_on_304(self, cache):
+        client = SourceHttpClient("github", cache=cache)
+        url = "https://api.github.com/repos/a/b/contributors"
+        first = _response(
+            body=b'[{"login": "x"}]',
+            headers={"ETag": '"abc"', "Link": '<https://x?page=7>; rel="last"'},
+            url=url,
+        )
+        not_modified = _response(status_code=304, body=b"", headers={"X-RateLimit-Remaining": "4999"})
+
+        with patch.object(client.session, "request", side_effect=[first, not_modified]) as mocked:
+            client.get(url, params={"per_page": 1})
+            cached = client.get(url, params={"per_page": 1})
+
+        assert mocked.call_args.kwargs["headers"]["If-None-Match"] == '"abc"'
+        assert cached.status_code == 200
+        assert cached.json() == [{"login": "x"}]
+        assert 'rel="last"' in cached.headers["Link"]
+        assert cached.headers["X-RateLimit-Remaining"] == "4999"
+        assert cache.stats == {"hits": 0, "misses": 1, "not_modified": 1}
+
+    def test_fresh_entry_skips_network(self, cache):
+        client = SourceHttpClient("github", cache=cache)
+        url = "https://api.github.com/rate_limit"
+        first = _response(headers={"ETag": '"1"', "Cache-Control": "max-age=60"}, url=url)
+
+        with patch.object(client.session, "request", side_effect=[first]) as mocked:
+            client.get(url)
+            client.get(url)
+
+        assert mocked.call_count == 1
+        assert cache.stats["hits"] == 1
+
+    def test_streaming_requests_bypass_cache(self, cache):
+        client = SourceHttpClient("reddit", cache=cache)
+
+        with patch.object(client.session, "request", return_value=_response(headers={"ETag": '"1"'})):
+            client.get("https://www.reddit.com/r/webdev/.rss", stream=True)
+
+        assert cache.stats == {"hits": 0, "misses": 0, "not_modified": 0}
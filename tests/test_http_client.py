@@ -0,0 +1,90 @@
+"""
+Tests para http_client.py - cliente HTTP compartido entre ETLs.
+"""
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+import http_client
+from http_client import SourceHttpClient, get_http_client, close_http_clients
+
+
+@pytest.fixture(autouse=True)
+def _isolated_registry():
+    """Aisla el registro de clientes compartidos entre tests."""
+    with patch.dict(http_client._CLIENTS, clear=True):
+        yield
+
+
+class TestSourceHttpClient:
+    """Tests del cliente pooled por fuente."""
+
+    def test_applies_default_headers_and_timeout(self):
+        client = SourceHttpClient("github", {"Authorization": "token abc"})
+
+        with patch.object(client.session, "request", return_value=MagicMock()) as mocked:
+            client.get("https://api.github.com/rate_limit", params={"a": 1})
+
+        method, url = mocked.call_args.args
+        assert method == "GET"
+        assert url == "https://api.github.com/rate_limit"
+        assert mocked.call_args.kwargs["timeout"] == http_client.REQUEST_TIMEOUT_SECONDS
+        assert mocked.call_args.kwargs["params"] == {"a": 1}
+        assert client.session.headers["Authorization"] == "token abc"
+
+    def test_mounts_pooled_adapter_with_retry_policy(self):
+        client = SourceHttpClient("github")
+        adapter = client.session.get_adapter("https://api.github.com")
+
+        assert adapter.max_retries.total == http_client.HTTP_MAX_RETRIES
+        assert set(adapter.max_retries.status_forcelist) == set(http_client.RETRY_STATUS_CODES)
+        assert adapter._pool_maxsize == http_client.HTTP_POOL_MAXSIZE
+
+    def test_sources_with_own_loop_disable_adapter_retries(self):
+        """Con retries=0 un 5xx persistente no se reintenta en el adapter."""
+        client = SourceHttpClient("stackoverflow", retries=0)
+        adapter = client.session.get_adapter("https://api.stackexchange.com")
+
+        assert adapter.max_retries.total == 0
+        assert adapter.max_retries.status == 0
+
+    def test_scheduler_paces_and_observes_each_request(self):
+        scheduler = MagicMock()
+        client = SourceHttpClient("github", scheduler=scheduler)
+        response = MagicMock()
+
+        with patch.object(client.session, "request", return_value=response):
+            client.get("https://api.github.com/search/repositories")
+
+        scheduler.acquire.assert_called_once_with("https://api.github.com/search/repositories")
+        scheduler.observe.assert_called_once_with("https://api.github.com/search/repositories", response)
+
+    def test_set_default_headers_replaces_previous_credentials(self):
+        client = SourceHttpClient("reddit", {"Authorization": "Bearer old", "User-Agent": "ua"})
+        client.set_default_headers({"User-Agent": "ua"})
+
+        assert "Authorization" not in client.session.headers
+        assert client.session.headers["User-Agent"] == "ua"
+
+
+class TestClientRegistry:
+    """Tests del registro compartido de clientes."""
+
+    def test_returns_same_client_per_source(self):
+        first = get_http_client("github", {"Accept": "json"})
+        second = get_http_client("github")
+
+        assert first is second
+        assert second.session.headers["Accept"] == "json"
+
+    def test_refreshes_headers_on_existing_client(self):
+        client = get_http_client("reddit_oauth", {"Authorization": "Bearer one"})
+        get_http_client("reddit_oauth", {"Authorization": "Bearer two"})
+
+        assert client.session.headers["Authorization"] == "Bearer two"
+
+    def test_close_http_clients_clears_registry(self):
+        client = get_http_client("stackoverflow")
+        close_http_clients()
+
+        assert get_http_client("stackoverflow") is not client
@@ -0,0 +1,49 @@
+"""
+Tests para keyword_matcher.py - matching multi-keyword en una sola pasada.
+"""
+import pandas as pd
+
+from keyword_matcher import KeywordMatcher, compile_keyword
+
+
+GROUPS = {
+    "Spring": ["spring", "spring boot", "java spring"],
+    "Express": ["express", "node.js"],
+    "IA": ["ai", "openai"],
+    "DevOps": ["ci/cd"],
+}
+
+
+class TestKeywordMatcher:
+    """Tests de limites de palabra y solapamientos."""
+
+    def test_word_boundaries_match_single_keyword_rule(self):
+        matcher = KeywordMatcher(GROUPS)
+
+        assert matcher.labels_in("JavaScript and springs") == set()
+        assert matcher.labels_in("Using Node.js with AI") == {"Express", "IA"}
+        assert matcher.labels_in("openai released") == {"IA"}
+        assert matcher.labels_in("our ci/cd pipeline") == {"DevOps"}
+        assert matcher.labels_in("ci/cdx") == set()
+
+    def test_overlapping_keywords_with_different_labels(self):
+        matcher = KeywordMatcher({"Corto": ["spring"], "Largo": ["spring boot"]})
+
+        assert matcher.labels_in("spring boot 3") == {"Corto", "Largo"}
+        assert matcher.labels_in("spring bootcamp") == {"Corto"}
+
+    def test_match_frame_covers_whole_column(self):
+        matcher = KeywordMatcher(GROUPS)
+        frame = matcher.match_frame(pd.Series(["Spring Boot app", None, "express + ai"]))
+
+        assert list(frame.columns) == list(GROUPS)
+        assert frame["Spring"].tolist() == [True, False, False]
+        assert frame["Express"].tolist() == [False, False, True]
+        assert frame["IA"].tolist() == [False, False, True]
+
+    def test_compile_keyword_is_cached(self):
+        assert compile_keyword("django") is compile_keyword(" Django ")
+        assert compile_keyword("   ") is None
+
+    def test_empty_matcher(self):
+        assert KeywordMatcher({}).labels_in("anything") == set()
@@ -0,0 +1,51 @@
+"""
+Tests para parallel.py - ejecucion concurrente acotada.
+"""
+import threading
+import time
+
+from parallel import ConsecutiveFailureCircuit, map_bounded
+
+
+def test_preserves_input_order():
+    def slow_square(value):
+        time.sleep(0.01 * (5 - value))
+        return value * value
+
+    assert map_bounded(slow_square, range(5), max_workers=5) == [0, 1, 4, 9, 16]
+
+
+def test_serial_mode_runs_in_calling_thread():
+    threads = map_bounded(lambda _item: threading.get_ident(), range(3), max_workers=1)
+
+    assert set(threads) == {threading.get_ident()}
+
+
+def test_never_exceeds_worker_limit():
+    active = {"now": 0, "peak": 0}
+    lock = threading.Lock()
+
+    def track(_item):
+        with lock:
+            active["now"] += 1
+            active["peak"] = max(active["peak"], active["now"])
+        time.sleep(0.01)
+        with lock:
+            active["now"] -= 1
+
+    map_bounded(track, range(12), max_workers=3)
+
+    assert active["peak"] <= 3
+
+
+def test_circuit_opens_after_consecutive_failures_only():
+    circuit = ConsecutiveFailureCircuit(threshold=2)
+
+    assert circuit.record_failure() is False
+    circuit.record_success()
+    assert circuit.record_failure() is False
+    assert circuit.record_failure() is True
+    assert circuit.is_open is True
+
+    circuit.record_success()
+    assert circuit.is_open is True
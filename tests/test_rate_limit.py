@@ -0,0 +1,205 @@
+"""
+Tests para rate_limit.py - scheduler de requests segun cuota reportada.
+"""
+from unittest.mock import MagicMock
+
+import pytest
+
+from rate_limit import (
+    RateLimitBucket,
+    GitHubRateLimitScheduler,
+    RedditRateLimitScheduler,
+    StackExchangeRateLimitScheduler,
+)
+
+
+class FakeClock:
+    """Reloj manual: sleep avanza el tiempo sin esperar."""
+
+    def __init__(self):
+        self.now = 1000.0
+        self.sleeps = []
+
+    def __call__(self):
+        return self.now
+
+    def sleep(self, seconds):
+        self.sleeps.append(seconds)
+        self.now += seconds
+
+
+@pytest.fixture
+def clock():
+    return FakeClock()
+
+
+def _response(status_code=200, headers=None, payload=None):
+    response = MagicMock()
+    response.status_code = status_code
+    response.headers = headers or {}
+    response.json.return_value = payload or {}
+    return response
+
+
+class TestRateLimitBucket:
+    """Tests del bucket de tokens."""
+
+    def test_does_not_wait_while_budget_remains(self, clock):
+        bucket = RateLimitBucket(3, 60, clock=clock, sleep=clock.sleep)
+
+        waits = [bucket.acquire() for _ in range(3)]
+
+        assert waits == [0.0, 0.0, 0.0]
+        assert clock.sleeps == []
+
+    def test_waits_until_window_reset_when_exhausted(self, clock):
+        bucket = RateLimitBucket(1, 60, clock=clock, sleep=clock.sleep)
+        bucket.acquire()
+
+        waited = bucket.acquire()
+
+        assert waited == pytest.approx(60.0)
+        assert bucket.waited_seconds == pytest.approx(60.0)
+
+    def test_server_budget_overrides_local_tokens(self, clock):
+        bucket = RateLimitBucket(100, 3600, clock=clock, sleep=clock.sleep)
+        bucket.update_budget(remaining=0, reset_in_seconds=5, limit=100)
+
+        waited = bucket.acquire()
+
+        assert waited == pytest.approx(5.0)
+        assert bucket.tokens == 99
+
+    def test_block_for_enforces_backoff(self, clock):
+        bucket = RateLimitBucket(30, 1, clock=clock, sleep=clock.sleep)
+        bucket.block_for(10)
+
+        assert bucket.acquire() == pytest.approx(10.0)
+
+    def test_lets_request_through_when_wait_exceeds_maximum(self, clock):
+        bucket = RateLimitBucket(1, 3600, clock=clock, sleep=clock.sleep)
+        bucket.acquire()
+
+        waited = bucket.acquire(max_wait_seconds=300)
+
+        assert waited == 0.0
+        assert clock.sleeps == []
+
+
+class TestGitHubRateLimitScheduler:
+    """Tests del scheduler de GitHub."""
+
+    def test_search_and_core_use_separate_buckets(self, clock):
+        scheduler = GitHubRateLimitScheduler(clock=clock, sleep=clock.sleep)
+
+        assert scheduler.bucket_for("https://api.github.com/search/repositories") == "search"
+        assert scheduler.bucket_for("https://api.github.com/repos/a/b/contributors") == "core"
+
+    def test_reads_rate_limit_headers(self, clock, monkeypatch):
+        monkeypatch.setattr("rate_limit.time.time", lambda: 5000.0)
+        scheduler = GitHubRateLimitScheduler(clock=clock, sleep=clock.sleep)
+        scheduler.observe(
+            "https://api.github.com/search/repositories",
+            _response(headers={
+                "X-RateLimit-Remaining": "0",
+                "X-RateLimit-Reset": "5012",
+                "X-RateLimit-Limit": "30",
+                "X-RateLimit-Resource": "search",
+            }),
+        )
+
+        waited = scheduler.acquire("https://api.github.com/search/repositories")
+
+        assert waited == pytest.approx(12.0)
+        assert scheduler.buckets["core"].tokens == 5000
+
+    def test_graphql_uses_its_own_bucket_when_authenticated(self, clock):
+        scheduler = GitHubRateLimitScheduler(clock=clock, sleep=clock.sleep)
+        anonymous = GitHubRateLimitScheduler(authenticated=False, clock=clock, sleep=clock.sleep)
+
+        assert scheduler.bucket_for("https://api.github.com/graphql") == "graphql"
+        assert anonymous.bucket_for("https://api.github.com/graphql") == "core"
+
+    def test_anonymous_defaults_are_lower(self, clock):
+        scheduler = GitHubRateLimitScheduler(authenticated=False, clock=clock, sleep=clock.sleep)
+
+        assert scheduler.buckets["core"].limit == 60
+
+
+class TestRedditRateLimitScheduler:
+    """Tests del scheduler de Reddit."""
+
+    def test_reads_relative_reset_headers(self, clock):
+        scheduler = RedditRateLimitScheduler(oauth=True, clock=clock, sleep=clock.sleep)
+        scheduler.observe(
+            "https://oauth.reddit.com/r/webdev/hot.json",
+            _response(headers={
+                "X-Ratelimit-Remaining": "0.0",
+                "X-Ratelimit-Reset": "42",
+                "X-Ratelimit-Used": "600",
+            }),
+        )
+
+        assert scheduler.acquire("https://oauth.reddit.com/r/webdev/hot.json") == pytest.approx(42.0)
+        assert scheduler.buckets["api"].limit == 600
+
+
+class TestStackExchangeRateLimitScheduler:
+    """Tests del scheduler de StackExchange."""
+
+    def test_honors_backoff_and_tracks_quota(self, clock):
+        scheduler = StackExchangeRateLimitScheduler(clock=clock, sleep=clock.sleep)
+        scheduler.observe(
+            "https://api.stackexchange.com/2.3/search/advanced",
+            _response(payload={"total": 1, "backoff": 7, "quota_remaining": 9000}),
+        )
+
+        assert scheduler.quota_remaining == 9000
+        assert scheduler.acquire("https://api.stackexchange.com/2.3/search/advanced") == pytest.approx(7.0)
+
+    def test_backoff_only_blocks_the_same_method(self, clock):
+        scheduler = StackExchangeRateLimitScheduler(clock=clock, sleep=clock.sleep)
+        scheduler.observe(
+            "https://api.stackexchange.com/2.3/search/advanced?tagged=python",
+            _response(payload={"total": 1, "backoff": 5}),
+        )
+
+        assert scheduler.acquire("https://api.stackexchange.com/2.3/filters/create") == 0.0
+        assert scheduler.acquire("https://api.stackexchange.com/2.3/search/advanced?tagged=go") == pytest.approx(5.0)
+        assert scheduler.waited_seconds == pytest.approx(5.0)
+
+    def test_throttle_violation_blocks_every_method(self, clock):
+        scheduler = StackExchangeRateLimitScheduler(clock=clock, sleep=clock.sleep)
+        scheduler.observe(
+            "https://api.stackexchange.com/2.3/search/advanced",
+            _response(
+                status_code=400,
+                payload={
+                    "error_id": 502,
+                    "error_name": "throttle_violation",
+                    "error_message": "too many requests from this IP, more requests available in 12 seconds",
+                },
+            ),
+        )
+
+        assert scheduler.acquire("https://api.stackexchange.com/2.3/filters/create") == pytest.approx(12.0)
+
+    def test_tracks_quota_consumption(self, clock):
+        scheduler = StackExchangeRateLimitScheduler(clock=clock, sleep=clock.sleep)
+        url = "https://api.stackexchange.com/2.3/search/advanced"
+
+        assert scheduler.quota_used is None
+        scheduler.observe(url, _response(payload={"quota_remaining": 9999, "quota_max": 10000}))
+        scheduler.observe(url, _response(payload={"quota_remaining": 9997}))
+
+        assert scheduler.quota_max == 10000
+        assert scheduler.quota_used == 3
+
+    def test_ignores_non_json_bodies(self, clock):
+        scheduler = StackExchangeRateLimitScheduler(clock=clock, sleep=clock.sleep)
+        response = _response()
+        response.json.side_effect = ValueError("not json")
+
+        scheduler.observe("https://api.stackexchange.com/2.3/search/advanced", response)
+
+        assert scheduler.quota_remaining is None
@@ -6,13 +6,23 @@ Los tests cubren:
 - Detección de temas emergentes
 - Mocking de API
 """
+import io
+
 import pytest
 import pandas as pd
-from unittest.mock import patch  # noqa: F401
+import urllib3
+from unittest.mock import MagicMock, patch  # noqa: F401
 from reddit_etl import RedditETL
 from exceptions import ETLExtractionError
 
 
+@pytest.fixture(autouse=True)
+def _sentiment_cache_path(tmp_path):
+    """Aisla la cache de sentimiento persistente en un directorio temporal."""
+    with patch("reddit_etl.REDDIT_SENTIMENT_CACHE_PATH", tmp_path / "sentiment_cache.json"):
+        yield
+
+
 @pytest.fixture
 def etl():
     """Crea una instancia de RedditETL con logging configurado."""
@@ -48,9 +58,9 @@ def sample_posts_df():
 class TestDefinirPasos:
     """Tests para definir_pasos."""
 
-    def test_returns_five_steps(self, etl):
+    def test_returns_six_steps(self, etl):
         pasos = etl.definir_pasos()
-        assert len(pasos) == 5
+        assert len(pasos) == 6
 
     def test_step_names(self, etl):
         pasos = etl.definir_pasos()
@@ -59,6 +69,7 @@ class TestDefinirPasos:
         assert "Autenticacion OAuth" in nombres
         assert "Sentimiento de frameworks" in nombres
         assert "Temas emergentes" in nombres
+        assert nombres.index("Puntuacion de sentimiento") < nombres.index("Sentimiento de frameworks")
 
 
 class TestConfiguracionReddit:
@@ -92,7 +103,7 @@ class TestOAuthLogging:
         with (
             patch("reddit_etl.REDDIT_CLIENT_ID", "client-id"),
             patch("reddit_etl.REDDIT_CLIENT_SECRET", "client-secret"),
-            patch("reddit_etl.requests.post", return_value=FakeResponse()),
+            patch.object(etl.http, "post", return_value=FakeResponse()),
             caplog.at_level("WARNING", logger=etl.logger.name),
         ):
             etl._obtener_token_oauth()
@@ -122,15 +133,20 @@ class TestRssFallback:
 
         class FakeResponse:
             status_code = 200
-            text = atom_payload
             headers = {}
+            raw = io.BytesIO(atom_payload.encode("utf-8"))
+
+            def close(self):
+                pass
 
         with (
-            patch("reddit_etl.requests.get", return_value=FakeResponse()),
+            patch.object(etl.http, "get", return_value=FakeResponse()) as mocked,
             patch("reddit_etl.time.sleep"),
         ):
             posts = etl._extraer_posts_rss("webdev", 1)
 
+        assert mocked.call_args.kwargs["stream"] is True
+
         assert posts == [
             {
                 "post_id": "post123",
@@ -144,6 +160,259 @@ class TestRssFallback:
         ]
 
 
+class TestMultiSubreddit:
+    """Tests de la descarga concurrente de varios subreddits."""
+
+    @staticmethod
+    def _post(post_id, titulo="Python"):
+        return {
+            "post_id": post_id,
+            "titulo": titulo,
+            "contenido": "",
+            "upvotes": 1,
+            "comentarios": 0,
+            "created_at": pd.Timestamp("2026-01-01").to_pydatetime(),
+            "autor": "user",
+        }
+
+    def test_merges_in_configured_order_and_falls_back_to_rss(self, etl, monkeypatch):
+        import time
+
+        monkeypatch.setenv("REDDIT_SUBREDDIT_LIST", "webdev,python,golang")
+        json_posts = {
+            # r/webdev termina al final, pero debe fusionarse primero
+            "webdev": [self._post("w1"), self._post("shared")],
+            "python": [],
+            "golang": [self._post("shared", "Go"), self._post("g1")],
+        }
+
+        def fake_json(target, _limit):
+            if target == "webdev":
+                time.sleep(0.05)
+            return json_posts[target]
+
+        with (
+            patch("reddit_etl.REDDIT_MAX_CONCURRENCY", 3),
+            patch.object(etl, "_extraer_posts_json", side_effect=fake_json),
+            patch.object(etl, "_extraer_posts_rss", return_value=[self._post("p1")]) as rss,
+        ):
+            etl.extraer_posts(limit=10)
+
+        # 10 posts repartidos entre 3 subreddits de la misma tanda
+        rss.assert_called_once_with("python", 4)
+        assert etl.df_posts["post_id"].tolist() == ["w1", "shared", "p1", "g1"]
+        assert etl.df_posts.loc[etl.df_posts["post_id"] == "shared", "titulo"].item() == "Python"
+
+    def test_respects_global_limit(self, etl, monkeypatch):
+        monkeypatch.setenv("REDDIT_SUBREDDIT_LIST", "a,b")
+
+        def fake_json(target, _limit):
+            return [self._post(f"{target}{index}") for index in range(3)]
+
+        with patch.object(etl, "_extraer_posts_json", side_effect=fake_json):
+            etl.extraer_posts(limit=4)
+
+        assert etl.df_posts["post_id"].tolist() == ["a0", "a1", "a2", "b0"]
+
+    def test_splits_limit_across_targets_and_stops_at_limit(self, etl, monkeypatch):
+        """Con 8 subreddits y limit=500 se piden ~500 posts, no 8x500."""
+        monkeypatch.setenv("REDDIT_SUBREDDIT_LIST", ",".join(f"s{index}" for index in range(8)))
+        monkeypatch.delenv("REDDIT_PER_SUBREDDIT_LIMIT", raising=False)
+        requested = []
+
+        def fake_get(url, params=None):
+            target = url.split("/r/")[1].split("/")[0]
+            page = int(params.get("after") or 0)
+            requested.append(target)
+            response = MagicMock()
+            response.status_code = 200
+            response.json.return_value = {"data": {
+                "after": str(page + 1),
+                "children": [
+                    {"data": {
+                        "id": f"{target}-{page}-{index}",
+                        "title": "Python",
+                        "selftext": "",
+                        "is_self": True,
+                        "created_utc": 1767225600,
+                    }}
+                    for index in range(100)
+                ],
+            }}
+            return response
+
+        with (
+            patch("reddit_etl.REDDIT_MAX_CONCURRENCY", 4),
+            patch.object(etl.api_http, "get", side_effect=fake_get),
+            patch.object(etl, "_extraer_posts_rss") as rss,
+        ):
+            etl.extraer_posts(limit=500)
+
+        # Primera tanda: 4 subreddits x 125 posts (2 paginas cada uno); la segunda no corre
+        assert sorted(requested) == sorted(f"s{index}" for index in range(4) for _ in range(2))
+        assert len(etl.df_posts) == 500
+        rss.assert_not_called()
+
+
+class TestPostStore:
+    """Tests del modo incremental con post store."""
+
+    @staticmethod
+    def _listing(ids, after=None):
+        from datetime import datetime
+
+        class FakeResponse:
+            status_code = 200
+            headers = {}
+
+            def json(self):
+                return {
+                    "data": {
+                        "after": after,
+                        "children": [
+                            {
+                                "data": {
+                                    "id": post_id,
+                                    "is_self": True,
+                                    "title": f"Django {post_id}",
+                                    "selftext": "",
+                                    "score": 1,
+                                    "num_comments": 0,
+                                    "created_utc": datetime.now().timestamp() - 3600,
+                                    "author": "user",
+                                }
+                            }
+                            for post_id in ids
+                        ],
+                    }
+                }
+
+        return FakeResponse()
+
+    def test_stops_paging_at_known_posts_and_analyzes_window(self, tmp_path, monkeypatch):
+        from datetime import datetime, timedelta
+        from reddit_store import RedditPostStore
+
+        monkeypatch.delenv("REDDIT_SUBREDDIT_LIST", raising=False)
+        store_path = tmp_path / "posts.sqlite"
+        seeded = RedditPostStore(store_path)
+        seeded.add_posts(
+            [
+                {
+                    "post_id": "known",
+                    "titulo": "FastAPI",
+                    "contenido": "",
+                    "upvotes": 1,
+                    "comentarios": 0,
+                    "created_at": datetime.now() - timedelta(days=2),
+                    "autor": "user",
+                },
+                {
+                    "post_id": "expired",
+                    "titulo": "Laravel",
+                    "contenido": "",
+                    "upvotes": 1,
+                    "comentarios": 0,
+                    "created_at": datetime.now() - timedelta(days=90),
+                    "autor": "user",
+                },
+            ],
+            "webdev",
+        )
+        seeded.close()
+
+        with (
+            patch("reddit_etl.REDDIT_POST_STORE_ENABLED", True),
+            patch("reddit_etl.REDDIT_POST_STORE_PATH", store_path),
+        ):
+            etl = RedditETL()
+        etl.configurar_logging()
+
+        with patch.object(
+            etl.api_http, "get", side_effect=[self._listing(["n1", "n2", "known", "n3"], after="t3_x")]
+        ) as mocked:
+            etl.extraer_posts(subreddit_name="webdev", limit=100)
+
+        assert mocked.call_count == 1
+        assert mocked.call_args.args[0].endswith("/r/webdev/new.json")
+        assert sorted(etl.df_posts["post_id"]) == ["known", "n1", "n2"]
+
+
+class TestRssStreaming:
+    """Tests del parser RSS incremental."""
+
+    @staticmethod
+    def _feed(entries):
+        body = "".join(
+            f"<entry><id>t3_p{index}</id><title>Post {index}</title>"
+            f"<content type=\"html\">&lt;p&gt;body {index}&lt;/p&gt;</content></entry>"
+            for index in range(entries)
+        )
+        return f'<feed xmlns="http://www.w3.org/2005/Atom">{body}</feed>'.encode("utf-8")
+
+    class _Response:
+        status_code = 200
+        headers = {}
+
+        def __init__(self, payload):
+            self.raw = io.BytesIO(payload)
+            self.closed = False
+
+        def close(self):
+            self.closed = True
+
+    def test_stops_at_limit_and_closes_stream(self, etl):
+        response = self._Response(self._feed(50))
+
+        with patch.object(etl.http, "get", return_value=response) as mocked:
+            posts = etl._extraer_posts_rss("webdev", 3)
+
+        assert [post["post_id"] for post in posts] == ["p0", "p1", "p2"]
+        assert mocked.call_count == 1
+        assert response.closed is True
+
+    def test_keeps_entries_before_a_truncated_feed(self, etl):
+        truncated = self._feed(2)[:-20]
+        responses = [self._Response(truncated)] + [self._Response(b"<feed/>") for _ in range(13)]
+
+        with (
+            patch.object(etl.http, "get", side_effect=responses),
+            patch("reddit_etl.time.sleep"),
+        ):
+            posts = etl._extraer_posts_rss("webdev", 10)
+
+        assert [post["post_id"] for post in posts] == ["p0"]
+
+    def test_keeps_entries_when_connection_drops_mid_stream(self, etl):
+        """Un ProtocolError de urllib3 al leer el stream conserva lo ya parseado."""
+        payload = self._feed(3)
+        cut = payload.index(b"<entry><id>t3_p2")
+
+        class _DroppingRaw(io.BytesIO):
+            def read(self, *args):
+                if self.tell() >= cut:
+                    raise urllib3.exceptions.ProtocolError("Connection broken")
+                size = min(args[0] if args and args[0] else cut, cut - self.tell())
+                return super().read(size)
+
+        dropped = self._Response(b"")
+        dropped.raw = _DroppingRaw(payload)
+        responses = [dropped] + [self._Response(b"<feed/>") for _ in range(13)]
+
+        with (
+            patch.object(etl.http, "get", side_effect=responses),
+            patch("reddit_etl.time.sleep"),
+        ):
+            posts = etl._extraer_posts_rss("webdev", 10)
+
+        assert [post["post_id"] for post in posts] == ["p0", "p1"]
+        assert dropped.closed is True
+
+    def test_html_to_text_single_pass(self):
+        html_value = "<p>Hola<!-- <b>oculto</b> -->&amp; <i>mundo</i></p>\n\t &nbsp;fin"
+        assert RedditETL._html_to_text(html_value) == "Hola & mundo fin"
+
+
 class TestSentimientoFrameworks:
     """Tests para analizar_sentimiento_frameworks."""
 
@@ -199,6 +468,30 @@ class TestSentimientoFrameworks:
             etl.analizar_sentimiento_frameworks()
 
 
+class TestPuntuacionSentimiento:
+    """Tests de la etapa de puntuacion con cache."""
+
+    def test_scores_each_post_once_and_reuses_cache(self, etl, sample_posts_df, tmp_path):
+        import sentiment_scoring
+
+        etl.df_posts = sample_posts_df.copy()
+        with patch.object(
+            sentiment_scoring, "polarity", wraps=sentiment_scoring.polarity
+        ) as scored:
+            etl.puntuar_sentimiento()
+            with patch("base_etl.ARCHIVOS_SALIDA", {"reddit_sentimiento": tmp_path / "s.csv"}):
+                etl.analizar_sentimiento_frameworks()
+        assert scored.call_count == len(sample_posts_df)
+        assert {"compound", "pos", "neu", "neg"}.issubset(etl.df_posts.columns)
+
+        rerun = RedditETL()
+        rerun.df_posts = sample_posts_df.copy()
+        with patch.object(sentiment_scoring, "polarity") as rescored:
+            rerun.puntuar_sentimiento()
+        rescored.assert_not_called()
+        assert rerun.df_posts["compound"].tolist() == etl.df_posts["compound"].tolist()
+
+
 class TestTemasEmergentes:
     """Tests para detectar_temas_emergentes."""
 
@@ -232,6 +525,39 @@ class TestTemasEmergentes:
             etl.detectar_temas_emergentes()
 
 
+class TestInterseccion:
+    """Tests para interseccion_tecnologias."""
+
+    def test_interseccion_uno_a_uno(self, etl, tmp_path):
+        """Prefiere la coincidencia exacta y no reutiliza temas de Reddit."""
+        pd.DataFrame({"language": ["Python", "Python", "JavaScript", "Go", "Rust"]}).to_csv(
+            tmp_path / "repos.csv", index=False
+        )
+        pd.DataFrame({"framework": ["React", "Vue 3"], "ranking": [1, 2]}).to_csv(
+            tmp_path / "commits.csv", index=False
+        )
+        etl.df_temas = pd.DataFrame({
+            "tema": ["React Hooks", "Python", "JavaScript", "Golang"],
+            "menciones": [9, 8, 7, 6],
+        })
+        salidas = {
+            "github_repos": tmp_path / "repos.csv",
+            "github_commits": tmp_path / "commits.csv",
+            "interseccion": tmp_path / "interseccion.csv",
+        }
+
+        with patch("reddit_etl.ARCHIVOS_SALIDA", salidas), patch("base_etl.ARCHIVOS_SALIDA", salidas):
+            etl.interseccion_tecnologias()
+
+        df = pd.read_csv(tmp_path / "interseccion.csv").set_index("tecnologia")
+        assert df.loc["Python", "ranking_reddit"] == "2"
+        assert df.loc["JavaScript", "ranking_reddit"] == "3"
+        assert df.loc["Go", "ranking_reddit"] == "4"
+        assert df.loc["Rust", "ranking_reddit"] == "No encontrado"
+        assert df.loc["React", "ranking_reddit"] == "1"
+        assert df.loc["Vue 3", "ranking_reddit"] == "No encontrado"
+
+
 class TestKeywordPrecision:
     """Tests para precisión de matching de keywords en Reddit ETL."""
 
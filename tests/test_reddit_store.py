@@ -0,0 +1,57 @@
+"""
+Tests para reddit_store.py - almacen incremental de posts de Reddit.
+"""
+from datetime import datetime
+
+from reddit_store import POST_COLUMNS, RedditPostStore
+
+
+def _post(post_id, created_at, upvotes=1, titulo="Django tips"):
+    return {
+        "post_id": post_id,
+        "titulo": titulo,
+        "contenido": "texto",
+        "upvotes": upvotes,
+        "comentarios": 0,
+        "created_at": created_at,
+        "autor": "user",
+    }
+
+
+class TestRedditPostStore:
+    """Tests de insercion, deduplicacion y ventana temporal."""
+
+    def test_inserts_new_posts_and_reports_known_ids(self, tmp_path):
+        store = RedditPostStore(tmp_path / "posts.sqlite")
+
+        assert store.add_posts([_post("a", datetime(2026, 1, 1))], "webdev") == 1
+        assert store.contains("a") is True
+        assert store.contains("b") is False
+        assert store.contains(None) is False
+
+    def test_known_posts_keep_text_and_refresh_scores(self, tmp_path):
+        store = RedditPostStore(tmp_path / "posts.sqlite")
+        store.add_posts([_post("a", datetime(2026, 1, 1), upvotes=1)], "webdev")
+
+        inserted = store.add_posts(
+            [_post("a", datetime(2026, 1, 1), upvotes=50, titulo="editado")], "webdev"
+        )
+
+        df = store.posts_since(datetime(2025, 1, 1))
+        assert inserted == 0
+        assert df["upvotes"].tolist() == [50]
+        assert df["titulo"].tolist() == ["Django tips"]
+
+    def test_posts_since_filters_by_created_at(self, tmp_path):
+        path = tmp_path / "posts.sqlite"
+        store = RedditPostStore(path)
+        store.add_posts(
+            [_post("old", datetime(2025, 1, 1)), _post("new", datetime(2026, 3, 1, 10, 30))],
+            "webdev",
+        )
+        store.close()
+
+        df = RedditPostStore(path).posts_since(datetime(2026, 1, 1))
+        assert list(df.columns) == list(POST_COLUMNS)
+        assert df["post_id"].tolist() == ["new"]
+        assert df["created_at"].iloc[0] == datetime(2026, 3, 1, 10, 30)
@@ -0,0 +1,86 @@
+"""
+Tests para sentiment_scoring.py - puntuacion VADER con cache persistente.
+"""
+from sentiment_scoring import (
+    SCORE_COLUMNS,
+    SentimentCache,
+    get_analyzer,
+    lexicon_version,
+    polarity,
+    polarity_batch,
+    score_texts,
+    text_key,
+)
+
+
+class TestScoreTexts:
+    """Tests de puntuacion y deduplicacion."""
+
+    def test_analyzer_is_built_once(self):
+        assert get_analyzer() is get_analyzer()
+
+    def test_matches_vader_and_keeps_input_order(self):
+        texts = ["I love this framework", "This is terrible", "I love this framework"]
+        df = score_texts(texts)
+
+        assert list(df.columns) == list(SCORE_COLUMNS)
+        expected = get_analyzer().polarity_scores(texts[1])
+        assert df.iloc[1].to_dict() == {column: expected[column] for column in SCORE_COLUMNS}
+        assert df.iloc[0].tolist() == df.iloc[2].tolist()
+
+    def test_duplicates_and_cached_texts_are_not_rescored(self, tmp_path):
+        cache = SentimentCache(tmp_path / "cache.json")
+        score_texts(["good", "bad", "good"], cache)
+        assert (cache.hits, cache.misses) == (0, 2)
+
+        cache.save()
+        reloaded = SentimentCache(tmp_path / "cache.json")
+        score_texts(["good", "new"], reloaded)
+        assert (reloaded.hits, reloaded.misses) == (1, 1)
+
+
+class TestPolarityBatch:
+    """Tests del pool de procesos."""
+
+    TEXTS = [f"post {index} is {word}" for index, word in enumerate(
+        ["great", "awful", "fine", "amazing", "broken", "ok", "terrible"] * 3
+    )]
+
+    def test_process_pool_matches_serial_scores_and_order(self):
+        assert polarity_batch(self.TEXTS, workers=3) == polarity_batch(self.TEXTS, workers=1)
+
+    def test_score_texts_with_workers_is_identical(self, tmp_path):
+        serial = score_texts(self.TEXTS)
+        pooled = score_texts(self.TEXTS, SentimentCache(tmp_path / "cache.json"), workers=2)
+
+        assert pooled.equals(serial)
+
+    def test_empty_batch(self):
+        assert polarity_batch([], workers=4) == []
+
+
+class TestSentimentCache:
+    """Tests de invalidacion y poda."""
+
+    def test_lexicon_change_invalidates_cache(self, tmp_path):
+        path = tmp_path / "cache.json"
+        cache = SentimentCache(path, version="old")
+        cache.put(text_key("hola"), polarity("hola"))
+        cache.save()
+
+        assert SentimentCache(path, version="old").get(text_key("hola")) is not None
+        assert SentimentCache(path, version="new").get(text_key("hola")) is None
+
+    def test_save_prunes_to_kept_keys(self, tmp_path):
+        path = tmp_path / "cache.json"
+        cache = SentimentCache(path)
+        cache.put("a", (0.1, 0.2, 0.7, 0.1))
+        cache.put("b", (0.0, 0.0, 1.0, 0.0))
+        cache.save(keep_keys=["a"])
+
+        reloaded = SentimentCache(path)
+        assert reloaded.get("a") == (0.1, 0.2, 0.7, 0.1)
+        assert reloaded.get("b") is None
+
+    def test_version_includes_package_release(self):
+        assert lexicon_version().split(":")[0] != ""
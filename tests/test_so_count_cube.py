@@ -0,0 +1,56 @@
+"""
+Tests para so_count_cube.py - cubo persistente de conteos de StackOverflow.
+"""
+from so_count_cube import StackOverflowCountCube
+
+
+DAY = 86400
+
+
+class TestStackOverflowCountCube:
+    """Tests de buckets, cierre y persistencia."""
+
+    def test_missing_bucket_needs_refresh(self, tmp_path):
+        cube = StackOverflowCountCube(tmp_path / "cube.json", settle_seconds=7 * DAY)
+
+        assert cube.get("python", "2025-01", False) is None
+        assert cube.needs_refresh("python", "2025-01", False, window_end_ts=1_000) is True
+
+    def test_bucket_closes_after_settle_period(self, tmp_path):
+        cube = StackOverflowCountCube(tmp_path / "cube.json", settle_seconds=7 * DAY)
+        window_end = 1_000_000
+
+        cube.put("python", "2025-01", False, 120, fetched_at=window_end + DAY)
+        assert cube.needs_refresh("python", "2025-01", False, window_end) is True
+
+        cube.put("python", "2025-01", False, 118, fetched_at=window_end + 8 * DAY)
+        assert cube.needs_refresh("python", "2025-01", False, window_end) is False
+        assert cube.get("python", "2025-01", False) == 118
+
+    def test_accepted_flag_is_a_separate_bucket(self, tmp_path):
+        cube = StackOverflowCountCube(tmp_path / "cube.json", settle_seconds=0)
+        cube.put("reactjs", "2025-01", False, 100)
+        cube.put("reactjs", "2025-01", True, 40)
+
+        assert cube.get("reactjs", "2025-01", False) == 100
+        assert cube.get("reactjs", "2025-01", True) == 40
+
+    def test_save_load_and_prune(self, tmp_path):
+        path = tmp_path / "metadata" / "cube.json"
+        cube = StackOverflowCountCube(path, settle_seconds=0)
+        cube.put("go", "2024-12", False, 5)
+        cube.put("go", "2025-01", False, 7)
+        cube.put("go", "2025-01-15..2025-01-31", False, 3)
+        cube.prune(["2025-01", "2025-01-15..2025-01-31"])
+        cube.save()
+
+        reloaded = StackOverflowCountCube(path, settle_seconds=0)
+        assert reloaded.get("go", "2024-12", False) is None
+        assert reloaded.get("go", "2025-01", False) == 7
+        assert reloaded.get("go", "2025-01-15..2025-01-31", False) == 3
+
+    def test_corrupt_file_starts_empty(self, tmp_path):
+        path = tmp_path / "cube.json"
+        path.write_text("{not json", encoding="utf-8")
+
+        assert StackOverflowCountCube(path, settle_seconds=0).get("go", "2025-01") is None
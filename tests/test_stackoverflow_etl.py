@@ -17,6 +17,13 @@ from stackoverflow_etl import StackOverflowETL
 from config.settings import SO_TOP_LANGUAGES
 
 
+@pytest.fixture(autouse=True)
+def _count_cube_path(tmp_path):
+    """Aisla el cubo de conteos persistente en un directorio temporal."""
+    with patch("stackoverflow_etl.SO_COUNT_CUBE_PATH", tmp_path / "so_count_cube.json"):
+        yield
+
+
 @pytest.fixture
 def etl():
     """Crea una instancia de StackOverflowETL con logging configurado."""
@@ -28,18 +35,100 @@ def etl():
 class TestDefinirPasos:
     """Tests para definir_pasos."""
 
-    def test_returns_three_steps(self, etl):
+    def test_returns_five_steps(self, etl):
         pasos = etl.definir_pasos()
-        assert len(pasos) == 3
+        assert len(pasos) == 5
 
     def test_step_names(self, etl):
         pasos = etl.definir_pasos()
         nombres = [n for n, _ in pasos]
+        assert nombres[:2] == ["Verificar cuota", "Consultar conteos"]
         assert "Volumen de preguntas" in nombres
         assert "Tasa de aceptacion" in nombres
         assert "Tendencias mensuales" in nombres
 
 
+def _json_response(payload, status_code=200):
+    response = MagicMock()
+    response.status_code = status_code
+    response.headers = {}
+    response.text = json.dumps(payload)
+    response.json.return_value = payload
+    return response
+
+
+class TestVerificarCuota:
+    """Tests para la verificacion de cuota diaria."""
+
+    def test_creates_filter_and_passes_when_quota_covers_plan(self, etl):
+        filter_response = _json_response(
+            {"items": [{"filter": "!abc"}], "quota_remaining": 9000, "quota_max": 10000}
+        )
+
+        with patch.object(etl.http, "get", return_value=filter_response) as mocked:
+            etl.scheduler.observe("https://api.stackexchange.com/2.3/filters/create", filter_response)
+            etl.verificar_cuota()
+
+        params = mocked.call_args.kwargs["params"]
+        assert ".wrapper.quota_remaining" in params["include"]
+        assert params["base"] == "none"
+        assert etl._count_filter == "!abc"
+
+    def test_raises_critical_when_quota_is_insufficient(self, etl):
+        from exceptions import ETLExtractionError
+
+        etl.scheduler.observe(
+            "https://api.stackexchange.com/2.3/filters/create",
+            _json_response({"quota_remaining": 3}),
+        )
+        failed = _json_response({"error_id": 400}, status_code=400)
+
+        with patch.object(etl.http, "get", return_value=failed):
+            with pytest.raises(ETLExtractionError) as excinfo:
+                etl.verificar_cuota()
+
+        assert excinfo.value.critical is True
+        assert "insuficiente" in str(excinfo.value)
+        assert etl._count_filter is None
+
+    def test_planned_calls_use_range_totals_while_cube_is_cold(self, etl):
+        with patch("stackoverflow_etl.SO_TOP_LANGUAGES", ["python", "rust"]):
+            trend = [m for m in etl._trend_months() if not m["future"]]
+            # python, rust + javascript/typescript (legacy) en tendencias; 2 + 5x2 totales por rango
+            assert etl.count_cube.cold
+            assert etl._planned_calls() == 4 * len(trend) + 2 + 2 * 5
+
+    def test_planned_calls_count_distinct_open_buckets(self, etl):
+        etl.count_cube.cold = False
+        with patch("stackoverflow_etl.SO_TOP_LANGUAGES", ["python", "rust"]):
+            volume = {w["period"] for w in etl._volume_windows()}
+            trend = {m["period"] for m in etl._trend_months() if not m["future"]}
+            # python/rust comparten los meses de volumen y tendencia
+            expected = 2 * len(volume | trend) + 2 * len(trend) + 2 * 5 * len(volume)
+            assert etl._planned_calls() == expected
+
+            for tag, accepted, windows in etl._cube_plan():
+                for window in windows:
+                    etl.count_cube.put(tag, window["period"], accepted, 1)
+            # solo quedan abiertos los buckets que aun no se asentaron
+            open_periods = {
+                w["period"]
+                for w in etl._volume_windows()
+                if etl.count_cube.needs_refresh("python", w["period"], False, w["ts_end"])
+            }
+            assert 0 < len(open_periods) < len(volume)
+
+    def test_summary_reports_quota_usage(self, etl):
+        url = "https://api.stackexchange.com/2.3/search/advanced"
+        etl.scheduler.observe(url, _json_response({"quota_remaining": 500}))
+        etl.scheduler.observe(url, _json_response({"quota_remaining": 480}))
+
+        assert etl._summary_extra_fields() == [
+            ("so_quota_used", 21),
+            ("so_quota_remaining", 480),
+        ]
+
+
 class TestGetTotalCount:
     """Tests para el helper get_total_count."""
 
@@ -48,7 +137,7 @@ class TestGetTotalCount:
         mock_response.status_code = 200
         mock_response.json.return_value = {"total": 4200}
 
-        with patch("stackoverflow_etl.requests.get", return_value=mock_response):
+        with patch.object(etl.http, "get", return_value=mock_response):
             result = etl.get_total_count({"site": "stackoverflow", "tagged": "python"})
 
         assert result == 4200
@@ -58,10 +147,38 @@ class TestGetTotalCount:
         mock_response.status_code = 500
         mock_response.text = "Internal Server Error"
 
-        with patch("stackoverflow_etl.requests.get", return_value=mock_response):
+        with patch.object(etl.http, "get", return_value=mock_response):
             with pytest.raises(Exception):
                 etl.get_total_count({"site": "stackoverflow", "tagged": "python"})
 
+    def test_uses_quota_filter_when_created(self, etl):
+        etl._count_filter = "!abc"
+        with patch.object(etl.http, "get", return_value=_json_response({"total": 7})) as mocked:
+            assert etl.get_total_count({"site": "stackoverflow", "tagged": "go"}) == 7
+
+        assert mocked.call_args.kwargs["params"]["filter"] == "!abc"
+
+    def test_client_errors_fail_fast(self, etl):
+        from exceptions import ETLExtractionError
+
+        bad_request = _json_response({"error_id": 400, "error_name": "bad_parameter"}, status_code=400)
+        with patch.object(etl.http, "get", return_value=bad_request) as mocked:
+            with pytest.raises(ETLExtractionError):
+                etl.get_total_count({"site": "stackoverflow", "tagged": "go"})
+
+        assert mocked.call_count == 1
+
+    def test_throttle_is_retried_without_fixed_sleep(self, etl):
+        throttled = _json_response(
+            {"error_id": 502, "error_message": "more requests available in 1 seconds"},
+            status_code=400,
+        )
+        with patch.object(etl.http, "get", side_effect=[throttled, _json_response({"total": 3})]):
+            with patch("stackoverflow_etl.time.sleep") as sleep:
+                assert etl.get_total_count({"site": "stackoverflow", "tagged": "go"}) == 3
+
+        sleep.assert_not_called()
+
     def test_does_not_mutate_input_params(self, etl):
         """Verifica que get_total_count no muta los params del caller."""
         mock_response = MagicMock()
@@ -71,7 +188,7 @@ class TestGetTotalCount:
         params = {"site": "stackoverflow", "tagged": "python"}
         original = dict(params)
 
-        with patch("stackoverflow_etl.requests.get", return_value=mock_response):
+        with patch.object(etl.http, "get", return_value=mock_response):
             etl.get_total_count(params)
 
         assert params == original
@@ -92,8 +209,9 @@ class TestGetTotalCount:
 
         try:
             with patch("stackoverflow_etl.HTTP_MAX_RETRIES", 1):
-                with patch(
-                    "stackoverflow_etl.requests.get",
+                with patch.object(
+                    etl.http,
+                    "get",
                     side_effect=requests.exceptions.ConnectionError(
                         f"https://api.stackexchange.com?key={sentinel}"
                     ),
@@ -119,13 +237,11 @@ class TestTasaAceptacion:
 
     def test_correct_rate_calculation(self, etl, tmp_path):
         """Verifica que la tasa de aceptación se calcule correctamente."""
-        call_count = [0]
-        totals = [100, 75, 200, 150, 300, 200, 50, 30, 80, 40]
+        monthly = {"reactjs": (100, 75), "vue.js": (200, 150)}
 
-        def mock_get_total(*_args, **_kwargs):
-            idx = call_count[0]
-            call_count[0] += 1
-            return totals[idx] if idx < len(totals) else 0
+        def mock_get_total(params):
+            total, accepted = monthly.get(params["tagged"], (10, 5))
+            return accepted if params.get("accepted") else total
 
         with patch.object(etl, "get_total_count", side_effect=mock_get_total):
             with patch("base_etl.ARCHIVOS_SALIDA", {"so_aceptacion": tmp_path / "test.csv"}):
@@ -190,6 +306,112 @@ class TestVolumenPreguntas:
                 etl.extraer_volumen_preguntas()
 
 
+class TestCountCube:
+    """Tests del llenado incremental del cubo de conteos."""
+
+    def test_cold_cube_counts_each_total_with_one_range_query(self, etl, tmp_path):
+        """Sin cubo persistido cada serie sumada usa una sola consulta por rango de fechas."""
+        windows = etl._volume_windows()
+        with patch.object(etl, "get_total_count", return_value=10) as mocked:
+            with patch("base_etl.ARCHIVOS_SALIDA", {"so_volumen": tmp_path / "v.csv"}):
+                etl.extraer_volumen_preguntas()
+
+        assert mocked.call_count == len(etl._volume_languages())
+        params = mocked.call_args.args[0]
+        assert params["fromdate"] == windows[0]["ts_start"]
+        assert params["todate"] == windows[-1]["ts_end"]
+        df = pd.read_csv(tmp_path / "v.csv")
+        assert (df["preguntas_nuevas_2025"] == 10).all()
+
+    def test_second_run_only_queries_open_buckets(self, etl, tmp_path):
+        etl.count_cube.cold = False
+        with patch.object(etl, "get_total_count", return_value=10) as first_run:
+            with patch("base_etl.ARCHIVOS_SALIDA", {"so_volumen": tmp_path / "v.csv"}):
+                etl.extraer_volumen_preguntas()
+        windows = etl._volume_windows()
+        assert first_run.call_count == len(etl._volume_languages()) * len(windows)
+
+        rerun = StackOverflowETL()
+        with patch.object(rerun, "get_total_count", return_value=20) as second_run:
+            with patch("base_etl.ARCHIVOS_SALIDA", {"so_volumen": tmp_path / "v.csv"}):
+                rerun.extraer_volumen_preguntas()
+
+        open_windows = [
+            w for w in windows
+            if rerun.count_cube.needs_refresh("python", w["period"], False, w["ts_end"])
+        ]
+        assert second_run.call_count == len(etl._volume_languages()) * len(open_windows)
+        df = pd.read_csv(tmp_path / "v.csv")
+        assert df.iloc[0]["preguntas_nuevas_2025"] == 10 * len(windows) + 10 * len(open_windows)
+
+    def test_failed_refresh_keeps_stored_count(self, etl):
+        from exceptions import ETLExtractionError
+
+        window = etl._volume_windows()[-1]
+        etl.count_cube.put("python", window["period"], False, 42, fetched_at=0)
+
+        with patch.object(etl, "get_total_count", side_effect=ETLExtractionError("fail")):
+            counts = etl._resolve_counts("python", False, [window])
+
+        assert counts == [42]
+
+    def test_volume_starts_exactly_at_fecha_inicio(self, etl):
+        from config.settings import FECHA_INICIO_TIMESTAMP
+
+        windows = etl._volume_windows()
+        assert windows[0]["ts_start"] == FECHA_INICIO_TIMESTAMP
+        assert all(not window["future"] for window in windows)
+
+
+class TestConsultarConteos:
+    """Tests del planificador concurrente de consultas de conteo."""
+
+    def test_queries_each_distinct_bucket_once_and_steps_reuse_results(self, etl, tmp_path):
+        import threading
+
+        calls = []
+        lock = threading.Lock()
+
+        def mock_get_total(params):
+            with lock:
+                calls.append((params["tagged"], params["fromdate"], params.get("accepted", False)))
+            return 3
+
+        with patch("stackoverflow_etl.SO_TOP_LANGUAGES", ["python", "rust"]):
+            expected = etl._planned_calls()
+            with patch.object(etl, "get_total_count", side_effect=mock_get_total):
+                with patch("stackoverflow_etl.SO_MAX_CONCURRENCY", 4):
+                    etl.consultar_conteos()
+                assert len(calls) == expected
+                assert len(set(calls)) == len(calls)
+
+                outputs = {
+                    "so_volumen": tmp_path / "v.csv",
+                    "so_aceptacion": tmp_path / "a.csv",
+                    "so_tendencias": tmp_path / "t.csv",
+                }
+                with patch("base_etl.ARCHIVOS_SALIDA", outputs):
+                    with patch("stackoverflow_etl.SO_TRENDS_METADATA_PATH", tmp_path / "t.json"):
+                        etl.extraer_volumen_preguntas()
+                        etl.calcular_tasa_aceptacion()
+                        etl.generar_tendencias_mensuales()
+
+        assert len(calls) == expected
+        df = pd.read_csv(tmp_path / "a.csv")
+        assert (df["tasa_aceptacion_pct"] == 100.0).all()
+
+    def test_failed_buckets_are_not_retried_by_steps(self, etl, tmp_path):
+        from exceptions import ETLExtractionError
+
+        with patch.object(etl, "get_total_count", side_effect=ETLExtractionError("fail")) as mocked:
+            etl.consultar_conteos()
+            attempted = mocked.call_count
+            with pytest.raises(ETLExtractionError):
+                etl.calcular_tasa_aceptacion()
+
+        assert mocked.call_count == attempted
+
+
 class TestTendenciasMensuales:
     """Tests para generar_tendencias_mensuales."""
 
@@ -1,4 +1,14 @@
-from tech_normalization import normalize_technology_name, normalize_for_match
+import pandas as pd
+
+from tech_normalization import (
+	TechMatchIndex,
+	normalize_for_match,
+	normalize_series,
+	normalize_so_tag,
+	normalize_technology_name,
+	so_trend_display_name,
+	technology_slug,
+)
 
 
 def test_normalize_technology_name_known_values():
@@ -16,3 +26,60 @@ def test_normalize_for_match_aliases():
 	assert normalize_for_match("js ecosystem") == "javascript"
 	assert normalize_for_match("asp.net core") == "c#"
 	assert normalize_for_match("next.js") == "next.js"
+
+
+def test_tech_match_index_prefers_exact_over_contains():
+	index = TechMatchIndex(["SvelteKit", "Svelte", "Vue"])
+	assert index.claim("svelte") == 1
+	assert index.claim("svelte") == 0
+	assert index.claim("svelte") is None
+
+
+def test_tech_match_index_first_contains_in_order():
+	index = TechMatchIndex(["Cloud", "Go", "Golang tooling", "JS ecosystem"])
+	assert index.claim("golang") == 1
+	assert index.claim("Go") == 2
+	assert index.claim("javascript") == 3
+	assert index.claim("Python") is None
+
+
+def test_technology_slug_overrides_and_fallback():
+	assert technology_slug("c#") == "c-sharp"
+	assert technology_slug("IA/Machine Learning") == "ai-ml"
+	assert technology_slug("vue 3") == "vue-js"
+	assert technology_slug("") == ""
+
+
+def test_normalize_so_tag_aliases():
+	assert normalize_so_tag(" CSharp ") == "c#"
+	assert normalize_so_tag("cpp") == "c++"
+	assert normalize_so_tag("Python") == "python"
+
+
+def test_normalize_series_matches_per_value_normalizer():
+	values = pd.Series(["python", "reactjs", "", "python", "c#"], index=[10, 11, 12, 13, 14], name="tecnologia")
+
+	result = normalize_series(values)
+
+	assert result.tolist() == [normalize_technology_name(value) for value in values]
+	assert result.index.tolist() == [10, 11, 12, 13, 14]
+	assert result.name == "tecnologia"
+	assert normalize_series(values, technology_slug).tolist() == ["python", "react", "", "python", "c-sharp"]
+
+
+def test_so_trend_display_name_uses_shared_dimension():
+	assert so_trend_display_name("reactjs") == "ReactJS"
+	assert so_trend_display_name("nodejs") == "Node.js"
+	assert so_trend_display_name("csharp") == "C#"
+	assert so_trend_display_name("fastapi") == "FastAPI"
+	assert so_trend_display_name("Spring-Boot") == "Spring-Boot"
+	assert so_trend_display_name("dart") == "Dart"
+
+
+def test_so_trend_display_name_merges_renamed_series():
+	assert so_trend_display_name("ai/ml") == "AI/ML"
+	assert so_trend_display_name("IA/Machine Learning") == "AI/ML"
+	assert so_trend_display_name("Vue 3") == "Vue.js"
+	assert so_trend_display_name("devops") == "DevOps"
+	assert technology_slug(so_trend_display_name("IA/Machine Learning")) == "ai-ml"
+	assert technology_slug(so_trend_display_name("Vue 3")) == "vue-js"